@@ -0,0 +1,246 @@
+"""
+In-memory stand-in for the Supabase client.
+
+Implements the subset of the PostgREST query builder the pipeline uses
+(select with filters, ordering and paging; upsert, insert and update) and
+the database functions it calls over plain lists of dicts, and records every write so benchmarks can count rows
+and tests can inspect what was sent.
+"""
+
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Default conflict target per table when an upsert does not name one
+PRIMARY_KEYS = {"tickers": ("id",)}
+
+
+class FakeResponse:
+    """Response object with the ``data`` attribute callers read."""
+
+    def __init__(self, data: List[Dict[str, Any]]):
+        self.data = data
+
+
+class FakeQuery:
+    """Chainable query against one table of a ``FakeSupabase``."""
+
+    def __init__(self, db: "FakeSupabase", table: str):
+        self.db = db
+        self.table = table
+        self.action = "select"
+        self.columns: Optional[List[str]] = None
+        self.filters: List[Callable[[Dict[str, Any]], bool]] = []
+        self.order_by: List[Tuple[str, bool]] = []
+        self.row_limit: Optional[int] = None
+        self.row_range: Optional[Tuple[int, int]] = None
+        self.payload: Any = None
+        self.on_conflict: Optional[Tuple[str, ...]] = None
+
+    # Reads
+
+    def select(self, columns: str = "*") -> "FakeQuery":
+        if columns.strip() != "*":
+            self.columns = [c.strip() for c in columns.split(",")]
+        return self
+
+    def _filter(self, column: str, test: Callable[[Any], bool]) -> "FakeQuery":
+        self.filters.append(
+            lambda row: row.get(column) is not None and test(row.get(column))
+        )
+        return self
+
+    def eq(self, column: str, value: Any) -> "FakeQuery":
+        return self._filter(column, lambda v: v == value)
+
+    def neq(self, column: str, value: Any) -> "FakeQuery":
+        return self._filter(column, lambda v: v != value)
+
+    def gt(self, column: str, value: Any) -> "FakeQuery":
+        return self._filter(column, lambda v: v > value)
+
+    def gte(self, column: str, value: Any) -> "FakeQuery":
+        return self._filter(column, lambda v: v >= value)
+
+    def lt(self, column: str, value: Any) -> "FakeQuery":
+        return self._filter(column, lambda v: v < value)
+
+    def lte(self, column: str, value: Any) -> "FakeQuery":
+        return self._filter(column, lambda v: v <= value)
+
+    def in_(self, column: str, values: List[Any]) -> "FakeQuery":
+        allowed = set(values)
+        return self._filter(column, lambda v: v in allowed)
+
+    def order(self, column: str, desc: bool = False) -> "FakeQuery":
+        self.order_by.append((column, desc))
+        return self
+
+    def limit(self, count: int) -> "FakeQuery":
+        self.row_limit = count
+        return self
+
+    def range(self, start: int, end: int) -> "FakeQuery":
+        self.row_range = (start, end)
+        return self
+
+    # Writes
+
+    def upsert(self, rows, on_conflict=None, **kwargs) -> "FakeQuery":
+        self.action = "upsert"
+        self.payload = rows if isinstance(rows, list) else [rows]
+        if isinstance(on_conflict, str):
+            on_conflict = on_conflict.split(",")
+        self.on_conflict = tuple(c.strip() for c in on_conflict) if on_conflict else None
+        return self
+
+    def insert(self, rows, **kwargs) -> "FakeQuery":
+        self.action = "insert"
+        self.payload = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def update(self, values: Dict[str, Any]) -> "FakeQuery":
+        self.action = "update"
+        self.payload = values
+        return self
+
+    def execute(self) -> FakeResponse:
+        return self.db._execute(self)
+
+
+class FakeRpc:
+    """Pending call to one of the database functions a ``FakeSupabase`` has."""
+
+    def __init__(self, db: "FakeSupabase", name: str, params: Dict[str, Any]):
+        self.db = db
+        self.name = name
+        self.params = params
+
+    def execute(self) -> FakeResponse:
+        return self.db._call(self)
+
+
+class FakeSupabase:
+    """
+    Thread-safe in-memory database exposing ``table(name)``.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Initialize the fake.
+
+        Args:
+            latency: Seconds each request takes
+        """
+        self.latency = latency
+        self.tables: Dict[str, List[Dict[str, Any]]] = {}
+        self.indexes: Dict[Tuple[str, Tuple[str, ...]], Dict[Tuple, Dict]] = {}
+        self.lock = threading.Lock()
+
+        # (action, table, rows) for every write request, in order
+        self.writes: List[Tuple[str, str, int]] = []
+        self.request_count = 0
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rpc(self, name: str, params: Optional[Dict[str, Any]] = None) -> FakeRpc:
+        return FakeRpc(self, name, params or {})
+
+    def seed(self, table: str, rows: List[Dict[str, Any]]) -> None:
+        """Insert rows directly, without recording a write."""
+        with self.lock:
+            self.tables.setdefault(table, []).extend(dict(r) for r in rows)
+            self.indexes = {k: v for k, v in self.indexes.items() if k[0] != table}
+
+    def rows_written(self, table: Optional[str] = None) -> int:
+        """Rows sent in write requests, for one table or all of them."""
+        return sum(n for _, t, n in self.writes if table is None or t == table)
+
+    def _index(self, table: str, columns: Tuple[str, ...]) -> Dict[Tuple, Dict]:
+        """Rows of a table keyed by the given columns. Hold the lock."""
+        key = (table, columns)
+        if key not in self.indexes:
+            self.indexes[key] = {
+                tuple(row.get(c) for c in columns): row
+                for row in self.tables.get(table, [])
+            }
+        return self.indexes[key]
+
+    def _execute(self, query: FakeQuery) -> FakeResponse:
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self.lock:
+            self.request_count += 1
+            if query.action == "select":
+                return FakeResponse(self._select(query))
+
+            rows = self.tables.setdefault(query.table, [])
+            if query.action == "update":
+                matched = [r for r in rows if all(f(r) for f in query.filters)]
+                for row in matched:
+                    row.update(query.payload)
+                self.writes.append(("update", query.table, len(matched)))
+                return FakeResponse([dict(r) for r in matched])
+
+            conflict = query.on_conflict or PRIMARY_KEYS.get(query.table, ("id",))
+            index = self._index(query.table, conflict)
+            written = []
+            for payload in query.payload:
+                key = tuple(payload.get(c) for c in conflict)
+                existing = index.get(key) if query.action == "upsert" else None
+                if existing is not None:
+                    existing.update(payload)
+                    written.append(existing)
+                    continue
+
+                row = {"id": str(uuid.uuid4()), **payload}
+                rows.append(row)
+                index[key] = row
+                written.append(row)
+
+            # Other indexes on this table are rebuilt on next use
+            self.indexes = {
+                k: v
+                for k, v in self.indexes.items()
+                if k[0] != query.table or k[1] == conflict
+            }
+            self.writes.append((query.action, query.table, len(query.payload)))
+            return FakeResponse([dict(r) for r in written])
+
+    def _call(self, call: FakeRpc) -> FakeResponse:
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self.lock:
+            self.request_count += 1
+            if call.name != "last_update_dates":
+                raise Exception(f"Could not find the function public.{call.name}")
+
+            last_dates = dict.fromkeys(call.params["p_ticker_ids"])
+            for row in self.tables.get(call.params["p_table"], []):
+                ticker_id = row.get("ticker_id")
+                if ticker_id in last_dates and row.get("date"):
+                    last_dates[ticker_id] = max(last_dates[ticker_id] or "", row["date"])
+            return FakeResponse(
+                [{"ticker_id": t, "last_date": d} for t, d in last_dates.items()]
+            )
+
+    def _select(self, query: FakeQuery) -> List[Dict[str, Any]]:
+        rows = [
+            r for r in self.tables.get(query.table, []) if all(f(r) for f in query.filters)
+        ]
+        for column, desc in reversed(query.order_by):
+            rows.sort(key=lambda r: (r.get(column) is None, r.get(column)), reverse=desc)
+
+        if query.row_range:
+            start, end = query.row_range
+            rows = rows[start : end + 1]
+        if query.row_limit is not None:
+            rows = rows[: query.row_limit]
+
+        if query.columns:
+            return [{c: r.get(c) for c in query.columns} for r in rows]
+        return [dict(r) for r in rows]
@@ -0,0 +1,193 @@
+"""
+In-process stand-in for Yahoo Finance, replacing ``yfinance.Ticker`` and
+``yfinance.download`` in the data fetcher.
+
+Every request sleeps for a configurable latency and fails with a 429 at a
+configurable rate, so rate limiting and retries are exercised as they
+would be against the real service. Failures surface the way yfinance 0.2.37
+surfaces them: quoteSummary endpoints raise the HTTP error, while history
+returns an empty frame unless called with ``raise_errors=True``.
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
+from typing import Dict, Iterator, List, Optional
+
+import pandas as pd
+import requests
+from unittest.mock import patch
+
+from benchmarks.fixtures import TickerFixture, redate_history
+
+
+class FakeYahoo:
+    """
+    Serves fixture payloads for any number of symbols.
+    """
+
+    def __init__(
+        self,
+        fixtures: Dict[str, TickerFixture],
+        templates: Dict[str, str],
+        history_days: int = 60,
+        latency: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        """
+        Initialize the fake.
+
+        Args:
+            fixtures: Fixtures by template name ("AAPL", "SPY")
+            templates: Template name for each Yahoo symbol served
+            history_days: Trading days of history available per symbol
+            latency: Seconds each request takes
+            throttle_rate: Probability that a request gets a 429
+            seed: Random seed for throttling
+        """
+        self.fixtures = fixtures
+        self.templates = templates
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+        self.histories = {
+            name: redate_history(fixture.history, history_days)
+            for name, fixture in fixtures.items()
+        }
+        self.requests: Dict[str, int] = {}
+        self.throttled: Dict[str, int] = {}
+
+    def _request(self, endpoint: str) -> None:
+        """Simulate one round trip, raising a 429 at the configured rate."""
+        with self.lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+            throttled = self.random.random() < self.throttle_rate
+            if throttled:
+                self.throttled[endpoint] = self.throttled.get(endpoint, 0) + 1
+
+        if self.latency:
+            time.sleep(self.latency)
+        if throttled:
+            raise Exception("429 Client Error: Too Many Requests")
+
+    def _fixture(self, yahoo_symbol: str) -> TickerFixture:
+        return self.fixtures[self.templates.get(yahoo_symbol, "AAPL")]
+
+    def _history(self, yahoo_symbol: str, start, end) -> pd.DataFrame:
+        history = self.histories[self.templates.get(yahoo_symbol, "AAPL")]
+        dates = history.index.date
+        mask = (dates >= pd.Timestamp(start).date()) & (dates < pd.Timestamp(end).date())
+        return history[mask].copy()
+
+    def ticker(self, yahoo_symbol: str, session=None) -> "FakeTicker":
+        """Replacement for ``yfinance.Ticker``."""
+        return FakeTicker(self, yahoo_symbol)
+
+    def download(
+        self,
+        tickers: List[str],
+        start: date,
+        end: date,
+        group_by: str = "ticker",
+        **kwargs,
+    ) -> pd.DataFrame:
+        """Replacement for ``yfinance.download`` (one chart request per symbol)."""
+        frames = {}
+        for yahoo_symbol in tickers:
+            try:
+                self._request("history")
+            except Exception:
+                continue  # yfinance drops failed symbols from the frame
+            frames[yahoo_symbol] = self._history(yahoo_symbol, start, end)
+
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, axis=1)
+
+    @contextmanager
+    def patch(self) -> Iterator["FakeYahoo"]:
+        """Route the data fetcher's yfinance calls to this fake."""
+        with patch("src.services.data_fetcher.yf.Ticker", side_effect=self.ticker), patch(
+            "src.services.data_fetcher.yf.download", side_effect=self.download
+        ):
+            yield self
+
+
+class FakeFundsData:
+    """
+    Stand-in for ``Ticker.funds_data``: all fund payloads are loaded by one
+    request on first access, as yfinance does.
+    """
+
+    def __init__(self, yahoo: "FakeYahoo", yahoo_symbol: str):
+        self.yahoo = yahoo
+        self.yahoo_symbol = yahoo_symbol
+        self._data: Optional[Dict] = None
+
+    def _load(self) -> Dict:
+        if self._data is None:
+            self.yahoo._request("funds_data")
+            self._data = self.yahoo._fixture(self.yahoo_symbol).funds_data or {}
+        return self._data
+
+    @property
+    def top_holdings(self):
+        return self._load().get("top_holdings")
+
+    @property
+    def sector_weightings(self):
+        return self._load().get("sector_weightings")
+
+    @property
+    def asset_classes(self):
+        return self._load().get("asset_classes")
+
+
+class FakeTicker:
+    """Replacement for ``yfinance.Ticker`` bound to a fake Yahoo."""
+
+    def __init__(self, yahoo: FakeYahoo, yahoo_symbol: str):
+        self.yahoo = yahoo
+        self.yahoo_symbol = yahoo_symbol
+
+    def history(
+        self, start=None, end=None, raise_errors: bool = False, **kwargs
+    ) -> pd.DataFrame:
+        try:
+            self.yahoo._request("history")
+        except Exception:
+            if not raise_errors:
+                return pd.DataFrame()  # yfinance only logs the failure
+            # The chart scraper decodes the 429's plain-text body as JSON
+            raise requests.exceptions.JSONDecodeError(
+                "Expecting value", "Too Many Requests", 0
+            )
+
+        history = self.yahoo._history(self.yahoo_symbol, start, end)
+        if history.empty and raise_errors:
+            raise Exception(
+                f"{self.yahoo_symbol}: No price data found, symbol may be delisted "
+                f"(1d {start} -> {end})"
+            )
+        return history
+
+    @property
+    def info(self) -> Dict:
+        self.yahoo._request("info")
+        info = dict(self.yahoo._fixture(self.yahoo_symbol).info)
+        info["symbol"] = self.yahoo_symbol
+        return info
+
+    @property
+    def calendar(self) -> Optional[Dict]:
+        self.yahoo._request("calendar")
+        return self.yahoo._fixture(self.yahoo_symbol).calendar
+
+    @property
+    def funds_data(self) -> FakeFundsData:
+        return FakeFundsData(self.yahoo, self.yahoo_symbol)
@@ -0,0 +1,249 @@
+"""
+Ticker payload fixtures for offline benchmarks and tests.
+
+Replays the pickles written by ``fetch_yfinance_data.py`` (tests/
+aapl_yfinance_data.pkl and tests/spy_yfinance_data.pkl) when they exist,
+and otherwise builds synthetic payloads with the same shape, so the suite
+runs without network access or the (git-ignored) pickles.
+"""
+
+import os
+import pickle
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.core.market_calendar import MARKET_TZ, market_time, trading_days
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tests")
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume", "Dividends", "Stock Splits"]
+
+
+@dataclass
+class TickerFixture:
+    """Raw yfinance payloads for one ticker."""
+
+    symbol: str
+    history: pd.DataFrame
+    info: Dict[str, Any]
+    calendar: Optional[Dict[str, Any]] = None
+    funds_data: Optional[Dict[str, Any]] = None
+
+    @property
+    def quote_type(self) -> str:
+        return self.info.get("quoteType", "EQUITY")
+
+
+def load_fixture(symbol: str, directory: str = FIXTURE_DIR) -> TickerFixture:
+    """
+    Load the recorded payloads for AAPL or SPY, or synthesize them.
+
+    Args:
+        symbol: "AAPL" (equity) or "SPY" (ETF)
+        directory: Directory holding the ``<symbol>_yfinance_data.pkl`` files
+
+    Returns:
+        The ticker's fixture
+    """
+    path = os.path.join(directory, f"{symbol.lower()}_yfinance_data.pkl")
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            cached = pickle.load(f)
+        return TickerFixture(
+            symbol=symbol,
+            history=cached["history"],
+            info=cached["info"],
+            calendar=cached["calendar"],
+            funds_data=cached.get("funds_data"),
+        )
+
+    return synthetic_fixture(symbol)
+
+
+def synthetic_fixture(symbol: str, rows: int = 20, seed: int = 7) -> TickerFixture:
+    """
+    Build payloads shaped like the recorded ones.
+
+    Args:
+        symbol: "SPY" gives an ETF with fund data, anything else an equity
+        rows: Trading days of history
+        seed: Random seed for the price path
+
+    Returns:
+        Synthetic fixture dated on the last ``rows`` sessions before 2025-03-18
+    """
+    rng = np.random.default_rng(seed)
+    is_fund = symbol.upper() == "SPY"
+    base = 560.0 if is_fund else 215.0
+
+    days = trading_days(date(2025, 1, 2), date(2025, 3, 17))[-rows:]
+    close = base * np.cumprod(1 + rng.normal(0, 0.01, rows))
+    history = pd.DataFrame(
+        {
+            "Open": close * (1 + rng.normal(0, 0.003, rows)),
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(20_000_000, 80_000_000, rows).astype(float),
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        },
+        index=pd.DatetimeIndex(
+            [pd.Timestamp(d).tz_localize(MARKET_TZ) for d in days], name="Date"
+        ),
+    )
+    history.iloc[-5, history.columns.get_loc("Dividends")] = 1.74 if is_fund else 0.25
+
+    info = {
+        "symbol": symbol.upper(),
+        "shortName": f"{symbol.upper()} Synthetic",
+        "longName": "SPDR S&P 500 ETF Trust" if is_fund else "Apple Inc.",
+        "quoteType": "ETF" if is_fund else "EQUITY",
+        "longBusinessSummary": "Synthetic business summary. " * 80,
+        "regularMarketPrice": float(close[-1]),
+        "regularMarketOpen": float(history["Open"].iloc[-1]),
+        "regularMarketDayHigh": float(history["High"].iloc[-1]),
+        "regularMarketDayLow": float(history["Low"].iloc[-1]),
+        "regularMarketVolume": int(history["Volume"].iloc[-1]),
+        "regularMarketChangePercent": float(close[-1] / close[-2] - 1) * 100,
+        "fiftyTwoWeekLow": float(close.min() * 0.8),
+        "fiftyTwoWeekHigh": float(close.max() * 1.1),
+        "fiftyDayAverage": float(close.mean()),
+        "twoHundredDayAverage": float(close.mean() * 0.95),
+        "dividendYield": 1.2 if is_fund else 0.45,
+        "lastDividendValue": 1.74 if is_fund else 0.25,
+    }
+    if is_fund:
+        info.update(
+            {
+                "navPrice": float(close[-1]),
+                "totalAssets": 600_000_000_000,
+                "yield": 0.012,
+                "ytdReturn": 2.5,
+                "fundFamily": "SPDR State Street Global Advisors",
+                "legalType": "Exchange Traded Fund",
+                "netExpenseRatio": 0.0945,
+            }
+        )
+    else:
+        info.update(
+            {
+                "marketCap": 3_200_000_000_000,
+                "trailingPE": 33.5,
+                "sharesOutstanding": 15_000_000_000,
+            }
+        )
+
+    calendar = {
+        "Dividend Date": date(2025, 5, 15),
+        "Ex-Dividend Date": date(2025, 5, 12),
+        "Earnings Date": [date(2025, 5, 1)],
+        "Earnings Average": 1.62,
+        "Earnings Low": 1.5,
+        "Earnings High": 1.73,
+        "Revenue Average": 94_000_000_000,
+        "Revenue Low": 89_000_000_000,
+        "Revenue High": 96_000_000_000,
+    }
+
+    funds_data = None
+    if is_fund:
+        holdings = ["AAPL", "MSFT", "NVDA", "AMZN", "META", "GOOGL", "BRK-B", "AVGO", "TSLA", "GOOG"]
+        funds_data = {
+            "top_holdings": pd.DataFrame(
+                {
+                    "Name": [f"{s} Holding" for s in holdings],
+                    "% Assets": np.linspace(7.0, 1.5, len(holdings)),
+                },
+                index=pd.Index(holdings, name="Symbol"),
+            ),
+            "sector_weightings": {
+                "technology": 0.31,
+                "financial_services": 0.13,
+                "healthcare": 0.11,
+                "consumer_cyclical": 0.1,
+                "communication_services": 0.09,
+            },
+            "asset_classes": {"stockPosition": 0.998, "cashPosition": 0.002},
+        }
+
+    return TickerFixture(
+        symbol=symbol.upper(),
+        history=history,
+        info=info,
+        calendar=calendar,
+        funds_data=funds_data,
+    )
+
+
+def redate_history(
+    history: pd.DataFrame, days: int, end: Optional[date] = None
+) -> pd.DataFrame:
+    """
+    Lay a recorded history onto the ``days`` sessions ending at ``end``.
+
+    Rows are repeated as needed; each repetition continues from the previous
+    close so the series stays continuous.
+
+    Args:
+        history: Recorded history frame
+        days: Trading days to produce
+        end: Last session (default: today in market time)
+
+    Returns:
+        History frame indexed by tz-aware market dates
+    """
+    end = end or market_time().date()
+    sessions = trading_days(end - timedelta(days=days * 2 + 10), end)[-days:]
+
+    repeats = -(-len(sessions) // len(history))
+    frame = pd.concat([history] * repeats).iloc[: len(sessions)].copy()
+    first_close = float(history["Close"].iloc[0])
+    last_close = float(history["Close"].iloc[-1])
+    drift = np.repeat(
+        [(last_close / first_close) ** k for k in range(repeats)], len(history)
+    )[: len(sessions)]
+    for column in ["Open", "High", "Low", "Close"]:
+        if column in frame:
+            frame[column] = frame[column].to_numpy() * drift
+
+    frame.index = pd.DatetimeIndex(
+        [pd.Timestamp(d).tz_localize(MARKET_TZ) for d in sessions], name="Date"
+    )
+    return frame
+
+
+def synthesize_universe(
+    count: int, fund_ratio: float = 0.2, directory: str = FIXTURE_DIR
+) -> List[Dict[str, Any]]:
+    """
+    Ticker rows for a benchmark universe cloned from the AAPL/SPY fixtures.
+
+    Args:
+        count: Number of tickers
+        fund_ratio: Share of tickers modelled on SPY (ETFs)
+        directory: Fixture directory
+
+    Returns:
+        Rows for the ``tickers`` table, each with a ``template`` key naming
+        the fixture it is cloned from
+    """
+    fund_every = int(round(1 / fund_ratio)) if fund_ratio else 0
+    rows = []
+    for i in range(count):
+        template = "SPY" if fund_every and i % fund_every == fund_every - 1 else "AAPL"
+        rows.append(
+            {
+                "id": f"00000000-0000-0000-0000-{i:012d}",
+                "symbol": f"B{i:05d}",
+                "exchange": "NYSE" if template == "SPY" else "NASDAQ",
+                "backfill": False,
+                "quote_type": "ETF" if template == "SPY" else "EQUITY",
+                "template": template,
+            }
+        )
+    return rows
@@ -0,0 +1,226 @@
+"""
+Offline pipeline benchmark.
+
+Runs ``Pipeline.execute`` for each processing mode against the fake Yahoo
+and the in-memory Supabase, each mode in a fresh process so peak RSS is its
+own, and reports tickers/sec, rows/sec, peak RSS and per-stage time.
+
+Usage (from scripts/daily-market-update):
+
+    python -m benchmarks.run_benchmark --symbols 500 --latency-ms 20
+    python -m benchmarks.run_benchmark --modes batch,bulk --throttle-rate 0.02 --json
+"""
+
+import argparse
+import json
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List
+
+# Config overrides for each processing mode; add new modes here
+MODES: Dict[str, Dict[str, Any]] = {
+    "sequential": {"batch_mode": False, "batch_writes": False},
+    "batch": {"batch_mode": True, "batch_writes": True},
+    "batch_static": {
+        "batch_mode": True,
+        "batch_writes": True,
+        "adaptive_concurrency": False,
+    },
+    "bulk": {
+        "batch_mode": True,
+        "batch_writes": True,
+        "bulk_prices": True,
+        "process_info": False,
+        "process_calendar": False,
+        "process_fund_data": False,
+    },
+}
+
+
+def run_mode(mode: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run the pipeline once in one mode and measure it.
+
+    Args:
+        mode: Name of a mode in ``MODES``
+        options: Benchmark options (see ``parse_args``)
+
+    Returns:
+        Measurements for the run
+    """
+    # Imported here so each worker process pays its own import cost
+    import logging
+
+    from benchmarks.fake_supabase import FakeSupabase
+    from benchmarks.fake_yahoo import FakeYahoo
+    from benchmarks.fixtures import load_fixture, synthesize_universe
+    from src.core.pipeline import Pipeline
+    from src.core.rate_limiter import DEFAULT_LIMITS, RateLimiter, YahooEndpoint
+    from src.events.event_processor import PipelineConfig
+    from src.services.data_fetcher import DataFetcher
+    from src.services.price_coverage import CoverageStore
+    from src.services.rolling_state import RollingStateStore
+    from src.services.ticker_processor import TickerProcessor
+
+    if not options.get("verbose"):
+        logging.disable(logging.WARNING)
+
+    universe = synthesize_universe(options["symbols"], options["fund_ratio"])
+    supabase = FakeSupabase(latency=options["db_latency_ms"] / 1000)
+    supabase.seed("tickers", universe)
+
+    yahoo = FakeYahoo(
+        fixtures={name: load_fixture(name) for name in ("AAPL", "SPY")},
+        templates={t["symbol"]: t["template"] for t in universe},
+        history_days=options["history_days"],
+        latency=options["latency_ms"] / 1000,
+        throttle_rate=options["throttle_rate"],
+    )
+
+    if options["rate_limit"]:
+        limits = DEFAULT_LIMITS
+    else:
+        # No pacing and no post-429 pause: measures the pipeline, not the limiter
+        limits = {
+            e: {"rate": 1e6, "capacity": 1e6, "cooldown": 0.0} for e in YahooEndpoint
+        }
+    fetcher = DataFetcher(rate_limiter=RateLimiter(limits))
+    processor = TickerProcessor(
+        supabase,
+        data_fetcher=fetcher,
+        coverage_store=CoverageStore(tempfile.mkdtemp(prefix="bench-coverage-")),
+        rolling_states=RollingStateStore(tempfile.mkdtemp(prefix="bench-rolling-")),
+    )
+
+    config = PipelineConfig(
+        start_date=None,
+        use_cache=False,
+        max_workers=options["workers"],
+        batch_size=options["workers"] * 2,
+        **MODES[mode],
+    )
+    pipeline = Pipeline(config, supabase, ticker_processor=processor)
+
+    with yahoo.patch():
+        start = time.perf_counter()
+        result = pipeline.execute()
+        elapsed = time.perf_counter() - start
+
+    # ru_maxrss is in kilobytes on Linux
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    rows = supabase.rows_written()
+    return {
+        "mode": mode,
+        "tickers": result.ticker_count,
+        "successful": len(result.successful),
+        "failed": len(result.failed),
+        "seconds": round(elapsed, 3),
+        "tickers_per_sec": round(result.ticker_count / elapsed, 2) if elapsed else 0.0,
+        "rows_written": rows,
+        "rows_per_sec": round(rows / elapsed, 1) if elapsed else 0.0,
+        "write_requests": len(supabase.writes),
+        "yahoo_requests": dict(yahoo.requests),
+        "yahoo_throttled": dict(yahoo.throttled),
+        "peak_rss_mb": round(peak_rss_mb, 1),
+        "concurrency": result.concurrency,
+        "stages": result.stage_metrics.get("stages", {}),
+    }
+
+
+def run_benchmark(
+    modes: List[str],
+    options: Dict[str, Any],
+    runner: Callable[[str, Dict[str, Any]], Dict[str, Any]] = run_mode,
+    isolate: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Run every requested mode, each in its own process unless ``isolate`` is off.
+
+    Returns:
+        One measurement dict per mode
+    """
+    results = []
+    for mode in modes:
+        if not isolate:
+            results.append(runner(mode, options))
+            continue
+
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results.append(pool.submit(runner, mode, options).result())
+    return results
+
+
+def format_report(results: List[Dict[str, Any]]) -> str:
+    """Render results as a summary table plus the slowest stages per mode."""
+    lines = [
+        f"{'mode':<12}{'tickers':>8}{'failed':>8}{'seconds':>10}"
+        f"{'tickers/s':>11}{'rows/s':>10}{'peak MB':>9}",
+    ]
+    for r in results:
+        lines.append(
+            f"{r['mode']:<12}{r['tickers']:>8}{r['failed']:>8}{r['seconds']:>10.2f}"
+            f"{r['tickers_per_sec']:>11.1f}{r['rows_per_sec']:>10.0f}{r['peak_rss_mb']:>9.1f}"
+        )
+
+    for r in results:
+        lines.append("")
+        lines.append(f"{r['mode']} stages (total / p50 / p95 / max seconds):")
+        stages = sorted(r["stages"].items(), key=lambda s: -s[1]["total"])
+        for name, stage in stages[:12]:
+            lines.append(
+                f"  {name:<32}{stage['total']:>9.3f}{stage['p50']:>9.4f}"
+                f"{stage['p95']:>9.4f}{stage['max']:>9.4f}  x{stage['count']}"
+            )
+    return "\n".join(lines)
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--symbols", type=int, default=200, help="Tickers in the universe")
+    parser.add_argument(
+        "--modes", default=",".join(MODES), help=f"Comma-separated modes ({', '.join(MODES)})"
+    )
+    parser.add_argument("--history-days", type=int, default=30, help="Sessions of history per ticker")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Yahoo request latency")
+    parser.add_argument("--db-latency-ms", type=float, default=0.0, help="Supabase request latency")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Share of Yahoo requests answered with 429")
+    parser.add_argument("--fund-ratio", type=float, default=0.2, help="Share of tickers that are ETFs")
+    parser.add_argument("--workers", type=int, default=5, help="Worker threads in batch modes")
+    parser.add_argument("--rate-limit", action="store_true", help="Apply the production rate limits and 429 cooldown")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--verbose", action="store_true", help="Keep pipeline logging")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> None:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    unknown = [m for m in modes if m not in MODES]
+    if unknown:
+        raise SystemExit(f"Unknown modes: {unknown}. Available: {list(MODES)}")
+
+    options = {
+        key: getattr(args, key)
+        for key in (
+            "symbols",
+            "history_days",
+            "latency_ms",
+            "db_latency_ms",
+            "throttle_rate",
+            "fund_ratio",
+            "workers",
+            "rate_limit",
+            "verbose",
+        )
+    }
+    results = run_benchmark(modes, options)
+    print(json.dumps(results, indent=2) if args.json else format_report(results))
+
+
+if __name__ == "__main__":
+    main()
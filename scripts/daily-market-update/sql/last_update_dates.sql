@@ -0,0 +1,22 @@
+-- Latest stored date per ticker, for DataSaver.get_last_update_dates.
+--
+-- One call answers a whole page of tickers. Each lookup is a max() over the
+-- (ticker_id, date) index, and tickers without rows come back with a null
+-- date, so callers never need a per-ticker follow-up query.
+create or replace function public.last_update_dates(p_table text, p_ticker_ids uuid[])
+returns table (ticker_id uuid, last_date date)
+language plpgsql
+stable
+as $$
+begin
+  if p_table not in ('historical_prices', 'yh_finance_daily') then
+    raise exception 'last_update_dates: unsupported table %', p_table;
+  end if;
+
+  return query execute format(
+    'select t.id, (select max(p.date)::date from public.%I p where p.ticker_id = t.id)
+       from unnest($1) as t(id)',
+    p_table
+  ) using p_ticker_ids;
+end;
+$$;
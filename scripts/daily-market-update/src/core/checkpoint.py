@@ -0,0 +1,136 @@
+"""
+Checkpoints for pipeline runs that stop before the Lambda timeout.
+
+A checkpoint records how far a run got through the id-ordered ticker
+selection. The next invocation of the same job resumes selection after
+that ticker instead of starting over, so completed symbols are not fetched
+again.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field
+
+from src.core.logging_config import setup_logging
+from src.core.market_calendar import last_session_close
+
+logger = setup_logging(name="checkpoint")
+
+DEFAULT_CHECKPOINT_DIR = "/tmp/daily-market-update/checkpoints"
+
+
+class Checkpoint(BaseModel):
+    """Progress of an interrupted pipeline run."""
+
+    run_key: str
+    after_id: Optional[str] = None  # Last ticker id handed to processing
+    processed: int = 0  # Tickers processed across all invocations so far
+    created_at: str = Field(default_factory=lambda: datetime.now().isoformat())
+
+
+def make_run_key(payload: Dict[str, Any], now: Optional[datetime] = None) -> str:
+    """
+    Identify a job so only its own invocations resume from a checkpoint.
+
+    The key covers the parsed event payload and the current market session,
+    so a scheduled run never resumes a checkpoint left by the previous
+    session's run.
+
+    Args:
+        payload: Parsed event payload (type, tickers, dates and config)
+        now: Current time (default: now)
+
+    Returns:
+        Hex digest identifying the job
+    """
+    job = {"payload": payload, "session": last_session_close(now).date().isoformat()}
+    encoded = json.dumps(job, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class FileCheckpointStore:
+    """
+    Keeps checkpoints as JSON files in the Lambda's /tmp directory.
+
+    Files survive between invocations on a warm container only; a run that
+    lands on a new container starts from the beginning.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CHECKPOINT_DIR):
+        self.directory = directory
+
+    def _path(self, run_key: str) -> str:
+        return os.path.join(self.directory, f"{run_key}.json")
+
+    def load(self, run_key: str) -> Optional[Checkpoint]:
+        """Load the checkpoint for a job, if one exists."""
+        try:
+            with open(self._path(run_key)) as f:
+                return Checkpoint(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint {run_key}: {e}")
+            return None
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Write a checkpoint, replacing any previous one for the job."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(checkpoint.run_key)
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(checkpoint.model_dump(), f)
+        os.replace(f"{path}.tmp", path)
+
+    def clear(self, run_key: str) -> None:
+        """Remove a job's checkpoint once the job has finished."""
+        try:
+            os.remove(self._path(run_key))
+        except FileNotFoundError:
+            pass
+
+
+class TickerEventCheckpointStore:
+    """
+    Keeps a checkpoint in the ``details`` of the run's ``ticker_events`` row.
+
+    Used for invocations that carry an ``event_record_id``; the row stays
+    ``pending`` until the job finishes, so anything watching it keeps
+    waiting across invocations.
+    """
+
+    def __init__(self, supabase_client, event_record_id: str):
+        self.supabase = supabase_client
+        self.event_record_id = event_record_id
+
+    def _details(self) -> Dict[str, Any]:
+        response = (
+            self.supabase.table("ticker_events")
+            .select("details")
+            .eq("id", self.event_record_id)
+            .limit(1)
+            .execute()
+        )
+        return (response.data[0].get("details") if response.data else None) or {}
+
+    def load(self, run_key: str) -> Optional[Checkpoint]:
+        """Load the checkpoint for a job, if one exists."""
+        try:
+            checkpoint = self._details().get("checkpoint")
+            if checkpoint and checkpoint.get("run_key") == run_key:
+                return Checkpoint(**checkpoint)
+        except Exception as e:
+            logger.warning(f"Failed to load checkpoint for {self.event_record_id}: {e}")
+        return None
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Write a checkpoint to the event row, keeping its other details."""
+        details = {**self._details(), "checkpoint": checkpoint.model_dump()}
+        self.supabase.table("ticker_events").update(
+            {"status": "pending", "details": details}
+        ).eq("id", self.event_record_id).execute()
+
+    def clear(self, run_key: str) -> None:
+        """Nothing to do: the final status update replaces the details."""
@@ -0,0 +1,205 @@
+"""
+Adaptive limit on the number of tickers processed at once.
+
+Worker threads take a slot before each ticker. The data fetcher reports
+every Yahoo request to the controller: its latency (rate-limit wait plus
+round trip) and whether it was throttled or failed. After each window of
+requests the limit is adjusted with AIMD, like the rate limiter's buckets:
+
+- any throttle, or an error rate above the threshold, halves the limit
+- median latency well above the uncongested baseline takes one slot away,
+  since extra tickers are only queueing (usually on the rate limiter)
+- otherwise, if every slot was in use, one slot is added
+
+so concurrency settles near the highest level Yahoo sustains.
+"""
+
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.core.logging_config import setup_logging
+
+logger = setup_logging(name="concurrency")
+
+# Adjustments kept for the run metrics
+MAX_DECISIONS = 50
+
+
+class ConcurrencyController:
+    """
+    Thread-safe AIMD controller for the number of in-flight tickers.
+    """
+
+    def __init__(
+        self,
+        min_limit: int = 2,
+        max_limit: int = 20,
+        initial: Optional[int] = None,
+        window: int = 20,
+        latency_tolerance: float = 2.0,
+        error_threshold: float = 0.1,
+        decrease: float = 0.5,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            min_limit: Fewest tickers kept in flight
+            max_limit: Most tickers allowed in flight
+            initial: Starting limit (default: ``min_limit``)
+            window: Requests observed between adjustments
+            latency_tolerance: Median latency, as a multiple of the baseline,
+                above which the limit is reduced
+            error_threshold: Share of failed requests in a window above which
+                the limit is cut like on a throttle
+            decrease: Factor applied to the limit on throttles or errors
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(self.max_limit, max(self.min_limit, initial or min_limit))
+        self.window = window
+        self.latency_tolerance = latency_tolerance
+        self.error_threshold = error_threshold
+        self.decrease = decrease
+
+        self.condition = threading.Condition()
+        self.in_flight = 0
+        self.started = time.monotonic()
+
+        # Current window
+        self.latencies: List[float] = []
+        self.throttles = 0
+        self.errors = 0
+        self.saturated = False
+
+        # Median latency with little queueing; tracks upward only slowly
+        self.baseline: Optional[float] = None
+
+        self.peak_limit = self.limit
+        self.increases = 0
+        self.decreases = 0
+        self.decisions: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one in-flight slot for the duration of the block."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def acquire(self) -> None:
+        """Wait until fewer than ``limit`` tickers are in flight, then take a slot."""
+        with self.condition:
+            while self.in_flight >= self.limit:
+                self.saturated = True
+                self.condition.wait()
+            self.in_flight += 1
+            if self.in_flight >= self.limit:
+                self.saturated = True
+
+    def release(self) -> None:
+        """Give back a slot."""
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify()
+
+    def observe(
+        self, latency: float, throttled: bool = False, error: bool = False
+    ) -> None:
+        """
+        Record one request.
+
+        Args:
+            latency: Seconds from asking for a rate-limit token to the response
+            throttled: Whether Yahoo answered with "too many requests"
+            error: Whether the request failed otherwise
+        """
+        with self.condition:
+            self.latencies.append(latency)
+            self.throttles += throttled
+            self.errors += error
+            if len(self.latencies) >= self.window:
+                self._adjust()
+
+    def _adjust(self) -> None:
+        """Apply one AIMD step from the finished window. Hold the lock."""
+        median = statistics.median(self.latencies)
+        error_rate = self.errors / len(self.latencies)
+        if self.baseline is None or median < self.baseline:
+            self.baseline = median
+        else:
+            self.baseline += (median - self.baseline) * 0.05
+
+        previous = self.limit
+        if self.throttles or error_rate > self.error_threshold:
+            reason = "throttled" if self.throttles else "errors"
+            self.limit = max(self.min_limit, int(self.limit * self.decrease))
+        elif median > self.baseline * self.latency_tolerance:
+            reason = "latency"
+            self.limit = max(self.min_limit, self.limit - 1)
+        elif self.saturated:
+            reason = "headroom"
+            self.limit = min(self.max_limit, self.limit + 1)
+        else:
+            reason = None
+
+        if self.limit != previous:
+            self._record(previous, reason, median, error_rate)
+
+        self.latencies = []
+        self.throttles = 0
+        self.errors = 0
+        self.saturated = self.in_flight >= self.limit
+        self.condition.notify_all()
+
+    def _record(
+        self, previous: int, reason: str, median: float, error_rate: float
+    ) -> None:
+        """Keep an adjustment for the run metrics. Hold the lock."""
+        if self.limit > previous:
+            self.increases += 1
+        else:
+            self.decreases += 1
+            logger.info(
+                f"Concurrency {previous} -> {self.limit} ({reason}, "
+                f"median latency {median:.2f}s, error rate {error_rate:.0%})"
+            )
+        self.peak_limit = max(self.peak_limit, self.limit)
+
+        self.decisions.append(
+            {
+                "at": round(time.monotonic() - self.started, 2),
+                "limit": self.limit,
+                "reason": reason,
+                "median_latency": round(median, 4),
+                "error_rate": round(error_rate, 3),
+            }
+        )
+        del self.decisions[:-MAX_DECISIONS]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current state and the adjustments made so far.
+
+        Returns:
+            Dict with the final, peak and bounding limits, adjustment counts,
+            the latency baseline and the most recent decisions
+        """
+        with self.condition:
+            return {
+                "limit": self.limit,
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "peak_limit": self.peak_limit,
+                "increases": self.increases,
+                "decreases": self.decreases,
+                "baseline_latency": (
+                    round(self.baseline, 4) if self.baseline is not None else None
+                ),
+                "decisions": list(self.decisions),
+            }
@@ -1,14 +1,47 @@
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
+from pydantic import BaseModel
 
-# Load environment variables from .env file locally (optional for development)
-load_dotenv()
 
-# Configuration using environment variables
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+class Settings(BaseModel):
+    """Settings read from the environment."""
 
-if not SUPABASE_URL or not SUPABASE_KEY:
-    raise ValueError(
-        "SUPABASE_URL and SUPABASE_KEY must be set in environment variables"
-    )
+    supabase_url: str
+    supabase_key: str
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Read settings from the environment on first use.
+
+    A local .env file is only loaded (optional for development) when the
+    variables are not already set, as they are on Lambda.
+
+    Returns:
+        Settings for this process
+    """
+    if not os.getenv("SUPABASE_URL") or not os.getenv("SUPABASE_KEY"):
+        from dotenv import load_dotenv
+
+        load_dotenv()
+
+    # Configuration using environment variables
+    supabase_url = os.getenv("SUPABASE_URL")
+    supabase_key = os.getenv("SUPABASE_KEY")
+
+    if not supabase_url or not supabase_key:
+        raise ValueError(
+            "SUPABASE_URL and SUPABASE_KEY must be set in environment variables"
+        )
+
+    return Settings(supabase_url=supabase_url, supabase_key=supabase_key)
+
+
+def __getattr__(name: str) -> str:
+    """Keep ``from src.core.config import SUPABASE_URL`` working, lazily."""
+    if name == "SUPABASE_URL":
+        return get_settings().supabase_url
+    if name == "SUPABASE_KEY":
+        return get_settings().supabase_key
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
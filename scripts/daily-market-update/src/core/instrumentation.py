@@ -0,0 +1,143 @@
+"""
+Lightweight per-stage timing and counters.
+
+Code under measurement opens a span around a stage (``with
+instrumentation.span("fetch.history"):``) or decorates a function with
+``timed``, and bumps counters for rows and bytes. The pipeline resets the
+process-wide instance at the start of a run and reports p50/p95/max per
+stage plus the counters in the Lambda response and the logs.
+"""
+
+import functools
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+class Instrumentation:
+    """
+    Thread-safe collection of stage durations and counters.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+        self.counters: Dict[str, float] = defaultdict(float)
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """
+        Time a block of code as one occurrence of a stage.
+
+        Args:
+            stage: Dotted stage name, e.g. ``save.historical_prices``
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def timed(self, stage: str) -> Callable:
+        """Decorator form of ``span``."""
+
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(stage):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record a duration measured elsewhere (e.g. a rate-limit sleep)."""
+        with self.lock:
+            self.durations[stage].append(seconds)
+
+    def incr(self, counter: str, amount: float = 1) -> None:
+        """Add to a counter, e.g. ``rows.historical_prices``."""
+        with self.lock:
+            self.counters[counter] += amount
+
+    def reset(self) -> None:
+        """Drop everything recorded so far."""
+        with self.lock:
+            self.durations.clear()
+            self.counters.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Aggregate what has been recorded.
+
+        Returns:
+            Dict with ``stages`` (count, total, p50, p95 and max seconds per
+            stage) and ``counters``
+        """
+        with self.lock:
+            durations = {stage: sorted(d) for stage, d in self.durations.items() if d}
+            counters = dict(self.counters)
+
+        stages = {
+            stage: {
+                "count": len(ordered),
+                "total": round(sum(ordered), 4),
+                "p50": round(_percentile(ordered, 0.5), 4),
+                "p95": round(_percentile(ordered, 0.95), 4),
+                "max": round(ordered[-1], 4),
+            }
+            for stage, ordered in sorted(durations.items())
+        }
+        return {
+            "stages": stages,
+            "counters": {
+                name: int(value) if float(value).is_integer() else round(value, 4)
+                for name, value in sorted(counters.items())
+            },
+        }
+
+
+_instrumentation: Optional[Instrumentation] = None
+_instrumentation_lock = threading.Lock()
+
+
+def get_instrumentation() -> Instrumentation:
+    """Return the process-wide instrumentation, creating it on first use."""
+    global _instrumentation
+    with _instrumentation_lock:
+        if _instrumentation is None:
+            _instrumentation = Instrumentation()
+        return _instrumentation
+
+
+def span(stage: str):
+    """Time a block of code on the process-wide instrumentation."""
+    return get_instrumentation().span(stage)
+
+
+def timed(stage: str) -> Callable:
+    """Decorator timing a function on the process-wide instrumentation."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_instrumentation().span(stage):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def incr(counter: str, amount: float = 1) -> None:
+    """Add to a counter on the process-wide instrumentation."""
+    get_instrumentation().incr(counter, amount)
@@ -0,0 +1,201 @@
+"""
+NYSE trading calendar helpers.
+
+Used to decide whether market data can have changed since a ticker was last
+updated: outside trading sessions (nights, weekends, exchange holidays)
+Yahoo Finance has nothing new to return for regular-hours instruments.
+Early-close days are treated as full sessions, which only errs on the side
+of refetching.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import List, Optional, Set
+from zoneinfo import ZoneInfo
+
+MARKET_TZ = ZoneInfo("America/New_York")
+MARKET_OPEN = time(9, 30)
+MARKET_CLOSE = time(16, 0)
+
+# Time after the close for Yahoo Finance's end-of-day data to settle
+SETTLE_DELAY = timedelta(minutes=30)
+
+# Quote types that trade around the clock and are never considered closed
+ALWAYS_OPEN_QUOTE_TYPES = ["CURRENCY", "CRYPTOCURRENCY"]
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """The n-th given weekday of a month (n=-1 for the last one)."""
+    if n > 0:
+        first = date(year, month, 1)
+        offset = (weekday - first.weekday()) % 7
+        return first + timedelta(days=offset + 7 * (n - 1))
+
+    next_month = date(year + month // 12, month % 12 + 1, 1)
+    last = next_month - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Western Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    j = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * j) // 451
+    month, day = divmod(h + j - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day: date) -> date:
+    """Move a fixed-date holiday off the weekend."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=16)
+def nyse_holidays(year: int) -> Set[date]:
+    """
+    Full-day NYSE holidays for a year.
+
+    Args:
+        year: Calendar year
+
+    Returns:
+        Set of dates the exchange is closed (excluding weekends)
+    """
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observed(date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observed(date(year, 12, 25)),  # Christmas
+    }
+
+    # New Year's Day is not moved back to a Friday in the previous year
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+
+    return holidays
+
+
+def is_trading_day(day: date) -> bool:
+    """Whether the NYSE has a session on the given day."""
+    return day.weekday() < 5 and day not in nyse_holidays(day.year)
+
+
+def last_trading_day(day: date) -> date:
+    """The latest trading day on or before the given day."""
+    while not is_trading_day(day):
+        day -= timedelta(days=1)
+    return day
+
+
+def trading_days(start: date, end: date) -> List[date]:
+    """Trading days from start to end, both inclusive."""
+    days = []
+    day = start
+    while day <= end:
+        if is_trading_day(day):
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+def closed_reason(day: date) -> Optional[str]:
+    """Why the market is closed on a day ("weekend" or "holiday"), or None."""
+    if day.weekday() >= 5:
+        return "weekend"
+    if day in nyse_holidays(day.year):
+        return "holiday"
+    return None
+
+
+def market_time(now: Optional[datetime] = None) -> datetime:
+    """Convert a point in time (default: now, naive taken as UTC) to market time."""
+    now = now or datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    return now.astimezone(MARKET_TZ)
+
+
+def is_market_open(now: Optional[datetime] = None) -> bool:
+    """
+    Whether a regular NYSE session is in progress.
+
+    Args:
+        now: Point in time to check (naive values are taken as UTC)
+    """
+    local = market_time(now)
+    return (
+        is_trading_day(local.date()) and MARKET_OPEN <= local.time() < MARKET_CLOSE
+    )
+
+
+def last_session_close(now: Optional[datetime] = None) -> datetime:
+    """
+    The close of the most recent session that has finished.
+
+    Args:
+        now: Point in time to check (naive values are taken as UTC)
+
+    Returns:
+        Timezone-aware close time in market time
+    """
+    local = market_time(now)
+    day = local.date()
+    if not is_trading_day(day) or local.time() < MARKET_CLOSE:
+        day -= timedelta(days=1)
+    day = last_trading_day(day)
+    return datetime.combine(day, MARKET_CLOSE, tzinfo=MARKET_TZ)
+
+
+def next_session_close(now: Optional[datetime] = None) -> datetime:
+    """
+    The close of the current session, or of the next one if none is open.
+
+    Args:
+        now: Point in time to check (naive values are taken as UTC)
+
+    Returns:
+        Timezone-aware close time in market time
+    """
+    local = market_time(now)
+    day = local.date()
+    if is_trading_day(day) and local.time() < MARKET_CLOSE:
+        return datetime.combine(day, MARKET_CLOSE, tzinfo=MARKET_TZ)
+
+    day += timedelta(days=1)
+    while not is_trading_day(day):
+        day += timedelta(days=1)
+    return datetime.combine(day, MARKET_CLOSE, tzinfo=MARKET_TZ)
+
+
+def next_settle_time(now: Optional[datetime] = None) -> datetime:
+    """
+    When the end-of-day data of the current or next session settles.
+
+    That is ``SETTLE_DELAY`` after the session's close. Between a close and
+    its settle time, that session's settle time is still ahead.
+
+    Args:
+        now: Point in time to check (naive values are taken as UTC)
+
+    Returns:
+        Timezone-aware settle time in market time
+    """
+    return next_session_close(market_time(now) - SETTLE_DELAY) + SETTLE_DELAY
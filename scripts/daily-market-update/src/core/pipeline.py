@@ -2,15 +2,24 @@
 Pipeline for orchestrating the market data update process.
 """
 
+import queue
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Any
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set
 from pydantic import BaseModel
 
+from src.core.concurrency import ConcurrencyController
+from src.core.instrumentation import get_instrumentation, span
 from src.core.logging_config import setup_logging
 from src.events.event_processor import PipelineConfig
-from src.services.ticker_selector import TickerSelector
+from src.models.price_block import PriceBlock
+from src.models.source_models import YFPriceHistory, YFTickerData, YFTickerInfo
+from src.services.ticker_selector import TickerPageError, TickerSelector
 from src.services.ticker_processor import TickerProcessor
+from src.services.batch_writer import BatchedPriceWriter
+from src.services.data_fetcher import FetchPlan
 
 logger = setup_logging(name="pipeline")
 
@@ -20,33 +29,98 @@ class ProcessingResult(BaseModel):
 
     ticker_count: int = 0
     successful: List[str] = []
+    skipped: Dict[str, str] = {}
     failed: Dict[str, str] = {}
     updated_tables: Dict[str, List[str]] = {}
     processing_time: Dict[str, float] = {}
 
+    # Price history requested and received, summed over processed tickers
+    price_coverage: Dict[str, int] = {}
+
+    # Changed-column writes and skipped unchanged rows per table during this run
+    write_stats: Dict[str, Dict[str, int]] = {}
+
+    # Per-stage timing percentiles and row/byte/request counters for this run
+    stage_metrics: Dict[str, Any] = {}
+
+    # Response cache hits and misses per endpoint during this run
+    cache_stats: Dict[str, Dict[str, int]] = {}
+
+    # Adaptive concurrency limits and adjustments (batch mode)
+    concurrency: Dict[str, Any] = {}
+
+    # Set when the run stopped at its deadline, or on a failed selection
+    # page, with tickers left to select
+    stopped_early: bool = False
+    resume_after_id: Optional[str] = None
+
 
 class Pipeline:
     """
     Orchestrates the market data update process.
     """
 
-    def __init__(self, config: PipelineConfig, supabase_client):
+    def __init__(
+        self,
+        config: PipelineConfig,
+        supabase_client,
+        deadline: Optional[float] = None,
+        resume_after_id: Optional[str] = None,
+        ticker_selector: Optional[TickerSelector] = None,
+        ticker_processor: Optional[TickerProcessor] = None,
+    ):
         """
         Initialize the pipeline.
 
         Args:
             config: Pipeline configuration
             supabase_client: Supabase client for database operations
+            deadline: ``time.monotonic()`` value by which the run must finish
+            resume_after_id: Ticker id a previous run stopped after
+            ticker_selector: Shared selector to reuse (default: a new one)
+            ticker_processor: Shared processor to reuse (default: a new one)
         """
         self.config = config
         self.supabase = supabase_client
+        self.deadline = deadline
+        self.resume_after_id = resume_after_id
 
-        # Initialize components
-        self.ticker_selector = TickerSelector(supabase_client)
-        self.ticker_processor = TickerProcessor(supabase_client)
+        # Last ticker id handed to processing and the slowest ticker so far,
+        # used to stop before the deadline
+        self.cursor = resume_after_id
+        self.slowest_ticker = 0.0
+        self.backlog_per_worker = 0.0
+
+        # Limits the tickers in flight when batch mode adapts its concurrency
+        self.concurrency: Optional[ConcurrencyController] = None
+
+        # Initialize components; these hold no per-run state, so warm
+        # invocations can pass in shared instances
+        self.ticker_selector = ticker_selector or TickerSelector(supabase_client)
+        self.ticker_processor = ticker_processor or TickerProcessor(supabase_client)
 
         # Initialize result tracking
         self.result = ProcessingResult()
+        self.result_lock = threading.Lock()
+
+        # Data fetched ahead of per-ticker processing, keyed by symbol;
+        # entries are removed as tickers are processed
+        self.prefetched: Dict[str, YFTickerData] = {}
+
+        # Ticker ids of processed tickers, keyed by symbol
+        self.ticker_ids: Dict[str, str] = {}
+
+        # Symbols whose yh_finance_daily row came from a live quote this run
+        self.live_quotes: Set[str] = set()
+
+        # Cross-ticker writer for historical_prices (None = per-ticker upserts)
+        self.price_writer = None
+        if config.batch_writes:
+            self.price_writer = BatchedPriceWriter(
+                supabase_client,
+                max_rows=config.write_batch_rows,
+                max_bytes=config.write_batch_bytes,
+            )
 
     def execute(self) -> ProcessingResult:
         """
@@ -58,34 +132,341 @@ class Pipeline:
         start_time = time.time()
         logger.info("Starting pipeline execution", extra={"config": self.config})
 
-        # 1. Select tickers to process
-        tickers = self.ticker_selector.select_tickers(self.config)
-        self.result.ticker_count = len(tickers)
+        instrumentation = get_instrumentation()
+        instrumentation.reset()
+
+        # The cache may be shared with earlier invocations; report this run's
+        # counts only
+        cache = self.ticker_processor.data_fetcher.cache
+        cache_stats_before = cache.stats() if cache else {}
+        write_stats_before = self.ticker_processor.change_tracker.stats()
 
-        if not tickers:
-            logger.warning("No tickers selected for processing")
-            return self.result
+        # Compare writes against rows read back this run, not earlier runs
+        self.ticker_processor.change_tracker.reset()
 
-        # 2. Process tickers
-        if self.config.batch_mode and len(tickers) > 1:
+        # 1. Select, prefetch and process tickers page by page; processing
+        # starts on the first page while later pages are still being selected
+        tickers = self._iter_tickers()
+        if self.config.batch_mode:
             self._process_in_parallel(tickers)
         else:
             self._process_sequentially(tickers)
 
-        # 3. Record total processing time
+        if not self.result.ticker_count:
+            if self.result.skipped:
+                logger.info("All selected tickers are already up to date")
+            else:
+                logger.warning("No tickers selected for processing")
+
+        # 2. Flush batched price writes and settle per-ticker outcomes, and
+        # mark rows skipped as unchanged as up to date
+        if self.price_writer:
+            with span("pipeline.flush_writes"):
+                outcomes = self.price_writer.flush()
+            self._apply_write_outcomes(outcomes)
+        with span("pipeline.touch_unchanged"):
+            self.ticker_processor.data_saver.touch_unchanged()
+
+        # 3. Compute price statistics from the stored prices
+        if self.config.process_prices and self.config.analytics:
+            with span("pipeline.analytics"):
+                self._update_analytics()
+
+        # 4. Record cache usage, skipped writes and total processing time
+        if cache:
+            self.result.cache_stats = self._diff_counts(
+                cache_stats_before, cache.stats()
+            )
+        self.result.write_stats = self._diff_counts(
+            write_stats_before, self.ticker_processor.change_tracker.stats()
+        )
+
         total_time = time.time() - start_time
         self.result.processing_time["total"] = total_time
+        self.result.stage_metrics = instrumentation.snapshot()
 
         logger.info(
             f"Pipeline execution completed in {total_time:.2f}s. "
             f"Processed {self.result.ticker_count} tickers: "
             f"{len(self.result.successful)} successful, "
-            f"{len(self.result.failed)} failed."
+            f"{len(self.result.failed)} failed, "
+            f"{len(self.result.skipped)} skipped as fresh."
         )
+        logger.info(
+            "Pipeline stage metrics", extra={"stage_metrics": self.result.stage_metrics}
+        )
+        if self.result.stopped_early:
+            logger.info(
+                f"Run stopped early; resume after ticker "
+                f"{self.result.resume_after_id}"
+            )
 
         return self.result
 
-    def _process_sequentially(self, tickers: List[Dict[str, Any]]) -> None:
+    def _iter_tickers(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the tickers to process, preparing one selection page at a time.
+
+        For each page, tickers that are already up to date are skipped,
+        stored price dates are attached and the page's data is prefetched.
+        """
+        for page in self._select_pages():
+            if self._deadline_reached():
+                return
+
+            if self.config.skip_fresh:
+                with span("pipeline.skip_fresh"):
+                    page, skipped = self.ticker_selector.skip_fresh_tickers(
+                        page, self.config
+                    )
+                self.result.skipped.update(skipped)
+            if not page:
+                continue
+
+            # Last stored price date and persisted info rows per ticker, in bulk
+            with span("pipeline.prepare_page"):
+                self.ticker_processor.attach_price_watermarks(page, self.config)
+                self.ticker_processor.prime_change_tracker(page, self.config)
+
+            # Prefetch data: bulk price downloads for prices-only runs, or
+            # every endpoint concurrently with the async engine
+            with span("pipeline.prefetch"):
+                if self._use_bulk_prices():
+                    self.prefetched.update(self._prefetch_price_histories(page))
+                elif self.config.async_fetch:
+                    self.prefetched.update(self._prefetch_async(page))
+
+            for ticker in page:
+                if self._deadline_reached():
+                    return
+                self.cursor = ticker["id"]
+                self.result.ticker_count += 1
+                yield ticker
+
+    def _select_pages(self) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield selection pages, stopping the run early if one cannot be read.
+
+        The failed page's predecessor becomes the resume point, as if the run
+        had stopped at its deadline there.
+        """
+        try:
+            yield from self.ticker_selector.iter_ticker_pages(
+                self.config, self.config.page_size, self.resume_after_id
+            )
+        except TickerPageError as e:
+            logger.error(f"{e}; stopping the run to resume from there")
+            self.result.stopped_early = True
+            self.result.resume_after_id = e.after_id
+
+    def _deadline_reached(self) -> bool:
+        """
+        Whether to stop handing out tickers to finish before the deadline.
+
+        Leaves room for the configured margin plus the work already handed
+        out: one slowest-ticker time per worker and the queued backlog.
+        Marks the result as stopped early so the run can be resumed.
+        """
+        if self.deadline is None:
+            return False
+
+        backlog_per_worker = self.backlog_per_worker
+        if self.concurrency:
+            backlog_per_worker *= self.config.max_workers / self.concurrency.limit
+        drain_time = self.slowest_ticker * (1 + backlog_per_worker)
+        remaining = self.deadline - time.monotonic()
+        if remaining > self.config.deadline_margin + drain_time:
+            return False
+
+        if not self.result.stopped_early:
+            logger.warning(
+                f"Stopping with {remaining:.0f}s left before the deadline, "
+                f"after {self.result.ticker_count} tickers"
+            )
+        self.result.stopped_early = True
+        self.result.resume_after_id = self.cursor
+        return True
+
+    @staticmethod
+    def _diff_counts(
+        before: Dict[str, Dict[str, int]], after: Dict[str, Dict[str, int]]
+    ) -> Dict[str, Dict[str, int]]:
+        """Per-key counts accumulated between two nested-count snapshots."""
+        return {
+            endpoint: {
+                name: count - before.get(endpoint, {}).get(name, 0)
+                for name, count in counts.items()
+            }
+            for endpoint, counts in after.items()
+        }
+
+    def _use_bulk_prices(self) -> bool:
+        """Whether prices can be fetched with multi-symbol downloads."""
+        return (
+            self.config.bulk_prices
+            and self.config.process_prices
+            and not self.config.process_info
+            and not self.config.process_calendar
+            and not self.config.process_fund_data
+        )
+
+    def _prefetch_price_histories(
+        self, tickers: List[Dict[str, Any]]
+    ) -> Dict[str, YFTickerData]:
+        """
+        Fetch price histories for all tickers in multi-symbol chunks.
+
+        Tickers are grouped by start date, and by whether their prices are
+        adjusted here, so each download covers one range of one kind. A
+        download runs from the first missing day through today, so each
+        history is cut down to the ticker's missing ranges, as if they had
+        been requested one by one. Tickers missing from the result fall back
+        to a per-ticker fetch.
+        """
+        processor = self.ticker_processor
+        fetcher = processor.data_fetcher
+
+        tickers_by_start = defaultdict(list)
+        for ticker in tickers:
+            start_date = processor.resolve_start_date(ticker, self.config)
+            if start_date:
+                raw = processor.adjusts_prices(ticker, self.config)
+                tickers_by_start[(start_date, raw)].append(ticker)
+
+        prefetched = {}
+        for (start_date, raw), group in tickers_by_start.items():
+            histories = fetcher.fetch_price_histories(
+                {t["symbol"]: t.get("exchange", "") for t in group},
+                start_date,
+                chunk_size=self.config.bulk_chunk_size,
+                auto_adjust=not raw,
+            )
+            for ticker in group:
+                symbol = ticker["symbol"]
+                if symbol in histories:
+                    block = histories[symbol].block
+                    ranges = processor.resolve_price_ranges(ticker, self.config)
+                    block = PriceBlock.concat(
+                        [block.between(r.start, r.end) for r in ranges]
+                    )
+                    history = YFPriceHistory(block=block) if len(block) else None
+                    prefetched[symbol] = YFTickerData(
+                        ticker_symbol=symbol,
+                        exchange=ticker.get("exchange"),
+                        info=YFTickerInfo(symbol=symbol),
+                        price_history=history,
+                        fetched_endpoints=["history"],
+                    )
+
+        logger.info(
+            f"Prefetched price history for {len(prefetched)}/{len(tickers)} tickers "
+            f"in {len(tickers_by_start)} start-date groups"
+        )
+        return prefetched
+
+    def _prefetch_async(
+        self, tickers: List[Dict[str, Any]]
+    ) -> Dict[str, YFTickerData]:
+        """
+        Fetch every ticker's data concurrently with the asyncio engine.
+
+        Tickers whose async fetch fails fall back to a per-ticker fetch.
+        """
+        # httpx is only needed when the async engine is enabled
+        from src.services.async_data_fetcher import AsyncDataFetcher, FetchRequest
+
+        fetcher = AsyncDataFetcher(
+            max_concurrency=self.config.async_concurrency,
+            rate_limiter=self.ticker_processor.data_fetcher.rate_limiter,
+        )
+
+        requests = []
+        for ticker in tickers:
+            plan = FetchPlan.from_config(self.config, ticker.get("quote_type"))
+            ranges = (
+                self.ticker_processor.resolve_price_ranges(ticker, self.config)
+                if plan.history
+                else []
+            )
+            requests.append(
+                FetchRequest(
+                    symbol=ticker["symbol"],
+                    exchange=ticker.get("exchange", ""),
+                    start_date=ranges[0].start if ranges else date.today(),
+                    quote_type=ticker.get("quote_type"),
+                    history=bool(ranges),
+                    history_ranges=ranges or None,
+                    info=plan.info,
+                    calendar=plan.calendar,
+                    fund_data=plan.funds_data,
+                    adjusted_history=not self.ticker_processor.adjusts_prices(
+                        ticker, self.config
+                    ),
+                )
+            )
+
+        fetched = fetcher.fetch_all(requests)
+        return {symbol: data for symbol, data in fetched.items() if data is not None}
+
+    def _apply_write_outcomes(self, outcomes: Dict[str, Optional[str]]) -> None:
+        """
+        Fold batched write outcomes into the per-ticker results.
+
+        Tickers whose price rows failed to save are moved from successful to
+        failed, since their processing only queued the rows.
+        """
+        for symbol, error in outcomes.items():
+            if error is None:
+                continue
+
+            if symbol in self.result.successful:
+                self.result.successful.remove(symbol)
+            self.result.updated_tables.pop(symbol, None)
+            self.result.failed[symbol] = f"historical_prices write failed: {error}"
+
+        logger.info(
+            f"Flushed batched price writes for {len(outcomes)} tickers in "
+            f"{self.price_writer.request_count} requests"
+        )
+
+    def _update_analytics(self) -> None:
+        """
+        Fill ``yh_finance_daily`` price statistics for the tickers that were
+        processed successfully, once their price writes have settled.
+
+        Tickers whose row was just written from a live quote are skipped, so
+        the quote is not replaced by the last stored close.
+        """
+        symbols = {
+            self.ticker_ids[symbol]: symbol
+            for symbol in self.result.successful
+            if symbol in self.ticker_ids and symbol not in self.live_quotes
+        }
+        if not symbols:
+            return
+        written = self.ticker_processor.update_analytics(list(symbols), self.config)
+
+        for ticker_id in written:
+            tables = self.result.updated_tables.setdefault(symbols[ticker_id], [])
+            if "yh_finance_daily" not in tables:
+                tables.append("yh_finance_daily")
+
+    def _add_coverage(self, coverage: Optional[Dict[str, int]]) -> None:
+        """Add one ticker's price coverage to the run totals."""
+        if coverage is None:
+            return
+
+        totals = self.result.price_coverage
+        if coverage["ranges"]:
+            totals["ranges_requested"] = (
+                totals.get("ranges_requested", 0) + coverage["ranges"]
+            )
+            totals["days_requested"] = totals.get("days_requested", 0) + coverage["days"]
+            totals["rows_received"] = totals.get("rows_received", 0) + coverage["rows"]
+        else:
+            totals["up_to_date"] = totals.get("up_to_date", 0) + 1
+
+    def _process_sequentially(self, tickers: Iterable[Dict[str, Any]]) -> None:
         """Process tickers one at a time."""
         for ticker in tickers:
             symbol = ticker["symbol"]
@@ -93,15 +474,26 @@ class Pipeline:
 
             try:
                 # Process the ticker
-                updates = self.ticker_processor.process_ticker(ticker, self.config)
+                updates = self.ticker_processor.process_ticker(
+                    ticker,
+                    self.config,
+                    self.prefetched.pop(symbol, None),
+                    price_writer=self.price_writer,
+                )
 
                 # Record success
                 self.result.successful.append(symbol)
+                self.ticker_ids[symbol] = ticker["id"]
+                if ticker.get("live_quote"):
+                    self.live_quotes.add(symbol)
                 self.result.updated_tables[symbol] = list(updates)
+                self._add_coverage(ticker.get("price_coverage"))
 
                 # Record processing time
                 processing_time = time.time() - ticker_start
                 self.result.processing_time[symbol] = processing_time
+                self.slowest_ticker = max(self.slowest_ticker, processing_time)
+                get_instrumentation().record("ticker.total", processing_time)
 
                 logger.info(
                     f"Processed {symbol} in {processing_time:.2f}s, updated: {updates}"
@@ -116,61 +508,125 @@ class Pipeline:
                 processing_time = time.time() - ticker_start
                 self.result.processing_time[symbol] = processing_time
 
-    def _process_in_parallel(self, tickers: List[Dict[str, Any]]) -> None:
-        """Process tickers in parallel using thread pool."""
-        # Determine batch size and max workers
-        batch_size = min(self.config.batch_size, len(tickers))
-        max_workers = min(self.config.max_workers, batch_size)
+    def _process_in_parallel(self, tickers: Iterable[Dict[str, Any]]) -> None:
+        """
+        Process tickers in parallel from a bounded work queue.
 
-        logger.info(
-            f"Processing {len(tickers)} tickers in parallel with {max_workers} workers"
-        )
+        A fixed set of long-lived workers pull tickers as soon as they are
+        free, so a slow ticker only occupies its own worker instead of holding
+        back a whole batch. The queue holds at most ``batch_size`` waiting
+        tickers; request pacing is left to the fetcher's shared rate limiter.
+
+        With ``adaptive_concurrency``, ``worker_ceiling`` workers are started
+        but each takes a slot from a ``ConcurrencyController`` once it has
+        pulled a ticker, so only the controller's current limit are in flight
+        and idle workers waiting on the queue never hold a slot.
 
-        # Create batches
-        batches = [
-            tickers[i : i + batch_size] for i in range(0, len(tickers), batch_size)
+        Args:
+            tickers: Tickers to process, possibly a lazily selected stream
+        """
+        max_workers = self.config.max_workers
+        queue_size = max(self.config.batch_size, max_workers)
+        self.backlog_per_worker = queue_size / max_workers
+
+        thread_count = max_workers
+        fetcher = self.ticker_processor.data_fetcher
+        if self.config.adaptive_concurrency:
+            self.concurrency = ConcurrencyController(
+                min_limit=self.config.min_workers,
+                max_limit=self.config.worker_ceiling,
+                initial=max_workers,
+            )
+            thread_count = self.concurrency.max_limit
+            fetcher.concurrency = self.concurrency
+            logger.info(
+                f"Processing tickers in parallel with {self.concurrency.limit} "
+                f"workers, adapting between {self.concurrency.min_limit} and "
+                f"{self.concurrency.max_limit}"
+            )
+        else:
+            logger.info(f"Processing tickers in parallel with {max_workers} workers")
+
+        work_queue = queue.Queue(maxsize=queue_size)
+        workers = [
+            threading.Thread(
+                target=self._worker_loop,
+                args=(work_queue,),
+                name=f"ticker-worker-{i}",
+                daemon=True,
+            )
+            for i in range(thread_count)
         ]
+        for worker in workers:
+            worker.start()
 
-        # Process each batch
-        for batch_num, batch in enumerate(batches, 1):
+        try:
+            # Blocks while the queue is full, which keeps the producer (and
+            # the page selection behind it) in step with the workers
+            for ticker in tickers:
+                work_queue.put(ticker)
+        finally:
+            # One sentinel per worker signals the end of the stream
+            for _ in workers:
+                work_queue.put(None)
+            for worker in workers:
+                worker.join()
+            fetcher.concurrency = None
+
+        if self.concurrency:
+            self.result.concurrency = self.concurrency.snapshot()
             logger.info(
-                f"Processing batch {batch_num}/{len(batches)} with {len(batch)} tickers"
+                f"Finished at concurrency {self.result.concurrency['limit']} "
+                f"(peak {self.result.concurrency['peak_limit']}, "
+                f"{self.result.concurrency['increases']} increases, "
+                f"{self.result.concurrency['decreases']} decreases)"
             )
-            batch_start = time.time()
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all tasks
-                future_to_symbol = {
-                    executor.submit(self._process_single_ticker, ticker): ticker[
-                        "symbol"
-                    ]
-                    for ticker in batch
-                }
-
-                # Process results as they complete
-                for future in as_completed(future_to_symbol):
-                    symbol = future_to_symbol[future]
-                    try:
-                        result = future.result()
-                        if result["success"]:
-                            self.result.successful.append(symbol)
-                            self.result.updated_tables[symbol] = result["updates"]
-                        else:
-                            self.result.failed[symbol] = result["error"]
-
-                        self.result.processing_time[symbol] = result["processing_time"]
-
-                    except Exception as e:
-                        logger.error(f"Unexpected error processing {symbol}: {e}")
-                        self.result.failed[symbol] = str(e)
-
-            # Log batch completion
-            batch_time = time.time() - batch_start
-            logger.info(f"Completed batch {batch_num} in {batch_time:.2f}s")
-
-            # Add a small delay between batches to reduce API pressure
-            if batch_num < len(batches):
-                time.sleep(1.0)
+
+    def _worker_loop(self, work_queue: queue.Queue) -> None:
+        """Pull tickers from the work queue until the end-of-stream sentinel."""
+        while True:
+            ticker = work_queue.get()
+            if ticker is None:
+                work_queue.task_done()
+                return
+
+            # Take a slot only once there is work, so idle workers waiting on
+            # the queue don't count as in flight
+            if self.concurrency:
+                self.concurrency.acquire()
+            try:
+                symbol = ticker["symbol"]
+                try:
+                    result = self._process_single_ticker(ticker)
+                except Exception as e:
+                    logger.error(f"Unexpected error processing {symbol}: {e}")
+                    result = {"success": False, "error": str(e)}
+
+                self._record_result(symbol, result)
+            finally:
+                if self.concurrency:
+                    self.concurrency.release()
+                work_queue.task_done()
+
+    def _record_result(self, symbol: str, result: Dict[str, Any]) -> None:
+        """Record a structured ticker result from a worker thread."""
+        with self.result_lock:
+            if result["success"]:
+                self.result.successful.append(symbol)
+                self.ticker_ids[symbol] = result["ticker_id"]
+                if result.get("live_quote"):
+                    self.live_quotes.add(symbol)
+                self.result.updated_tables[symbol] = result["updates"]
+                self._add_coverage(result.get("coverage"))
+            else:
+                self.result.failed[symbol] = result["error"]
+
+            if "processing_time" in result:
+                self.result.processing_time[symbol] = result["processing_time"]
+                self.slowest_ticker = max(
+                    self.slowest_ticker, result["processing_time"]
+                )
+                get_instrumentation().record("ticker.total", result["processing_time"])
 
     def _process_single_ticker(self, ticker: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -185,7 +641,12 @@ class Pipeline:
 
         try:
             # Process the ticker
-            updates = self.ticker_processor.process_ticker(ticker, self.config)
+            updates = self.ticker_processor.process_ticker(
+                ticker,
+                self.config,
+                self.prefetched.pop(symbol, None),
+                price_writer=self.price_writer,
+            )
             processing_time = time.time() - start_time
 
             logger.info(
@@ -194,7 +655,10 @@ class Pipeline:
 
             return {
                 "success": True,
+                "ticker_id": ticker["id"],
                 "updates": list(updates),
+                "coverage": ticker.get("price_coverage"),
+                "live_quote": ticker.get("live_quote", False),
                 "processing_time": processing_time,
             }
 
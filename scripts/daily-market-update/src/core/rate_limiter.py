@@ -0,0 +1,201 @@
+"""
+Process-wide rate limiting for Yahoo Finance requests.
+
+Each endpoint class gets its own token bucket with burst capacity. Buckets
+adapt their rate with AIMD: every successful request adds a little rate back
+(up to the configured maximum) and every "too many requests" response halves
+it and pauses the bucket for a cooldown period.
+"""
+
+import threading
+import time
+from enum import Enum
+from typing import Dict, Optional
+
+from src.core.logging_config import setup_logging
+
+logger = setup_logging(name="rate_limiter")
+
+
+class YahooEndpoint(str, Enum):
+    """Yahoo Finance endpoint classes that are rate limited separately."""
+
+    HISTORY = "history"  # v8 chart
+    INFO = "info"  # quoteSummary
+    CALENDAR = "calendar"  # quoteSummary calendarEvents
+    FUNDS_DATA = "funds_data"  # quoteSummary fund modules
+
+
+# Requests per second and burst capacity for each endpoint class
+DEFAULT_LIMITS = {
+    YahooEndpoint.HISTORY: {"rate": 10.0, "capacity": 20.0},
+    YahooEndpoint.INFO: {"rate": 5.0, "capacity": 5.0},
+    YahooEndpoint.CALENDAR: {"rate": 5.0, "capacity": 5.0},
+    YahooEndpoint.FUNDS_DATA: {"rate": 5.0, "capacity": 5.0},
+}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with AIMD rate adaptation.
+
+    Callers reserve tokens under the lock and sleep outside it, so the
+    bucket may go into debt; later callers wait for the debt to be repaid.
+    This keeps the average rate bounded even when a caller takes more
+    tokens than the burst capacity (e.g. a multi-symbol download).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        min_rate: Optional[float] = None,
+        increase: Optional[float] = None,
+        decrease: float = 0.5,
+        cooldown: float = 2.0,
+    ):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Maximum refill rate (tokens per second)
+            capacity: Burst capacity (tokens)
+            min_rate: Floor for the adapted rate (default: 5% of rate)
+            increase: Rate added per successful request (default: 2% of rate)
+            decrease: Factor applied to the rate when throttled
+            cooldown: Seconds the bucket is paused after a throttle
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate if min_rate is not None else rate * 0.05
+        self.increase = increase if increase is not None else rate * 0.02
+        self.decrease = decrease
+        self.cooldown = cooldown
+
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+        self.throttle_count = 0
+        self.wait_time = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last update."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket without sleeping.
+
+        Args:
+            tokens: Number of tokens (requests) to take
+
+        Returns:
+            Seconds the caller must wait before making its request
+        """
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= tokens
+            wait = max(-self.tokens / self.rate, self.blocked_until - now, 0.0)
+            self.wait_time += wait
+        return wait
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, sleeping until they are available.
+
+        Args:
+            tokens: Number of tokens (requests) to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            logger.debug(f"Rate limiting: sleeping for {wait:.2f}s")
+            time.sleep(wait)
+
+        return wait
+
+    def on_success(self) -> None:
+        """Additively increase the rate after a successful request."""
+        with self.lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self) -> None:
+        """Multiplicatively decrease the rate and pause after a throttle."""
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.tokens = min(self.tokens, 0.0)
+            self.blocked_until = max(self.blocked_until, now + self.cooldown)
+            self.throttle_count += 1
+
+
+class RateLimiter:
+    """
+    Set of token buckets, one per Yahoo Finance endpoint class.
+    """
+
+    def __init__(self, limits: Optional[Dict[YahooEndpoint, Dict[str, float]]] = None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            limits: Per-endpoint bucket settings (see ``DEFAULT_LIMITS``)
+        """
+        limits = limits or DEFAULT_LIMITS
+        self.buckets = {
+            YahooEndpoint(endpoint): TokenBucket(**settings)
+            for endpoint, settings in limits.items()
+        }
+
+    def acquire(self, endpoint: YahooEndpoint, tokens: float = 1.0) -> float:
+        """Take tokens from an endpoint's bucket, waiting if needed."""
+        return self.buckets[endpoint].acquire(tokens)
+
+    def reserve(self, endpoint: YahooEndpoint, tokens: float = 1.0) -> float:
+        """Take tokens from an endpoint's bucket and return the wait (async callers)."""
+        return self.buckets[endpoint].reserve(tokens)
+
+    def on_success(self, endpoint: YahooEndpoint) -> None:
+        """Report a successful request to an endpoint."""
+        self.buckets[endpoint].on_success()
+
+    def on_throttle(self, endpoint: YahooEndpoint) -> None:
+        """Report a "too many requests" response from an endpoint."""
+        bucket = self.buckets[endpoint]
+        bucket.on_throttle()
+        logger.warning(
+            f"Throttled on {endpoint.value}, rate reduced to {bucket.rate:.2f}/s"
+        )
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Current rate, throttle count and total wait per endpoint."""
+        return {
+            endpoint.value: {
+                "rate": round(bucket.rate, 3),
+                "throttles": bucket.throttle_count,
+                "wait_time": round(bucket.wait_time, 3),
+            }
+            for endpoint, bucket in self.buckets.items()
+        }
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter, creating it on first use."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter()
+        return _rate_limiter
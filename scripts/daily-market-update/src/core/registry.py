@@ -0,0 +1,125 @@
+"""
+Registry of long-lived components shared across Lambda invocations.
+
+Components are built lazily on first use and kept for the life of the
+container, so warm invocations reuse clients and their pooled connections
+instead of rebuilding them. Each component can have a health check that is
+run before it is handed out; unhealthy or invalidated components are
+rebuilt, along with everything that depends on them. Components that hold
+resources (sessions, processes) get a disposer that releases them when
+they are dropped.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from src.core.logging_config import setup_logging
+
+logger = setup_logging(name="registry")
+
+
+class ComponentRegistry:
+    """
+    Lazily built, health-checked singletons keyed by name.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[["ComponentRegistry"], Any]] = {}
+        self._health_checks: Dict[str, Callable[[Any], bool]] = {}
+        self._disposers: Dict[str, Callable[[Any], None]] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._components: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+        self.build_count: Dict[str, int] = {}
+
+    def register(
+        self,
+        name: str,
+        factory: Callable[["ComponentRegistry"], Any],
+        health_check: Optional[Callable[[Any], bool]] = None,
+        depends_on: Iterable[str] = (),
+        dispose: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """
+        Register how to build a component.
+
+        Args:
+            name: Component name
+            factory: Builds the component; receives the registry so it can
+                get its dependencies
+            health_check: Returns False (or raises) if the component must be
+                rebuilt before use
+            depends_on: Components this one is built from; rebuilding any of
+                them rebuilds this one too
+            dispose: Releases the component's resources when it is dropped
+        """
+        with self._lock:
+            self._factories[name] = factory
+            if health_check:
+                self._health_checks[name] = health_check
+            if dispose:
+                self._disposers[name] = dispose
+            for dependency in depends_on:
+                self._dependents.setdefault(dependency, set()).add(name)
+
+    def get(self, name: str) -> Any:
+        """
+        Return a component, building or rebuilding it if needed.
+
+        Args:
+            name: Component name
+
+        Returns:
+            The shared component instance
+        """
+        with self._lock:
+            if name in self._components and not self._is_healthy(name):
+                logger.warning(f"Component {name} failed its health check, rebuilding")
+                self.invalidate(name)
+
+            if name not in self._components:
+                self._components[name] = self._factories[name](self)
+                self.build_count[name] = self.build_count.get(name, 0) + 1
+                logger.info(f"Built component {name}")
+
+            return self._components[name]
+
+    def invalidate(self, name: str) -> None:
+        """Drop a component and its dependents so they are rebuilt on next use."""
+        with self._lock:
+            # Dependents first, since they may still use this component
+            for dependent in self._dependents.get(name, ()):
+                self.invalidate(dependent)
+            if name in self._components:
+                self._dispose(name, self._components.pop(name))
+
+    def invalidate_all(self) -> None:
+        """Drop every component."""
+        with self._lock:
+            for name in list(self._components):
+                self.invalidate(name)
+
+    def built(self) -> List[str]:
+        """Names of the components currently built."""
+        with self._lock:
+            return sorted(self._components)
+
+    def _dispose(self, name: str, component: Any) -> None:
+        dispose = self._disposers.get(name)
+        if dispose is None:
+            return
+        try:
+            dispose(component)
+        except Exception as e:
+            logger.warning(f"Disposing of {name} raised: {e}")
+
+    def _is_healthy(self, name: str) -> bool:
+        check = self._health_checks.get(name)
+        if check is None:
+            return True
+        try:
+            return bool(check(self._components[name]))
+        except Exception as e:
+            logger.warning(f"Health check for {name} raised: {e}")
+            return False
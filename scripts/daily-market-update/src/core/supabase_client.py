@@ -1,4 +1,3 @@
-from supabase import create_client
 from src.core.logging_config import setup_logging
 
 
@@ -12,6 +11,9 @@ class SupabaseClient:
         self.client = self._create_client()
 
     def _create_client(self):
+        # Imported here so importing the handler doesn't load supabase
+        from supabase import create_client
+
         try:
             return create_client(self.url, self.key)
         except Exception as e:
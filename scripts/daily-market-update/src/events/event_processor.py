@@ -47,6 +47,7 @@ class PipelineConfig(BaseModel):
 
     # Processing behavior
     force_update: bool = False  # Update regardless of last update timestamp
+    skip_fresh: bool = False  # Skip tickers already updated since the last close
     backfill: bool = False  # Perform historical backfill
 
     # Date range
@@ -56,11 +57,56 @@ class PipelineConfig(BaseModel):
     specific_tickers: Optional[List[str]] = None
     ticker_types: Optional[DBQuoteType] = None  # e.g., ["EQUITY", "ETF", "INDEX"]
 
+    # Seconds kept free before the invocation deadline for in-flight work
+    deadline_margin: float = 30.0
+
+    # Tickers read from the database per selection page
+    page_size: int = 500
+
     # Batch processing
     batch_mode: bool = False
     batch_size: int = 10
     max_workers: int = 5
 
+    # Grow or shrink the tickers in flight between min_workers and
+    # worker_ceiling (starting at max_workers) from Yahoo latency and
+    # throttling; otherwise max_workers is fixed
+    adaptive_concurrency: bool = True
+    min_workers: int = 2
+    worker_ceiling: int = 20
+
+    # Bulk price download (used when prices are the only data processed)
+    bulk_prices: bool = True
+    bulk_chunk_size: int = 100
+
+    # Asyncio fetch engine (all tickers fetched concurrently up front)
+    async_fetch: bool = False
+    async_concurrency: int = 50
+
+    # Backfills only fetch the ranges missing from stored price history
+    fill_gaps: bool = True
+
+    # On-disk cache of Yahoo responses for per-ticker fetches
+    use_cache: bool = True
+
+    # Cross-ticker write batching for historical_prices
+    batch_writes: bool = True
+    write_batch_rows: int = 1000
+    write_batch_bytes: int = 1_000_000
+
+    # Compute moving averages, 52-week ranges and returns for yh_finance_daily
+    # from stored prices after the price writes (runs that process prices)
+    analytics: bool = True
+
+    # Advance per-ticker rolling state by the rows stored since the last run
+    # instead of reading a year of prices (BACKFILL rebuilds the state)
+    incremental_analytics: bool = True
+
+    # Fetch incremental price updates unadjusted and apply dividends and
+    # splits here, re-adjusting stored history when a new action appears
+    # (backfills and start-date runs keep Yahoo's adjustment of the range)
+    adjust_prices: bool = True
+
     # Region awareness
     region: Optional[str] = None
 
@@ -76,9 +122,28 @@ class EventConfig(BaseModel):
     fund_data: Optional[bool] = None
 
     # Execution options
+    force_update: Optional[bool] = None
+    skip_fresh: Optional[bool] = None
+    page_size: Optional[int] = None
+    deadline_margin: Optional[float] = None
     batch_mode: Optional[bool] = None
     batch_size: Optional[int] = None
     max_workers: Optional[int] = None
+    adaptive_concurrency: Optional[bool] = None
+    min_workers: Optional[int] = None
+    worker_ceiling: Optional[int] = None
+    bulk_prices: Optional[bool] = None
+    bulk_chunk_size: Optional[int] = None
+    async_fetch: Optional[bool] = None
+    async_concurrency: Optional[int] = None
+    fill_gaps: Optional[bool] = None
+    use_cache: Optional[bool] = None
+    batch_writes: Optional[bool] = None
+    write_batch_rows: Optional[int] = None
+    write_batch_bytes: Optional[int] = None
+    analytics: Optional[bool] = None
+    incremental_analytics: Optional[bool] = None
+    adjust_prices: Optional[bool] = None
 
 
 class EventPayload(BaseModel):
@@ -172,7 +237,7 @@ class EventProcessor:
         if event_type == EventType.SCHEDULED:
             # Default scheduled behavior - Equity and ETF
             config.ticker_types = ["EQUITY", "ETF", "MUTUALFUND"]
-            pass
+            config.skip_fresh = True
         if event_type == EventType.UPDATE_INDICES:
             config.ticker_types = ["INDEX"]
             config.process_calendar = False
@@ -267,6 +332,18 @@ class EventProcessor:
         if self.event.config.fund_data is not None:
             config.process_fund_data = self.event.config.fund_data
 
+        if self.event.config.force_update is not None:
+            config.force_update = self.event.config.force_update
+
+        if self.event.config.skip_fresh is not None:
+            config.skip_fresh = self.event.config.skip_fresh
+
+        if self.event.config.page_size is not None:
+            config.page_size = self.event.config.page_size
+
+        if self.event.config.deadline_margin is not None:
+            config.deadline_margin = self.event.config.deadline_margin
+
         if self.event.config.batch_mode is not None:
             config.batch_mode = self.event.config.batch_mode
 
@@ -276,3 +353,48 @@ class EventProcessor:
         if self.event.config.max_workers is not None:
             config.max_workers = self.event.config.max_workers
 
+        if self.event.config.adaptive_concurrency is not None:
+            config.adaptive_concurrency = self.event.config.adaptive_concurrency
+
+        if self.event.config.min_workers is not None:
+            config.min_workers = self.event.config.min_workers
+
+        if self.event.config.worker_ceiling is not None:
+            config.worker_ceiling = self.event.config.worker_ceiling
+
+        if self.event.config.bulk_prices is not None:
+            config.bulk_prices = self.event.config.bulk_prices
+
+        if self.event.config.bulk_chunk_size is not None:
+            config.bulk_chunk_size = self.event.config.bulk_chunk_size
+
+        if self.event.config.async_fetch is not None:
+            config.async_fetch = self.event.config.async_fetch
+
+        if self.event.config.async_concurrency is not None:
+            config.async_concurrency = self.event.config.async_concurrency
+
+        if self.event.config.fill_gaps is not None:
+            config.fill_gaps = self.event.config.fill_gaps
+
+        if self.event.config.use_cache is not None:
+            config.use_cache = self.event.config.use_cache
+
+        if self.event.config.batch_writes is not None:
+            config.batch_writes = self.event.config.batch_writes
+
+        if self.event.config.write_batch_rows is not None:
+            config.write_batch_rows = self.event.config.write_batch_rows
+
+        if self.event.config.write_batch_bytes is not None:
+            config.write_batch_bytes = self.event.config.write_batch_bytes
+
+        if self.event.config.analytics is not None:
+            config.analytics = self.event.config.analytics
+
+        if self.event.config.incremental_analytics is not None:
+            config.incremental_analytics = self.event.config.incremental_analytics
+
+        if self.event.config.adjust_prices is not None:
+            config.adjust_prices = self.event.config.adjust_prices
+
@@ -1,22 +1,106 @@
 import json
 import os
+import time
 from datetime import datetime
-from typing import Dict, List, Any
-from pydantic import BaseModel
-from src.core.config import SUPABASE_URL, SUPABASE_KEY
-from src.core.pipeline import Pipeline
-from src.core.supabase_client import SupabaseClient
+from typing import TYPE_CHECKING, Dict, Any, Optional
+from src.core.registry import ComponentRegistry
 from src.core.logging_config import setup_logging
-from src.events.event_processor import EventProcessor
+
+# Heavy dependencies (pydantic and the models built on it, yfinance, pandas,
+# supabase) are imported on first use inside the functions below, keeping the
+# handler module cheap to import
+if TYPE_CHECKING:
+    from src.core.checkpoint import Checkpoint
 
 logger = setup_logging(name="ticker_processor")
 
 
-class ProcessingResult(BaseModel):
-    ticker_count: int
-    successful: List[str]
-    failed: Dict[str, str]
-    updated_tables: Dict[str, List[str]]
+def _create_supabase(registry: ComponentRegistry):
+    from src.core.config import get_settings
+    from src.core.supabase_client import SupabaseClient
+
+    settings = get_settings()
+    return SupabaseClient(settings.supabase_url, settings.supabase_key).get_client()
+
+
+def _supabase_is_healthy(client) -> bool:
+    """The PostgREST HTTP client must still be open."""
+    return not client.postgrest.session.is_closed
+
+
+def _create_http_session(registry: ComponentRegistry):
+    from src.services.data_fetcher import create_http_session
+
+    return create_http_session()
+
+
+def _create_response_cache(registry: ComponentRegistry):
+    from src.services.response_cache import DEFAULT_CACHE_DIR, ResponseCache
+
+    return ResponseCache(
+        directory=os.environ.get("YAHOO_CACHE_DIR", DEFAULT_CACHE_DIR),
+        max_bytes=int(os.environ.get("YAHOO_CACHE_MAX_MB", 256)) * 1024 * 1024,
+    )
+
+
+def _create_data_fetcher(registry: ComponentRegistry):
+    from src.services.data_fetcher import DataFetcher
+
+    return DataFetcher(
+        session=registry.get("http_session"), cache=registry.get("response_cache")
+    )
+
+
+def _create_ticker_selector(registry: ComponentRegistry):
+    from src.services.ticker_selector import TickerSelector
+
+    return TickerSelector(registry.get("supabase"))
+
+
+def _create_ticker_processor(registry: ComponentRegistry):
+    from src.services.rolling_state import DEFAULT_ROLLING_STATE_DIR, RollingStateStore
+    from src.services.ticker_processor import TickerProcessor
+
+    return TickerProcessor(
+        registry.get("supabase"),
+        registry.get("data_fetcher"),
+        rolling_states=RollingStateStore(
+            os.environ.get("ROLLING_STATE_DIR", DEFAULT_ROLLING_STATE_DIR)
+        ),
+    )
+
+
+def _build_registry() -> ComponentRegistry:
+    """Register the components reused across warm invocations."""
+    registry = ComponentRegistry()
+    registry.register(
+        "supabase",
+        _create_supabase,
+        health_check=_supabase_is_healthy,
+        dispose=lambda client: client.postgrest.session.close(),
+    )
+    registry.register(
+        "http_session", _create_http_session, dispose=lambda session: session.close()
+    )
+    registry.register("response_cache", _create_response_cache)
+    registry.register(
+        "data_fetcher",
+        _create_data_fetcher,
+        depends_on=["http_session", "response_cache"],
+    )
+    registry.register(
+        "ticker_selector", _create_ticker_selector, depends_on=["supabase"]
+    )
+    registry.register(
+        "ticker_processor",
+        _create_ticker_processor,
+        depends_on=["supabase", "data_fetcher"],
+    )
+    return registry
+
+
+# Built once per container; components are created on first use
+registry = _build_registry()
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -38,31 +122,77 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     )
 
     try:
-        # Initialize Supabase client
-        supabase = SupabaseClient(SUPABASE_URL, SUPABASE_KEY).get_client()
+        from src.core.checkpoint import (
+            FileCheckpointStore,
+            TickerEventCheckpointStore,
+            make_run_key,
+        )
+        from src.core.pipeline import Pipeline
+        from src.events.event_processor import EventProcessor
+
+        # Reuse the container's Supabase client (built on first use)
+        supabase = registry.get("supabase")
 
         # Process the event
         event_processor = EventProcessor(event, region)
         pipeline_config = event_processor.create_pipeline_config()
 
+        # Resume from where a previous invocation of the same job stopped
+        run_key = make_run_key(event_processor.event.model_dump(mode="json"))
+        if event.get("event_record_id"):
+            checkpoint_store = TickerEventCheckpointStore(
+                supabase, event["event_record_id"]
+            )
+        else:
+            checkpoint_store = FileCheckpointStore()
+        checkpoint = checkpoint_store.load(run_key)
+        if checkpoint:
+            logger.info(
+                f"Resuming run {run_key} after ticker {checkpoint.after_id}",
+                extra={"checkpoint": checkpoint.model_dump()},
+            )
+
         # Execute the pipeline
-        pipeline = Pipeline(pipeline_config, supabase)
+        pipeline = Pipeline(
+            pipeline_config,
+            supabase,
+            deadline=_get_deadline(context),
+            resume_after_id=checkpoint.after_id if checkpoint else None,
+            ticker_selector=registry.get("ticker_selector"),
+            ticker_processor=registry.get("ticker_processor"),
+        )
         result = pipeline.execute()
 
+        # Save progress for the next invocation, or clear it once done
+        _save_checkpoint(checkpoint_store, run_key, checkpoint, result)
+
         # Prepare response
+        if result.stopped_early:
+            status_code = 202  # Accepted, more invocations needed
+        else:
+            status_code = 200 if not result.failed else 207  # Partial success
         response = {
-            "statusCode": 200 if not result.failed else 207,  # Partial success
+            "statusCode": status_code,
             "region": region,
             "summary": _format_result_summary(result),
             "metrics": {
                 "tickerCount": result.ticker_count,
                 "successCount": len(result.successful),
                 "failureCount": len(result.failed),
+                "skippedCount": len(result.skipped),
                 "totalProcessingTime": result.processing_time.get("total", 0),
+                "priceCoverage": result.price_coverage,
+                "stages": result.stage_metrics.get("stages", {}),
+                "counters": result.stage_metrics.get("counters", {}),
+                "writes": result.write_stats,
+                "cache": result.cache_stats,
+                "concurrency": result.concurrency,
             },
+            "resume": result.stopped_early,
         }
 
-        if event.get("event_record_id"):
+        # An interrupted run leaves its event pending with the checkpoint
+        if event.get("event_record_id") and not result.stopped_early:
             try:
                 status = "completed" if not result.failed else "failed"
                 error_message = None
@@ -91,15 +221,50 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
     except Exception as e:
         logger.error(f"Lambda execution failed: {e}", exc_info=True)
+        # Don't carry possibly broken clients into the next invocation
+        registry.invalidate_all()
         return {"statusCode": 500, "body": f"Execution failed: {str(e)}"}
 
 
+def _get_deadline(context: Any) -> Optional[float]:
+    """Monotonic time at which the Lambda invocation times out, if known."""
+    if context is None or not hasattr(context, "get_remaining_time_in_millis"):
+        return None
+    return time.monotonic() + context.get_remaining_time_in_millis() / 1000
+
+
+def _save_checkpoint(
+    store, run_key: str, previous: Optional["Checkpoint"], result
+) -> None:
+    """Write a checkpoint for an interrupted run, or clear a finished one."""
+    from src.core.checkpoint import Checkpoint
+
+    try:
+        if result.stopped_early:
+            processed = (previous.processed if previous else 0) + result.ticker_count
+            store.save(
+                Checkpoint(
+                    run_key=run_key,
+                    after_id=result.resume_after_id,
+                    processed=processed,
+                )
+            )
+            logger.info(
+                f"Saved checkpoint for run {run_key} after {processed} tickers"
+            )
+        elif previous:
+            store.clear(run_key)
+    except Exception as e:
+        logger.error(f"Failed to update checkpoint for run {run_key}: {e}")
+
+
 def _format_result_summary(result) -> str:
     """Format results into a readable summary string."""
     summary = [
         f"Processed {result.ticker_count} tickers in {result.processing_time.get('total', 0):.2f}s",
         f"Successful: {len(result.successful)}",
         f"Failed: {len(result.failed)}",
+        f"Skipped: {len(result.skipped)}",
         "",
     ]
 
@@ -0,0 +1,295 @@
+"""
+Columnar container for one ticker's daily price history.
+
+A ``PriceBlock`` is built once from the DataFrame yfinance returns and then
+shared by every stage: coverage checks read its dates, transforms and
+writes work through slices, which are NumPy views rather than copies. Rows
+are only materialized as dicts one write batch at a time.
+
+Only NumPy is needed to use a block (pandas just to build one).
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# historical_prices column -> block attribute, in record order
+RECORD_COLUMNS = {
+    "open_price": "open",
+    "high_price": "high",
+    "low_price": "low",
+    "close_price": "close",
+    "volume": "volume",
+    "dividends": "dividends",
+    "stock_splits": "stock_splits",
+}
+
+# yfinance history column -> block attribute
+FRAME_COLUMNS = {
+    "Open": "open",
+    "High": "high",
+    "Low": "low",
+    "Close": "close",
+    "Dividends": "dividends",
+    "Stock Splits": "stock_splits",
+}
+
+
+def _to_list(values: np.ndarray, missing: Optional[np.ndarray]) -> List[Any]:
+    """Array to Python values, with None where ``missing`` is set."""
+    result = values.tolist()
+    if missing is not None:
+        for index in np.flatnonzero(missing).tolist():
+            result[index] = None
+    return result
+
+
+@dataclass(slots=True)
+class PriceBlock:
+    """
+    Daily prices as parallel NumPy arrays.
+
+    Prices are float64 with NaN where missing; volume is int64 with a
+    separate missing mask (None when every volume is present).
+    """
+
+    # Session dates (wall-clock date of each row), day resolution
+    dates: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    dividends: np.ndarray
+    stock_splits: np.ndarray
+    volume_missing: Optional[np.ndarray] = None
+
+    # Time zone of the source index, to rebuild its timestamps
+    tz: Optional[str] = None
+
+    # False for Yahoo's unadjusted history, before the dividend adjustment
+    # in ``adjustments`` is applied
+    adjusted: bool = True
+
+    @classmethod
+    def from_frame(cls, frame: "pd.DataFrame", adjusted: bool = True) -> "PriceBlock":
+        """
+        Build a block from a yfinance history frame.
+
+        Each column is coerced to a number once (unparseable values become
+        missing); absent dividend and split columns default to 0.0.
+
+        Args:
+            frame: History indexed by date
+            adjusted: Whether the frame was fetched with ``auto_adjust``
+
+        Returns:
+            Block holding the same rows
+        """
+        import pandas as pd
+
+        index = pd.DatetimeIndex(frame.index)
+        tz = str(index.tz) if index.tz is not None else None
+        if tz:
+            index = index.tz_localize(None)
+
+        def column(name: str, default: float) -> np.ndarray:
+            if name not in frame:
+                return np.full(len(frame), default)
+            values = pd.to_numeric(frame[name], errors="coerce")
+            return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        arrays = {
+            field: column(name, 0.0 if field in ("dividends", "stock_splits") else np.nan)
+            for name, field in FRAME_COLUMNS.items()
+        }
+
+        volume = column("Volume", np.nan)
+        missing = np.isnan(volume)
+        arrays["volume"] = np.where(missing, 0, np.round(volume)).astype(np.int64)
+
+        return cls(
+            dates=index.values.astype("datetime64[D]"),
+            volume_missing=missing if missing.any() else None,
+            tz=tz,
+            adjusted=adjusted,
+            **arrays,
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Dict[str, Any]]) -> "PriceBlock":
+        """
+        Build a block from stored ``historical_prices`` rows.
+
+        Args:
+            rows: Rows in date order, with any subset of the price columns
+
+        Returns:
+            Block holding the same rows (no time zone)
+        """
+
+        def column(name: str, default: float) -> np.ndarray:
+            values = [row.get(name) for row in rows]
+            return np.array(
+                [default if v is None else v for v in values], dtype=np.float64
+            )
+
+        arrays = {
+            field: column(name, 0.0 if field in ("dividends", "stock_splits") else np.nan)
+            for name, field in RECORD_COLUMNS.items()
+            if field != "volume"
+        }
+
+        volume = column("volume", np.nan)
+        missing = np.isnan(volume)
+        arrays["volume"] = np.where(missing, 0, volume).astype(np.int64)
+
+        return cls(
+            dates=np.array([row["date"][:10] for row in rows], dtype="datetime64[D]"),
+            volume_missing=missing if missing.any() else None,
+            **arrays,
+        )
+
+    @classmethod
+    def concat(cls, blocks: Sequence["PriceBlock"]) -> "PriceBlock":
+        """Join blocks (e.g. one per fetched range) into one, in the given order."""
+        if len(blocks) == 1:
+            return blocks[0]
+
+        masks = [b.volume_missing for b in blocks]
+        missing = None
+        if any(m is not None for m in masks):
+            missing = np.concatenate(
+                [m if m is not None else np.zeros(len(b), bool) for m, b in zip(masks, blocks)]
+            )
+
+        return cls(
+            dates=np.concatenate([b.dates for b in blocks]),
+            open=np.concatenate([b.open for b in blocks]),
+            high=np.concatenate([b.high for b in blocks]),
+            low=np.concatenate([b.low for b in blocks]),
+            close=np.concatenate([b.close for b in blocks]),
+            volume=np.concatenate([b.volume for b in blocks]),
+            dividends=np.concatenate([b.dividends for b in blocks]),
+            stock_splits=np.concatenate([b.stock_splits for b in blocks]),
+            volume_missing=missing,
+            tz=blocks[0].tz,
+            adjusted=blocks[0].adjusted,
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, rows: slice) -> "PriceBlock":
+        """Rows as a new block of views onto this one's arrays (no copy)."""
+        if not isinstance(rows, slice):
+            raise TypeError("PriceBlock rows can only be selected with a slice")
+
+        return PriceBlock(
+            dates=self.dates[rows],
+            open=self.open[rows],
+            high=self.high[rows],
+            low=self.low[rows],
+            close=self.close[rows],
+            volume=self.volume[rows],
+            dividends=self.dividends[rows],
+            stock_splits=self.stock_splits[rows],
+            volume_missing=(
+                self.volume_missing[rows] if self.volume_missing is not None else None
+            ),
+            tz=self.tz,
+            adjusted=self.adjusted,
+        )
+
+    def between(self, start: date, end: date) -> "PriceBlock":
+        """Rows dated from ``start`` through ``end``, as views (no copy)."""
+        first = np.searchsorted(self.dates, np.datetime64(start, "D"), side="left")
+        last = np.searchsorted(self.dates, np.datetime64(end, "D"), side="right")
+        return self[first:last]
+
+    def batches(self, size: int) -> Iterator["PriceBlock"]:
+        """Consecutive slices of at most ``size`` rows."""
+        for start in range(0, len(self), max(1, size)):
+            yield self[start : start + size]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the arrays."""
+        arrays = [getattr(self, field) for field in RECORD_COLUMNS.values()]
+        arrays.append(self.dates)
+        if self.volume_missing is not None:
+            arrays.append(self.volume_missing)
+        return sum(a.nbytes for a in arrays)
+
+    def date_list(self) -> List[date]:
+        """Row dates as ``datetime.date`` objects."""
+        return self.dates.tolist()
+
+    def column_lists(self) -> Dict[str, List[Any]]:
+        """
+        Python lists per ``historical_prices`` column, None where missing,
+        in record order and ending with ``date`` as YYYY-MM-DD strings.
+        """
+        columns = {}
+        for column, field in RECORD_COLUMNS.items():
+            values = getattr(self, field)
+            if field == "volume":
+                missing = self.volume_missing
+            else:
+                missing = np.isnan(values)
+                missing = missing if missing.any() else None
+            columns[column] = _to_list(values, missing)
+
+        columns["date"] = self.dates.astype(str).tolist()
+        return columns
+
+    def records(self, ticker_id: str, updated_at: str) -> List[Dict[str, Any]]:
+        """
+        Upsert-ready ``historical_prices`` rows.
+
+        Rows match ``DBHistoricalPrice.model_dump(exclude_none=True)``. Each
+        column is converted to Python values in one call and the rows are
+        zipped together in one pass; missing values are found per column
+        with array operations, so only the rows that have one are touched
+        again to drop those columns.
+
+        Args:
+            ticker_id: Database ticker ID
+            updated_at: ISO timestamp stamped on every row
+
+        Returns:
+            One dict per row
+        """
+        count = len(self)
+        if not count:
+            return []
+
+        columns = {}
+        missing = {}
+        for column, field in RECORD_COLUMNS.items():
+            values = getattr(self, field)
+            columns[column] = values.tolist()
+            mask = self.volume_missing if field == "volume" else np.isnan(values)
+            if mask is not None and mask.any():
+                missing[column] = mask
+        columns["date"] = self.dates.astype(str).tolist()
+
+        keys = ["ticker_id", "updated_at", *columns]
+        rows = [
+            dict(zip(keys, row))
+            for row in zip(
+                repeat(ticker_id, count), repeat(updated_at, count), *columns.values()
+            )
+        ]
+
+        for column, mask in missing.items():
+            for index in np.flatnonzero(mask).tolist():
+                del rows[index][column]
+
+        return rows
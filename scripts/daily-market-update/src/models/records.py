@@ -0,0 +1,116 @@
+"""
+Compact record types for fund rows.
+
+Slotted dataclasses with the same fields as the matching ``db_models``
+models, but without validation or a per-instance ``__dict__``. Transformers
+build them from already-typed data, and ``to_row`` returns the payload that
+``model_dump(exclude_none=True)`` returns for the model. Price rows skip
+records altogether: ``PriceBlock.records`` builds their payloads column by
+column. The pydantic models
+stay in use at the boundaries (events, configuration, Yahoo payloads) and as
+the reference the records are tested against.
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Sequence
+
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+
+def _today() -> str:
+    return date.today().strftime("%Y-%m-%d")
+
+
+class Record:
+    """Base for slotted records; subclasses are ``@dataclass(slots=True)``."""
+
+    __slots__ = ()
+
+    def to_row(self) -> Dict[str, Any]:
+        """Upsert payload: every field that is not None."""
+        row = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                row[name] = value
+        return row
+
+
+def as_row(item: Any) -> Dict[str, Any]:
+    """
+    Upsert payload for a record, a pydantic model or an already built dict.
+
+    Args:
+        item: Record, ``db_models`` model or row dict
+
+    Returns:
+        Row dict without None values
+    """
+    if isinstance(item, dict):
+        return item
+    if isinstance(item, Record):
+        return item.to_row()
+    return item.model_dump(exclude_none=True)
+
+
+def row_width(rows: Sequence[Dict[str, Any]]) -> int:
+    """
+    Approximate JSON size of one row of a payload, from its first row.
+
+    Rows of one payload share their columns, so sizing a single row is
+    close enough for batch limits and byte counters without serializing
+    the payload a second time (the client encodes it for the request).
+
+    Args:
+        rows: Upsert payload
+
+    Returns:
+        Bytes per row, including the list separator (0 for no rows)
+    """
+    if not rows:
+        return 0
+    return len(json.dumps(rows[0], default=str)) + 2
+
+
+@dataclass(slots=True)
+class FundHoldingRecord(Record):
+    """Row of ``fund_top_holdings`` (see ``DBFundHolding``)."""
+
+    ticker_id: str
+    holding_symbol: str
+    holding_name: str
+    weight: float
+    id: Optional[str] = None
+    date: str = field(default_factory=_today)
+    created_at: Optional[str] = None
+    updated_at: str = field(default_factory=_now)
+
+
+@dataclass(slots=True)
+class SectorWeightingRecord(Record):
+    """Row of ``fund_sector_weightings`` (see ``DBSectorWeighting``)."""
+
+    ticker_id: str
+    sector_name: str
+    weight: float
+    id: Optional[str] = None
+    date: str = field(default_factory=_today)
+    created_at: Optional[str] = None
+    updated_at: str = field(default_factory=_now)
+
+
+@dataclass(slots=True)
+class AssetClassRecord(Record):
+    """Row of ``fund_asset_classes`` (see ``DBAssetClass``)."""
+
+    ticker_id: str
+    asset_class: str
+    weight: float
+    id: Optional[str] = None
+    date: str = field(default_factory=_today)
+    created_at: Optional[str] = None
+    updated_at: str = field(default_factory=_now)
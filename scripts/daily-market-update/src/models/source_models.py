@@ -3,10 +3,13 @@ Data models representing YFinance API responses.
 These models parse and validate data directly from YFinance.
 """
 
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from datetime import datetime, date
 from enum import Enum
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, field_validator
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Common configuration for all models
 model_config = ConfigDict(
@@ -40,33 +43,71 @@ class YFPriceRow(BaseModel):
     stock_splits: Optional[float] = Field(0.0, alias="Stock Splits")
 
 
+# yfinance history column -> price field
+PRICE_COLUMNS = {
+    "Open": "open",
+    "High": "high",
+    "Low": "low",
+    "Close": "close",
+    "Volume": "volume",
+    "Dividends": "dividends",
+    "Stock Splits": "stock_splits",
+}
+
+
 class YFPriceHistory(BaseModel):
     """YFinance price history data"""
 
     model_config = model_config
 
-    # This is a dict where keys are datetime objects and values are price rows
-    data: Dict[datetime, YFPriceRow]
+    # Columnar prices built once from the yfinance frame (a ``PriceBlock``)
+    block: Any = Field(exclude=True, repr=False)
+
+    _rows: Optional[Dict[datetime, YFPriceRow]] = PrivateAttr(default=None)
 
     @classmethod
-    def from_dataframe(cls, df):
-        """Convert pandas DataFrame to YFPriceHistory"""
-        data = {}
-        for index, row in df.iterrows():
-            # Handle both Timestamp and datetime index types
-            date_key = (
-                index.to_pydatetime() if hasattr(index, "to_pydatetime") else index
-            )
-            data[date_key] = YFPriceRow(
-                Open=row.get("Open"),
-                High=row.get("High"),
-                Low=row.get("Low"),
-                Close=row.get("Close"),
-                Volume=row.get("Volume"),
-                Dividends=row.get("Dividends", 0.0),
-                **{"Stock Splits": row.get("Stock Splits", 0.0)},
-            )
-        return cls(data=data)
+    def from_dataframe(cls, df, adjusted: bool = True):
+        """Convert a pandas DataFrame to a price block; the frame is not kept"""
+        from src.models.price_block import PriceBlock
+
+        return cls(block=PriceBlock.from_frame(df, adjusted=adjusted))
+
+    @property
+    def data(self) -> Dict[datetime, YFPriceRow]:
+        """Price rows keyed by datetime, built from the block on first access"""
+        if self._rows is None:
+            columns = self.columns()
+            aliases = list(PRICE_COLUMNS)
+            self._rows = {
+                date_key: YFPriceRow.model_validate(dict(zip(aliases, values)))
+                for date_key, *values in zip(
+                    self.dates().to_pydatetime(), *columns.values()
+                )
+            }
+        return self._rows
+
+    def row_count(self) -> int:
+        """Number of price rows"""
+        return len(self.block)
+
+    def dates(self) -> "pd.DatetimeIndex":
+        """Row dates as a DatetimeIndex, in the source time zone"""
+        import pandas as pd
+
+        index = pd.DatetimeIndex(self.block.dates.astype("datetime64[ns]"))
+        return index.tz_localize(self.block.tz) if self.block.tz else index
+
+    def columns(self) -> Dict[str, List]:
+        """
+        Price columns as Python lists, keyed by field name.
+
+        Unparseable values are None. Missing dividend and split columns
+        default to 0.0, like ``YFPriceRow``.
+        """
+        from src.models.price_block import RECORD_COLUMNS
+
+        lists = self.block.column_lists()
+        return {field: lists[column] for column, field in RECORD_COLUMNS.items()}
 
 
 class YFCalendarEvent(BaseModel):
@@ -315,68 +356,112 @@ class YFTickerData(BaseModel):
     calendar: Optional[YFCalendar] = None
     fund_data: Optional[YFFundData] = None
 
+    # Endpoints that were actually requested ("history", "info", ...)
+    fetched_endpoints: List[str] = []
+
     @classmethod
-    def from_yfinance(cls, ticker, symbol: str, exchange: Optional[str] = None):
-        """Create YFTickerData from yfinance.Ticker object"""
-        # Extract info
-        info = getattr(ticker, "info", {})
-        if not info:
-            info = {}
+    def from_payloads(
+        cls,
+        symbol: str,
+        exchange: Optional[str] = None,
+        info: Optional[Dict] = None,
+        history=None,
+        calendar: Optional[Dict] = None,
+        funds_data: Optional[Dict] = None,
+        fetched_endpoints: Optional[List[str]] = None,
+        history_adjusted: bool = True,
+    ):
+        """
+        Create YFTickerData from raw yfinance payloads fetched once each.
+
+        Args:
+            symbol: Ticker symbol
+            exchange: Exchange identifier
+            info: ``Ticker.info`` dict
+            history: ``Ticker.history`` DataFrame
+            calendar: ``Ticker.calendar`` dict
+            funds_data: Dict with ``top_holdings``, ``sector_weightings`` and
+                ``asset_classes`` read from ``Ticker.funds_data``
+            fetched_endpoints: Endpoints that were requested
+            history_adjusted: Whether history was fetched with ``auto_adjust``
+        """
+        info = dict(info or {})
 
         # Add symbol if not present
         if "symbol" not in info:
             info["symbol"] = symbol
 
-        # Parse ticker info
-        ticker_info = YFTickerInfo(**info)
+        result = cls(
+            ticker_symbol=symbol,
+            exchange=exchange,
+            info=YFTickerInfo(**info),
+            fetched_endpoints=fetched_endpoints or [],
+        )
 
-        # Create the model
-        result = cls(ticker_symbol=symbol, exchange=exchange, info=ticker_info)
+        if history is not None and not history.empty:
+            result.price_history = YFPriceHistory.from_dataframe(
+                history, adjusted=history_adjusted
+            )
 
-        # Add price history if available
-        if hasattr(ticker, "history"):
+        if calendar:
             try:
-                history_df = ticker.history
-                if not history_df.empty:
-                    result.price_history = YFPriceHistory.from_dataframe(history_df)
-            except (AttributeError, Exception) as e:
-                pass  # Ignore if history not available
-
-        # Add calendar if available
-        if hasattr(ticker, "calendar"):
+                result.calendar = YFCalendar(**calendar)
+            except Exception:
+                pass  # Ignore malformed calendar data
+
+        if funds_data:
             try:
-                calendar_data = ticker.calendar
-                if calendar_data:
-                    result.calendar = YFCalendar(**calendar_data)
-            except (AttributeError, Exception) as e:
-                pass  # Ignore if calendar not available
-
-        # Add fund data if this is a fund
-        if ticker_info.quote_type in [YFQuoteType.ETF, YFQuoteType.MUTUALFUND]:
+                result.fund_data = YFFundData(
+                    top_holdings=YFHoldings.from_dataframe(
+                        funds_data.get("top_holdings")
+                    ),
+                    sector_weightings=YFSectorWeightings.from_dict(
+                        funds_data.get("sector_weightings")
+                    ),
+                    asset_allocation=YFAssetAllocation.from_dict(
+                        funds_data.get("asset_classes")
+                    ),
+                )
+            except Exception:
+                pass  # Ignore malformed fund data
+
+        return result
+
+    @classmethod
+    def from_yfinance(cls, ticker, symbol: str, exchange: Optional[str] = None):
+        """
+        Create YFTickerData from a yfinance.Ticker object.
+
+        Reads info, calendar and fund data from the ticker (each property
+        triggers its own request). Price history is not included since it
+        needs a date range; ``DataFetcher.fetch_ticker_data`` passes it in.
+        """
+        info = getattr(ticker, "info", {}) or {}
+
+        calendar = None
+        try:
+            calendar = ticker.calendar
+        except Exception:
+            pass  # Ignore if calendar not available
+
+        funds_data = None
+        if info.get("quoteType") in [YFQuoteType.ETF, YFQuoteType.MUTUALFUND]:
             try:
-                if hasattr(ticker, "funds_data"):
-                    fund_data = YFFundData()
-
-                    # Top holdings
-                    if hasattr(ticker.funds_data, "top_holdings"):
-                        fund_data.top_holdings = YFHoldings.from_dataframe(
-                            ticker.funds_data.top_holdings
-                        )
-
-                    # Sector weightings
-                    if hasattr(ticker.funds_data, "sector_weightings"):
-                        fund_data.sector_weightings = YFSectorWeightings.from_dict(
-                            ticker.funds_data.sector_weightings
-                        )
-
-                    # Asset allocation
-                    if hasattr(ticker.funds_data, "asset_allocation"):
-                        fund_data.asset_allocation = YFAssetAllocation.from_dict(
-                            ticker.funds_data.asset_allocation
-                        )
-
-                    result.fund_data = fund_data
-            except (AttributeError, Exception) as e:
+                funds = ticker.funds_data
+                funds_data = {
+                    "top_holdings": funds.top_holdings,
+                    "sector_weightings": funds.sector_weightings,
+                    "asset_classes": funds.asset_classes,
+                }
+            except Exception:
                 pass  # Ignore if fund data not available
 
-        return result
+        return cls.from_payloads(
+            symbol,
+            exchange,
+            info=info,
+            calendar=calendar,
+            funds_data=funds_data,
+            fetched_endpoints=["info", "calendar"]
+            + (["funds_data"] if funds_data else []),
+        )
@@ -0,0 +1,499 @@
+"""
+Asyncio data fetcher for retrieving data from Yahoo Finance concurrently.
+
+Talks to the Yahoo endpoints that yfinance wraps (v8 chart and v10
+quoteSummary) directly over one pooled HTTP/2 client, so hundreds of symbols
+can be in flight at once without a thread per request. Responses are parsed
+the same way yfinance parses them and returned as the same ``YFTickerData``
+models ``DataFetcher`` produces.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pandas as pd
+
+from src.core.logging_config import setup_logging
+from src.core.rate_limiter import RateLimiter, YahooEndpoint, get_rate_limiter
+from src.models.source_models import (
+    YFAssetAllocation,
+    YFCalendar,
+    YFFundData,
+    YFHoldings,
+    YFPriceHistory,
+    YFSectorWeightings,
+    YFTickerData,
+    YFTickerInfo,
+    YFTopHolding,
+)
+from src.services.data_fetcher import DataFetcher
+from src.services.price_coverage import DateRange
+
+logger = setup_logging(name="async_data_fetcher")
+
+_BASE_URL = "https://query2.finance.yahoo.com"
+_CHART_URL = f"{_BASE_URL}/v8/finance/chart"
+_QUOTE_SUMMARY_URL = f"{_BASE_URL}/v10/finance/quoteSummary"
+_COOKIE_URL = "https://fc.yahoo.com"
+_CRUMB_URL = "https://query1.finance.yahoo.com/v1/test/getcrumb"
+
+_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+)
+
+# Same modules yfinance requests for Ticker.info
+_INFO_MODULES = [
+    "financialData",
+    "quoteType",
+    "defaultKeyStatistics",
+    "assetProfile",
+    "summaryDetail",
+]
+_CALENDAR_MODULES = ["calendarEvents"]
+_FUND_MODULES = ["topHoldings"]
+
+_ASSET_CLASS_KEYS = {
+    "cashPosition": "cash",
+    "stockPosition": "stock",
+    "bondPosition": "bond",
+    "preferredPosition": "preferred",
+    "convertiblePosition": "convertible",
+    "otherPosition": "other",
+}
+
+
+class YahooRateLimitError(Exception):
+    """Raised when Yahoo responds with HTTP 429."""
+
+
+@dataclass
+class FetchRequest:
+    """What to fetch for a single ticker."""
+
+    symbol: str
+    exchange: str
+    start_date: date
+    quote_type: Optional[str] = None
+    history: bool = True
+    info: bool = True
+    calendar: bool = True
+    fund_data: bool = True
+    # False to keep Yahoo's unadjusted closes (dividends are then adjusted
+    # against the stored prices)
+    adjusted_history: bool = True
+    # Ranges to request history for, one chart request each (default: from
+    # ``start_date`` through today)
+    history_ranges: Optional[List[DateRange]] = None
+
+
+class AsyncDataFetcher:
+    """
+    Fetches financial data for many tickers concurrently with asyncio.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 50,
+        rate_limiter: Optional[RateLimiter] = None,
+        timeout: float = 10.0,
+        max_retries: int = 3,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize the async data fetcher.
+
+        Args:
+            max_concurrency: Maximum requests in flight (and pooled connections)
+            rate_limiter: Rate limiter to pace requests with (default: the
+                process-wide limiter shared with ``DataFetcher``)
+            timeout: Per-request timeout in seconds
+            max_retries: Maximum retry attempts for rate limiting
+            transport: Optional httpx transport (used to stub Yahoo offline)
+        """
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.transport = transport
+
+        # Reuse the symbol formatting and start date rules of the sync fetcher
+        self.sync_fetcher = DataFetcher(rate_limiter=self.rate_limiter)
+
+        self._crumb: Optional[str] = None
+
+    def fetch_all(self, requests: List[FetchRequest]) -> Dict[str, Optional[YFTickerData]]:
+        """
+        Fetch data for many tickers, blocking until all are done.
+
+        Args:
+            requests: One fetch request per ticker
+
+        Returns:
+            Dict mapping ticker symbol to its data, or None if the fetch failed
+        """
+        return asyncio.run(self.fetch_many(requests))
+
+    async def fetch_many(
+        self, requests: List[FetchRequest]
+    ) -> Dict[str, Optional[YFTickerData]]:
+        """
+        Fetch data for many tickers concurrently over one connection pool.
+
+        Args:
+            requests: One fetch request per ticker
+
+        Returns:
+            Dict mapping ticker symbol to its data, or None if the fetch failed
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        crumb_lock = asyncio.Lock()
+        self._crumb = None
+
+        limits = httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency,
+        )
+        async with httpx.AsyncClient(
+            http2=self.transport is None,
+            limits=limits,
+            timeout=self.timeout,
+            follow_redirects=True,
+            headers={"User-Agent": _USER_AGENT},
+            transport=self.transport,
+        ) as client:
+            results = await asyncio.gather(
+                *[
+                    self._fetch_ticker(client, semaphore, crumb_lock, request)
+                    for request in requests
+                ]
+            )
+
+        fetched = {request.symbol: result for request, result in zip(requests, results)}
+        logger.info(
+            f"Async fetched data for "
+            f"{sum(1 for r in results if r is not None)}/{len(requests)} tickers"
+        )
+        return fetched
+
+    async def _fetch_ticker(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        crumb_lock: asyncio.Lock,
+        request: FetchRequest,
+    ) -> Optional[YFTickerData]:
+        """Fetch and parse every requested endpoint for one ticker."""
+        symbol = request.symbol
+        yahoo_symbol = self.sync_fetcher.format_yahoo_ticker(symbol, request.exchange)
+        is_fund = (request.quote_type or "").upper() in ["ETF", "MUTUALFUND"]
+
+        modules = []
+        if request.info:
+            modules += _INFO_MODULES
+        if request.calendar:
+            modules += _CALENDAR_MODULES
+        if request.fund_data and is_fund:
+            modules += _FUND_MODULES
+
+        ranges = []
+        if request.history:
+            ranges = request.history_ranges or [
+                DateRange(start=request.start_date, end=date.today())
+            ]
+
+        try:
+            tasks = [
+                self._fetch_chart(client, semaphore, yahoo_symbol, r.start, r.end)
+                for r in ranges
+            ]
+            if modules:
+                tasks.append(
+                    self._fetch_quote_summary(
+                        client, semaphore, crumb_lock, yahoo_symbol, modules
+                    )
+                )
+            responses = await asyncio.gather(*tasks)
+        except Exception as e:
+            logger.error(f"Failed to fetch data for {symbol}: {e}")
+            return None
+
+        charts = responses[: len(ranges)]
+        summary = responses[len(ranges)] if modules else {}
+
+        info = self._parse_info(summary, yahoo_symbol) if request.info else {}
+        info["symbol"] = info.get("symbol") or symbol
+
+        fetched = []
+        if request.history:
+            fetched.append(YahooEndpoint.HISTORY.value)
+        if request.info:
+            fetched.append(YahooEndpoint.INFO.value)
+        if request.calendar:
+            fetched.append(YahooEndpoint.CALENDAR.value)
+        if request.fund_data and is_fund:
+            fetched.append(YahooEndpoint.FUNDS_DATA.value)
+
+        result = YFTickerData(
+            ticker_symbol=symbol,
+            exchange=request.exchange,
+            info=YFTickerInfo(**info),
+            fetched_endpoints=fetched,
+        )
+
+        if charts:
+            frames = [
+                self._parse_chart(chart, adjusted=request.adjusted_history)
+                for chart in charts
+            ]
+            history_df = frames[0]
+            if len(frames) > 1:
+                history_df = pd.concat(frames).sort_index()
+                history_df = history_df[~history_df.index.duplicated(keep="last")]
+            if history_df.empty:
+                logger.warning(f"No historical data returned for {symbol}")
+            else:
+                result.price_history = YFPriceHistory.from_dataframe(
+                    history_df, adjusted=request.adjusted_history
+                )
+
+        calendar = self._parse_calendar(summary) if request.calendar else None
+        if calendar:
+            result.calendar = YFCalendar(**calendar)
+
+        if request.fund_data and is_fund and summary.get("topHoldings"):
+            result.fund_data = self._parse_fund_data(summary["topHoldings"])
+
+        return result
+
+    async def _get_json(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        endpoint: YahooEndpoint,
+        url: str,
+        params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """GET a Yahoo endpoint through its rate limit bucket, retrying 429s."""
+        for attempt in range(self.max_retries + 1):
+            await asyncio.sleep(self.rate_limiter.reserve(endpoint))
+
+            async with semaphore:
+                response = await client.get(url, params=params)
+
+            if response.status_code == 429:
+                if attempt < self.max_retries:
+                    self.rate_limiter.on_throttle(endpoint)
+                    continue
+                raise YahooRateLimitError(f"Too Many Requests from {url}")
+
+            response.raise_for_status()
+            self.rate_limiter.on_success(endpoint)
+            return response.json()
+
+    async def _fetch_chart(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        yahoo_symbol: str,
+        start_date: date,
+        end_date: date,
+    ) -> Dict[str, Any]:
+        """Fetch daily OHLCV history with dividend and split events, end day included."""
+        end_date = end_date + timedelta(days=1)  # Include the last day
+        params = {
+            "period1": _to_timestamp(start_date),
+            "period2": _to_timestamp(end_date),
+            "interval": "1d",
+            "includePrePost": "false",
+            "events": "div,splits",
+        }
+        data = await self._get_json(
+            client, semaphore, YahooEndpoint.HISTORY, f"{_CHART_URL}/{yahoo_symbol}", params
+        )
+        return (data.get("chart", {}).get("result") or [{}])[0]
+
+    async def _fetch_quote_summary(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        crumb_lock: asyncio.Lock,
+        yahoo_symbol: str,
+        modules: List[str],
+    ) -> Dict[str, Any]:
+        """Fetch quoteSummary modules in a single request."""
+        async with crumb_lock:
+            if self._crumb is None:
+                self._crumb = await self._fetch_crumb(client)
+
+        params = {
+            "modules": ",".join(modules),
+            "corsDomain": "finance.yahoo.com",
+            "formatted": "false",
+            "symbol": yahoo_symbol,
+            "crumb": self._crumb,
+        }
+        data = await self._get_json(
+            client,
+            semaphore,
+            YahooEndpoint.INFO,
+            f"{_QUOTE_SUMMARY_URL}/{yahoo_symbol}",
+            params,
+        )
+        return (data.get("quoteSummary", {}).get("result") or [{}])[0]
+
+    @staticmethod
+    async def _fetch_crumb(client: httpx.AsyncClient) -> str:
+        """Obtain the session cookie and crumb quoteSummary requires."""
+        # fc.yahoo.com answers 404 but sets the session cookie
+        await client.get(_COOKIE_URL)
+        response = await client.get(_CRUMB_URL)
+        response.raise_for_status()
+
+        crumb = response.text.strip()
+        if not crumb or "<" in crumb:
+            raise ValueError("Failed to obtain Yahoo Finance crumb")
+        return crumb
+
+    @staticmethod
+    def _parse_chart(chart: Dict[str, Any], adjusted: bool = True) -> pd.DataFrame:
+        """
+        Build a history frame like ``Ticker.history``, auto-adjusted unless
+        ``adjusted`` is False.
+        """
+        columns = ["Open", "High", "Low", "Close", "Volume", "Dividends", "Stock Splits"]
+        timestamps = chart.get("timestamp") or []
+        if not timestamps:
+            return pd.DataFrame(columns=columns)
+
+        tz = chart.get("meta", {}).get("exchangeTimezoneName") or "America/New_York"
+        quote = chart["indicators"]["quote"][0]
+        index = pd.to_datetime(timestamps, unit="s", utc=True).tz_convert(tz).normalize()
+
+        df = pd.DataFrame(
+            {
+                "Open": quote.get("open"),
+                "High": quote.get("high"),
+                "Low": quote.get("low"),
+                "Close": quote.get("close"),
+                "Volume": quote.get("volume"),
+            },
+            index=index,
+            dtype=float,
+        )
+
+        # auto_adjust=True: scale OHLC by the adjusted/raw close ratio
+        adjclose = (chart["indicators"].get("adjclose") or [{}])[0].get("adjclose")
+        if adjclose and adjusted:
+            ratio = pd.Series(adjclose, index=index, dtype=float) / df["Close"]
+            for column in ["Open", "High", "Low"]:
+                df[column] = df[column] * ratio
+            df["Close"] = pd.Series(adjclose, index=index, dtype=float)
+
+        events = chart.get("events", {})
+        df["Dividends"] = 0.0
+        for event in events.get("dividends", {}).values():
+            day = pd.Timestamp(event["date"], unit="s", tz="UTC").tz_convert(tz).normalize()
+            if day in df.index:
+                df.loc[day, "Dividends"] = float(event["amount"])
+
+        df["Stock Splits"] = 0.0
+        for event in events.get("splits", {}).values():
+            day = pd.Timestamp(event["date"], unit="s", tz="UTC").tz_convert(tz).normalize()
+            if day in df.index and event.get("denominator"):
+                df.loc[day, "Stock Splits"] = event["numerator"] / event["denominator"]
+
+        df = df[~df.index.duplicated(keep="last")].dropna(subset=["Close"])
+        return df.astype(object).where(df.notna(), None)
+
+    @staticmethod
+    def _parse_info(summary: Dict[str, Any], yahoo_symbol: str) -> Dict[str, Any]:
+        """Flatten quoteSummary modules into a dict like ``Ticker.info``."""
+        info = {}
+        for module in _INFO_MODULES:
+            values = summary.get(module)
+            if not isinstance(values, dict):
+                continue
+            for key, value in values.items():
+                # Yahoo sends {} for a field it has no value for; zeros and
+                # False are real values
+                if value is None or value == {}:
+                    continue
+                if isinstance(value, dict) and "raw" in value:
+                    value = value["raw"]
+                elif isinstance(value, str):
+                    value = value.replace("\xa0", " ")
+                info[key] = value
+
+        info["symbol"] = yahoo_symbol
+        return info
+
+    @staticmethod
+    def _parse_calendar(summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse calendarEvents like ``Ticker.calendar``."""
+        events = summary.get("calendarEvents")
+        if not events:
+            return {}
+
+        calendar = {}
+        if "dividendDate" in events:
+            calendar["Dividend Date"] = datetime.fromtimestamp(
+                events["dividendDate"], tz=timezone.utc
+            ).date()
+        if "exDividendDate" in events:
+            calendar["Ex-Dividend Date"] = datetime.fromtimestamp(
+                events["exDividendDate"], tz=timezone.utc
+            ).date()
+
+        earnings = events.get("earnings")
+        if earnings is not None:
+            calendar["Earnings Date"] = [
+                datetime.fromtimestamp(d, tz=timezone.utc)
+                for d in earnings.get("earningsDate", [])
+            ]
+            calendar["Earnings High"] = earnings.get("earningsHigh")
+            calendar["Earnings Low"] = earnings.get("earningsLow")
+            calendar["Earnings Average"] = earnings.get("earningsAverage")
+            calendar["Revenue High"] = earnings.get("revenueHigh")
+            calendar["Revenue Low"] = earnings.get("revenueLow")
+            calendar["Revenue Average"] = earnings.get("revenueAverage")
+
+        return calendar
+
+    @staticmethod
+    def _parse_fund_data(top_holdings: Dict[str, Any]) -> YFFundData:
+        """Parse the topHoldings module into fund holdings and weightings."""
+        holdings = {}
+        for holding in top_holdings.get("holdings", []):
+            symbol = holding.get("symbol")
+            if not symbol:
+                continue
+            holdings[symbol] = YFTopHolding(
+                Symbol=symbol,
+                Name=holding.get("holdingName") or "Unknown",
+                **{"Holding Percent": holding.get("holdingPercent", 0.0)},
+            )
+
+        sectors = {}
+        for weighting in top_holdings.get("sectorWeightings", []):
+            sectors.update(weighting)
+
+        assets = {
+            name: top_holdings[key]
+            for key, name in _ASSET_CLASS_KEYS.items()
+            if top_holdings.get(key) is not None
+        }
+
+        return YFFundData(
+            top_holdings=YFHoldings(holdings=holdings),
+            sector_weightings=YFSectorWeightings.from_dict(sectors),
+            asset_allocation=YFAssetAllocation.from_dict(assets),
+        )
+
+
+def _to_timestamp(day: date) -> int:
+    """Convert a date to a UTC midnight Unix timestamp."""
+    return int(datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp())
@@ -0,0 +1,170 @@
+"""
+Batch writer for cross-ticker historical price upserts.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.core.instrumentation import incr, span
+from src.core.logging_config import setup_logging
+from src.models.db_models import DBHistoricalPrice
+from src.models.records import as_row, row_width
+
+logger = setup_logging(name="batch_writer")
+
+
+class BatchedPriceWriter:
+    """
+    Collects historical price rows from many tickers and upserts them in
+    size-bounded multi-ticker batches.
+
+    A batch is flushed as soon as it reaches ``max_rows`` rows or
+    ``max_bytes`` of payload, estimated with ``row_width``. Each ticker's
+    outcome is tracked separately: if a multi-ticker upsert fails, its
+    tickers are retried one at a time so a single bad ticker does not fail
+    the whole batch.
+    """
+
+    def __init__(
+        self, supabase_client, max_rows: int = 1000, max_bytes: int = 1_000_000
+    ):
+        """
+        Initialize the batch writer.
+
+        Args:
+            supabase_client: Supabase client for database operations
+            max_rows: Maximum rows per upsert request
+            max_bytes: Maximum serialized payload size per upsert request
+        """
+        self.supabase = supabase_client
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+
+        self.lock = threading.Lock()
+        self.pending: List[Tuple[str, Dict[str, Any]]] = []
+        self.pending_bytes = 0
+
+        # Per-symbol outcome: None on success, error message on failure
+        self.outcomes: Dict[str, Optional[str]] = {}
+        self.rows_written: Dict[str, int] = defaultdict(int)
+        self.request_count = 0
+
+    def add(
+        self, symbol: str, prices: List[Union[DBHistoricalPrice, Dict[str, Any]]]
+    ) -> int:
+        """
+        Queue price rows for a ticker, flushing if the batch is full.
+
+        Args:
+            symbol: Ticker symbol the rows belong to
+            prices: List of price models or upsert-ready records to save
+
+        Returns:
+            Number of rows queued
+        """
+        if not prices:
+            return 0
+
+        rows = [as_row(p) for p in prices]
+        row_bytes = row_width(rows)
+        incr("bytes.historical_prices", len(rows) * row_bytes)
+        batches = []
+
+        with self.lock:
+            self.outcomes.setdefault(symbol, None)
+            for row in rows:
+                self.pending.append((symbol, row))
+                self.pending_bytes += row_bytes
+
+                if (
+                    len(self.pending) >= self.max_rows
+                    or self.pending_bytes >= self.max_bytes
+                ):
+                    batches.append(self._take_pending())
+
+        # Write outside the lock so other workers can keep queueing
+        for batch in batches:
+            self._write_batch(batch)
+
+        return len(rows)
+
+    def flush(self) -> Dict[str, Optional[str]]:
+        """
+        Write all queued rows.
+
+        Returns:
+            Per-symbol outcomes for every symbol queued so far
+        """
+        with self.lock:
+            batch = self._take_pending()
+
+        if batch:
+            self._write_batch(batch)
+
+        return dict(self.outcomes)
+
+    def _take_pending(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Detach the pending batch. Caller must hold the lock."""
+        batch = self.pending
+        self.pending = []
+        self.pending_bytes = 0
+        return batch
+
+    def _write_batch(self, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Upsert a multi-ticker batch, isolating failures per ticker."""
+        if not batch:
+            return
+
+        symbols = {symbol for symbol, _ in batch}
+
+        try:
+            self._upsert([row for _, row in batch])
+            self._record_success(batch)
+            logger.info(
+                f"Saved {len(batch)} price records for {len(symbols)} tickers"
+            )
+            return
+        except Exception as e:
+            logger.warning(
+                f"Batch upsert of {len(batch)} rows failed, retrying per ticker: {e}"
+            )
+
+        rows_by_symbol = defaultdict(list)
+        for symbol, row in batch:
+            rows_by_symbol[symbol].append((symbol, row))
+
+        for symbol, symbol_batch in rows_by_symbol.items():
+            try:
+                self._upsert([row for _, row in symbol_batch])
+                self._record_success(symbol_batch)
+            except Exception as e:
+                logger.error(f"Failed to save price data for {symbol}: {e}")
+                with self.lock:
+                    self.outcomes[symbol] = str(e)
+
+    def _upsert(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Upsert rows to historical_prices.
+
+        PostgREST bulk upserts require every object to have the same keys, so
+        rows are grouped by key set (``exclude_none`` drops different columns
+        for different rows).
+        """
+        rows_by_keys = defaultdict(list)
+        for row in rows:
+            rows_by_keys[frozenset(row)].append(row)
+
+        for key_rows in rows_by_keys.values():
+            with span("save.historical_prices"):
+                self.supabase.table("historical_prices").upsert(
+                    key_rows, on_conflict="ticker_id,date"
+                ).execute()
+            incr("rows.historical_prices", len(key_rows))
+            with self.lock:
+                self.request_count += 1
+
+    def _record_success(self, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        with self.lock:
+            for symbol, _ in batch:
+                self.rows_written[symbol] += 1
@@ -0,0 +1,167 @@
+"""
+Change detection for rows the pipeline rewrites on every run.
+
+The tracker keeps a fingerprint of every column last persisted for a row
+(``tickers`` by id, ``yh_finance_daily`` by ticker id), seeded from the
+database at the start of each run and updated by the run's writes. Before a
+write, only the columns whose fingerprint differs are kept, so changed rows
+send just the columns that moved. Unchanged rows are not rewritten; their
+``updated_at`` is bumped in bulk at the end of the run instead, so freshness
+checks still see them as current.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Iterable
+
+from src.core.logging_config import setup_logging
+
+logger = setup_logging(name="change_tracker")
+
+# Columns that change on every write or identify the row, never compared
+IGNORED_COLUMNS = {"id", "created_at", "updated_at"}
+
+
+def _normalize(value: Any) -> Any:
+    """Make values read back from the database compare equal to fresh ones."""
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        # Numeric columns come back as int or float regardless of what was sent
+        return round(float(value), 8)
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def fingerprint(value: Any) -> bytes:
+    """Short hash of a column value."""
+    encoded = json.dumps(_normalize(value), sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=8).digest()
+
+
+class ChangeTracker:
+    """
+    Per-column fingerprints of the last persisted version of each row.
+
+    Bounded to ``max_rows`` rows per table, least recently used first out;
+    a row that is not tracked is always written in full.
+    """
+
+    def __init__(self, max_rows: int = 20000):
+        """
+        Initialize the tracker.
+
+        Args:
+            max_rows: Rows to keep fingerprints for, per table
+        """
+        self.max_rows = max_rows
+        self.lock = threading.Lock()
+        self.rows: Dict[str, "OrderedDict[str, Dict[str, bytes]]"] = defaultdict(
+            OrderedDict
+        )
+        self.counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+        # updated_at of rows whose write was skipped, per table and key
+        self.unchanged: Dict[str, Dict[str, str]] = defaultdict(dict)
+
+    def reset(self) -> None:
+        """
+        Drop all fingerprints and pending freshness updates, keeping counts.
+
+        Rows may have been edited outside the pipeline between runs, so each
+        run compares against rows it reads back, not a warm container's
+        memory of earlier runs.
+        """
+        with self.lock:
+            self.rows.clear()
+            self.unchanged.clear()
+
+    def is_tracked(self, table: str, key: str) -> bool:
+        """Whether fingerprints are known for a row."""
+        with self.lock:
+            return key in self.rows[table]
+
+    def changed_columns(
+        self, table: str, key: str, row: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Keep only the columns of a row that differ from what was persisted.
+
+        Args:
+            table: Table the row is written to
+            key: Row key (ticker ID)
+            row: Columns about to be written
+
+        Returns:
+            The changed columns (all compared columns for an untracked row);
+            ignored columns are left out
+        """
+        compared = {k: v for k, v in row.items() if k not in IGNORED_COLUMNS}
+
+        with self.lock:
+            stored = self.rows[table].get(key)
+            if stored is None:
+                return compared
+            self.rows[table].move_to_end(key)
+
+        return {k: v for k, v in compared.items() if stored.get(k) != fingerprint(v)}
+
+    def remember(
+        self, table: str, key: str, row: Dict[str, Any], replace: bool = False
+    ) -> None:
+        """
+        Record columns as persisted for a row, keeping earlier columns.
+
+        Args:
+            table: Table the row was written to or read from
+            key: Row key (ticker ID)
+            row: Persisted columns
+            replace: Drop the row's earlier columns (``row`` is all of it)
+        """
+        fingerprints = {
+            k: fingerprint(v) for k, v in row.items() if k not in IGNORED_COLUMNS
+        }
+        with self.lock:
+            rows = self.rows[table]
+            if not replace:
+                fingerprints = {**rows.get(key, {}), **fingerprints}
+            rows[key] = fingerprints
+            rows.move_to_end(key)
+            while len(rows) > self.max_rows:
+                rows.popitem(last=False)
+
+    def forget(self, table: str, key: str) -> None:
+        """Drop a row's fingerprints, e.g. after a failed write."""
+        with self.lock:
+            self.rows[table].pop(key, None)
+
+    def forget_all(self, table: str, keys: Iterable[str]) -> None:
+        """Drop the fingerprints of several rows."""
+        with self.lock:
+            for key in keys:
+                self.rows[table].pop(key, None)
+
+    def mark_unchanged(self, table: str, key: str, updated_at: str) -> None:
+        """Note a row whose write was skipped, to bump its ``updated_at``."""
+        with self.lock:
+            self.unchanged[table][key] = updated_at
+
+    def take_unchanged(self) -> Dict[str, Dict[str, str]]:
+        """Rows noted by ``mark_unchanged`` since the last call, per table."""
+        with self.lock:
+            unchanged = {table: keys for table, keys in self.unchanged.items() if keys}
+            self.unchanged.clear()
+            return unchanged
+
+    def count(self, table: str, outcome: str, n: int = 1) -> None:
+        """Count a write outcome ("written", "skipped", "columns_sent", ...)."""
+        with self.lock:
+            self.counts[table][outcome] += n
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Write outcome counts per table since the tracker was created."""
+        with self.lock:
+            return {table: dict(counts) for table, counts in self.counts.items()}
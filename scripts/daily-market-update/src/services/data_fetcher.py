@@ -2,29 +2,117 @@
 Data fetcher module for retrieving data from Yahoo Finance.
 """
 
-import yfinance as yf
 import time
-import random
+
+import requests
+import yfinance as yf
+import pandas as pd
+from requests.adapters import HTTPAdapter
 from datetime import date, timedelta
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional
+from pydantic import BaseModel
 
+from src.core.concurrency import ConcurrencyController
+from src.core.instrumentation import get_instrumentation, incr, span
 from src.core.logging_config import setup_logging
+from src.core.market_calendar import market_time
+from src.events.event_processor import PipelineConfig
+from src.core.rate_limiter import RateLimiter, YahooEndpoint, get_rate_limiter
 from src.models.source_models import YFTickerData, YFPriceHistory
+from src.services.price_coverage import DateRange
+from src.services.response_cache import ResponseCache
 
 logger = setup_logging(name="data_fetcher")
 
+FUND_QUOTE_TYPES = ["ETF", "MUTUALFUND"]
+
+# Where backfills without an explicit start date begin
+BACKFILL_START_DATE = date(2020, 1, 1)
+
+# yfinance's error for a range with no sessions (or a delisted symbol)
+NO_PRICE_DATA = "symbol may be delisted"
+
+
+def create_http_session(pool_maxsize: int = 20) -> requests.Session:
+    """
+    Create a pooled HTTP session for yfinance requests.
+
+    The pool is sized for the parallel workers and bulk download threads,
+    which all talk to the same Yahoo hosts.
+
+    Args:
+        pool_maxsize: Connections kept open per host
+
+    Returns:
+        requests Session to pass to ``DataFetcher``
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class FetchPlan(BaseModel):
+    """Which Yahoo Finance endpoints to request for a ticker."""
+
+    history: bool = True
+    info: bool = True
+    calendar: bool = True
+    funds_data: bool = True
+
+    @classmethod
+    def from_config(
+        cls, config: PipelineConfig, quote_type: Optional[str] = None
+    ) -> "FetchPlan":
+        """
+        Build the plan a pipeline configuration needs for a ticker.
+
+        Args:
+            config: Pipeline configuration with processing flags
+            quote_type: Stored quote type of the ticker, if known
+
+        Returns:
+            Fetch plan requesting only the endpoints the enabled stages use
+        """
+        # Fund data is only saved for funds, and the processor checks Yahoo's
+        # quote type from info before saving it
+        funds_data = (
+            config.process_fund_data
+            and (quote_type or "").upper() in FUND_QUOTE_TYPES
+        )
+        return cls(
+            history=config.process_prices,
+            info=config.process_info or funds_data,
+            calendar=config.process_calendar,
+            funds_data=funds_data,
+        )
+
+    def endpoints(self) -> List[str]:
+        """Names of the endpoints the plan requests."""
+        return [name for name, enabled in self.model_dump().items() if enabled]
+
 
 class DataFetcher:
     """
     Fetches financial data from Yahoo Finance.
     """
 
-    def __init__(self, rate_limit_delay: float = 0.2):
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
         """
         Initialize the data fetcher.
 
         Args:
-            rate_limit_delay: Minimum delay between requests (seconds)
+            rate_limiter: Rate limiter to pace requests with (default: the
+                process-wide limiter shared by every fetcher)
+            session: HTTP session for yfinance requests (default: yfinance's
+                own session)
+            cache: Response cache for per-ticker requests (default: none)
         """
         self.exchange_map = {
             "NASDAQ": "",
@@ -37,21 +125,183 @@ class DataFetcher:
             "HKEX": ".HK",
             "SSE": ".SS",
         }
-        self.last_request_time = 0
-        self.rate_limit_delay = rate_limit_delay
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.session = session
+        self.cache = cache
+
+        # Controller told about each request while a run adapts its
+        # concurrency (set by the pipeline for the duration of the run)
+        self.concurrency: Optional[ConcurrencyController] = None
+
+    @staticmethod
+    def _is_rate_limited(error: Exception) -> bool:
+        """Whether an exception is Yahoo's "too many requests" response."""
+        if isinstance(error, requests.exceptions.JSONDecodeError):
+            # yfinance parses the chart response without checking the status,
+            # so a 429 surfaces as its plain-text body failing to decode
+            return True
+        message = str(error).lower()
+        return "too many requests" in message or "429" in message
+
+    def _call(
+        self,
+        endpoint: YahooEndpoint,
+        symbol: str,
+        request: Callable[[], Any],
+        max_retries: int = 3,
+        best_effort: bool = False,
+    ) -> Any:
+        """
+        Run a Yahoo Finance request through the endpoint's rate limit bucket.
+
+        Throttled requests are reported to the limiter, which lowers the
+        endpoint's rate and pauses it, and are retried once a token is
+        available again. Other errors are raised to the caller.
+
+        Args:
+            endpoint: Endpoint class the request hits
+            symbol: Ticker symbol (for logging)
+            request: Callable performing the request
+            max_retries: Maximum retry attempts for rate limiting
+            best_effort: Failures are expected (e.g. no calendar for an
+                index), so they don't count towards the concurrency
+                controller's error rate; throttles still do
+
+        Returns:
+            Whatever the request returns
+        """
+        for attempt in range(max_retries + 1):
+            started = time.monotonic()
+            wait = self.rate_limiter.acquire(endpoint)
+            get_instrumentation().record(f"rate_limit_wait.{endpoint.value}", wait)
+            incr(f"requests.{endpoint.value}")
+            try:
+                with span(f"fetch.{endpoint.value}"):
+                    result = request()
+            except Exception as e:
+                throttled = self._is_rate_limited(e)
+                self._observe(
+                    started,
+                    throttled=throttled,
+                    error=not throttled and not best_effort,
+                )
+                if throttled and attempt < max_retries:
+                    incr(f"throttles.{endpoint.value}")
+                    self.rate_limiter.on_throttle(endpoint)
+                    logger.warning(
+                        f"Rate limited on {endpoint.value} for {symbol}, "
+                        f"retry {attempt + 1}/{max_retries}"
+                    )
+                    continue
+                raise
+
+            self._observe(started)
+            self.rate_limiter.on_success(endpoint)
+            return result
+
+    def _observe(
+        self, started: float, throttled: bool = False, error: bool = False
+    ) -> None:
+        """Report a request's latency and outcome to the concurrency controller."""
+        if self.concurrency is not None:
+            self.concurrency.observe(
+                time.monotonic() - started, throttled=throttled, error=error
+            )
+
+    def _cached(
+        self,
+        endpoint: YahooEndpoint,
+        yahoo_symbol: str,
+        request: Callable[[], Any],
+        params: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+    ) -> Any:
+        """
+        Serve a response from the cache, or make the request and cache it.
+
+        Empty responses (None, empty DataFrames) are not cached.
+        """
+        if not self.cache or not use_cache:
+            return request()
+
+        cached = self.cache.get(yahoo_symbol, endpoint, params)
+        if cached is not None:
+            return cached
+
+        result = request()
+        if result is not None and not getattr(result, "empty", False):
+            self.cache.put(yahoo_symbol, endpoint, result, params)
+        return result
+
+    @staticmethod
+    def _request_history(
+        ticker: yf.Ticker, start: date, end: date, auto_adjust: bool
+    ) -> pd.DataFrame:
+        """
+        Request daily history with yfinance's errors raised.
+
+        Left to itself yfinance logs a failed request, a 429 included, and
+        returns an empty frame, which reads as a range without sessions. With
+        ``raise_errors`` a range that really has no sessions raises as well,
+        so that case alone is turned back into an empty frame.
+        """
+        try:
+            return ticker.history(
+                start=start, end=end, auto_adjust=auto_adjust, raise_errors=True
+            )
+        except Exception as e:
+            if NO_PRICE_DATA in str(e) and "status_code" not in str(e):
+                return pd.DataFrame()
+            raise
+
+    def _fetch_history(
+        self,
+        ticker: yf.Ticker,
+        symbol: str,
+        yahoo_symbol: str,
+        ranges: List[DateRange],
+        max_retries: int,
+        use_cache: bool,
+        auto_adjust: bool = True,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Fetch daily history for each range and combine the results.
 
-    def _respect_rate_limits(self) -> None:
-        """Apply rate limiting between requests."""
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
+        Returns:
+            Combined history frame in date order, or None if nothing came back
+        """
+        frames = []
+        for date_range in ranges:
+            end_date = date_range.end + timedelta(days=1)  # Include the last day
+            frame = self._cached(
+                YahooEndpoint.HISTORY,
+                yahoo_symbol,
+                lambda: self._call(
+                    YahooEndpoint.HISTORY,
+                    symbol,
+                    lambda: self._request_history(
+                        ticker, date_range.start, end_date, auto_adjust
+                    ),
+                    max_retries,
+                ),
+                params={
+                    "start": date_range.start,
+                    "end": end_date,
+                    "auto_adjust": auto_adjust,
+                },
+                use_cache=use_cache,
+            )
+            if frame is not None and not frame.empty:
+                incr("rows.history", len(frame))
+                frames.append(frame)
 
-        if elapsed < self.rate_limit_delay:
-            # Need to wait to respect rate limit
-            sleep_time = self.rate_limit_delay - elapsed
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
+        if not frames:
+            return None
+        if len(frames) == 1:
+            return frames[0]
 
-        self.last_request_time = time.time()
+        combined = pd.concat(frames).sort_index()
+        return combined[~combined.index.duplicated(keep="last")]
 
     def format_yahoo_ticker(self, symbol: str, exchange: str) -> str:
         """
@@ -75,87 +325,283 @@ class DataFetcher:
 
         return f"{symbol}{suffix}"
 
+    def _fetch_optional(
+        self,
+        endpoint: YahooEndpoint,
+        symbol: str,
+        request: Callable[[], Any],
+        max_retries: int = 3,
+    ) -> Any:
+        """
+        Fetch an optional endpoint through the limiter, ignoring failures.
+
+        Calendar and fund data are best-effort, so errors here must not fail
+        the whole ticker, nor count against the concurrency controller (many
+        tickers simply have no calendar or fund data).
+
+        Returns:
+            The response, or None if the request failed
+        """
+        try:
+            return self._call(
+                endpoint, symbol, request, max_retries, best_effort=True
+            )
+        except Exception as e:
+            logger.debug(f"No {endpoint.value} data for {symbol}: {e}")
+            return None
+
+    @staticmethod
+    def _read_funds_data(funds) -> Dict[str, Any]:
+        """Read the fund payloads, which yfinance loads in a single request."""
+        return {
+            "top_holdings": funds.top_holdings,
+            "sector_weightings": funds.sector_weightings,
+            "asset_classes": funds.asset_classes,
+        }
+
     def fetch_ticker_data(
-        self, symbol: str, exchange: str, start_date: date, max_retries: int = 3
+        self,
+        symbol: str,
+        exchange: str,
+        start_date: date,
+        max_retries: int = 3,
+        plan: Optional[FetchPlan] = None,
+        use_cache: bool = True,
+        history_ranges: Optional[List[DateRange]] = None,
+        adjusted_history: bool = True,
     ) -> Optional[YFTickerData]:
         """
-        Fetch all relevant data for a ticker from Yahoo Finance.
+        Fetch the relevant data for a ticker from Yahoo Finance.
+
+        Each endpoint in the plan is requested exactly once; endpoints left
+        out of the plan are never touched.
 
         Args:
             symbol: Ticker symbol
             exchange: Exchange identifier
             start_date: Start date for historical data
             max_retries: Maximum retry attempts for rate limiting
+            plan: Endpoints to request (default: all of them)
+            use_cache: Whether to use the response cache, if one is set
+            history_ranges: Ranges to request history for, one request each
+                (default: from ``start_date`` through today)
+            adjusted_history: Whether to request history adjusted for
+                dividends (``auto_adjust``); unadjusted history is adjusted by
+                the processor against the stored prices
 
         Returns:
             YFTickerData object with all fetched data, or None if failed
         """
+        plan = plan or FetchPlan()
         yahoo_symbol = self.format_yahoo_ticker(symbol, exchange)
-        logger.info(f"Fetching data for {symbol} ({yahoo_symbol}) from {start_date}")
-
-        # Apply rate limiting
-        self._respect_rate_limits()
-
-        # Try to fetch with retries for rate limiting
-        for attempt in range(max_retries + 1):
-            try:
-                # Create YFinance ticker object
-                ticker = yf.Ticker(yahoo_symbol)
-
-                # TODO: Refine Flow
-                # Fetch history data explicitly with proper parameters
-                history_data = ticker.history(
-                    start=start_date,
-                    end=date.today() + timedelta(days=1),  # Include today
-                    auto_adjust=True,
+        logger.info(
+            f"Fetching data for {symbol} ({yahoo_symbol}) from {start_date}",
+            extra={"fetch_plan": plan.endpoints()},
+        )
+
+        try:
+            # Create YFinance ticker object
+            ticker = yf.Ticker(yahoo_symbol, session=self.session)
+            fetched = []
+
+            history_data = None
+            if plan.history:
+                ranges = history_ranges or [
+                    DateRange(start=start_date, end=date.today())
+                ]
+                history_data = self._fetch_history(
+                    ticker,
+                    symbol,
+                    yahoo_symbol,
+                    ranges,
+                    max_retries,
+                    use_cache,
+                    auto_adjust=adjusted_history,
                 )
+                fetched.append(YahooEndpoint.HISTORY.value)
 
                 # Check if we received valid data
                 if history_data is None or history_data.empty:
                     logger.warning(f"No historical data returned for {symbol}")
-                # Convert to our structured model (the method in the fetcher doesn't work....)
-                # We should try to get all the data here and then drop it into the model
-                result = YFTickerData.from_yfinance(
-                    ticker=ticker,
-                    symbol=symbol,
-                    exchange=exchange,
-                )
 
-                # If the source model didn't handle the price history correctly, set it manually
-                if (
-                    result
-                    and (
-                        result.price_history is None
-                        or not hasattr(result.price_history, "data")
+            info = {}
+            if plan.info:
+                info = (
+                    self._cached(
+                        YahooEndpoint.INFO,
+                        yahoo_symbol,
+                        lambda: self._call(
+                            YahooEndpoint.INFO, symbol, lambda: ticker.info, max_retries
+                        ),
+                        use_cache=use_cache,
                     )
-                    and not history_data.empty
-                ):
-                    result.price_history = YFPriceHistory.from_dataframe(history_data)
+                    or {}
+                )
+                fetched.append(YahooEndpoint.INFO.value)
+
+            calendar = None
+            if plan.calendar:
+                calendar = self._cached(
+                    YahooEndpoint.CALENDAR,
+                    yahoo_symbol,
+                    lambda: self._fetch_optional(
+                        YahooEndpoint.CALENDAR,
+                        symbol,
+                        lambda: ticker.calendar,
+                        max_retries,
+                    ),
+                    use_cache=use_cache,
+                )
+                fetched.append(YahooEndpoint.CALENDAR.value)
+
+            # Yahoo's quote type (when info was fetched) overrides the stored one
+            is_fund = info.get("quoteType") in FUND_QUOTE_TYPES if info else True
+            funds_data = None
+            if plan.funds_data and is_fund and hasattr(ticker, "funds_data"):
+                funds_data = self._cached(
+                    YahooEndpoint.FUNDS_DATA,
+                    yahoo_symbol,
+                    lambda: self._fetch_optional(
+                        YahooEndpoint.FUNDS_DATA,
+                        symbol,
+                        lambda: self._read_funds_data(ticker.funds_data),
+                        max_retries,
+                    ),
+                    use_cache=use_cache,
+                )
+                fetched.append(YahooEndpoint.FUNDS_DATA.value)
+
+            result = YFTickerData.from_payloads(
+                symbol,
+                exchange,
+                info=info,
+                history=history_data,
+                calendar=calendar,
+                funds_data=funds_data,
+                fetched_endpoints=fetched,
+                history_adjusted=adjusted_history,
+            )
 
-                if result:
-                    logger.info(
-                        f"Successfully fetched data for {symbol} with {len(history_data) if not history_data.empty else 0} price records"
-                    )
-                return result
+            price_count = (
+                result.price_history.row_count() if result.price_history else 0
+            )
+            logger.info(
+                f"Successfully fetched data for {symbol} with {price_count} price records",
+                extra={"fetched_endpoints": fetched},
+            )
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to fetch data for {symbol}: {e}", exc_info=True)
+            return None
+
+    def fetch_price_histories(
+        self,
+        symbols: Dict[str, str],
+        start_date: date,
+        chunk_size: int = 100,
+        threads: int = 8,
+        auto_adjust: bool = True,
+    ) -> Dict[str, YFPriceHistory]:
+        """
+        Fetch OHLCV histories for many tickers with multi-symbol downloads.
 
-            except Exception as e:
-                # Check if it's a rate limit error
-                if "too many requests" in str(e).lower() and attempt < max_retries:
-                    # Exponential backoff
-                    wait_time = (2**attempt) + random.uniform(0, 1)
-                    logger.warning(
-                        f"Rate limited for {symbol}, retry {attempt + 1}/{max_retries} "
-                        f"after {wait_time:.2f}s"
+        yfinance still issues one chart request per symbol under the hood (Yahoo
+        has no multi-symbol OHLCV endpoint), so each chunk takes one history
+        token per symbol, but the requests run concurrently in one call and
+        skip the quoteSummary work done by ``fetch_ticker_data``.
+
+        Args:
+            symbols: Mapping of ticker symbol to exchange identifier
+            start_date: Start date for historical data
+            chunk_size: Maximum number of symbols per download call
+            threads: Download threads used by yfinance within a chunk
+            auto_adjust: Whether to request dividend-adjusted prices
+
+        Returns:
+            Dict mapping ticker symbol to its price history. Symbols with no
+            data are omitted so callers can fall back to ``fetch_ticker_data``.
+        """
+        yahoo_to_symbol = {
+            self.format_yahoo_ticker(symbol, exchange): symbol
+            for symbol, exchange in symbols.items()
+        }
+        yahoo_symbols = list(yahoo_to_symbol)
+        histories = {}
+
+        for i in range(0, len(yahoo_symbols), chunk_size):
+            chunk = yahoo_symbols[i : i + chunk_size]
+            logger.info(
+                f"Bulk fetching prices for {len(chunk)} tickers from {start_date}"
+            )
+
+            # Each symbol in the chunk is one chart request
+            wait = self.rate_limiter.acquire(YahooEndpoint.HISTORY, tokens=len(chunk))
+            get_instrumentation().record("rate_limit_wait.history", wait)
+            incr("requests.history", len(chunk))
+
+            try:
+                with span("fetch.bulk_history"):
+                    frame = yf.download(
+                        chunk,
+                        start=start_date,
+                        end=date.today() + timedelta(days=1),  # Include today
+                        actions=True,
+                        auto_adjust=auto_adjust,
+                        group_by="ticker",
+                        threads=min(threads, len(chunk)),
+                        progress=False,
+                        session=self.session,
                     )
-                    time.sleep(wait_time)
-                    continue
+            except Exception as e:
+                logger.error(f"Bulk price download failed for chunk: {e}")
+                continue
+
+            for yahoo_symbol, history_df in self._split_download_frame(
+                frame, chunk
+            ).items():
+                histories[yahoo_to_symbol[yahoo_symbol]] = (
+                    YFPriceHistory.from_dataframe(history_df, adjusted=auto_adjust)
+                )
+
+        logger.info(
+            f"Bulk fetched price history for {len(histories)}/{len(symbols)} tickers"
+        )
+        return histories
 
-                # Other error or final retry failed
-                logger.error(f"Failed to fetch data for {symbol}: {e}", exc_info=True)
-                return None
+    @staticmethod
+    def _split_download_frame(frame, yahoo_symbols) -> Dict[str, pd.DataFrame]:
+        """
+        Split a wide ``yf.download`` frame into one history frame per symbol.
+
+        Rows the symbol did not trade on (NaN close, present only because
+        another symbol in the chunk traded that day) are dropped.
+        """
+        if frame is None or frame.empty:
+            return {}
+
+        if isinstance(frame.columns, pd.MultiIndex):
+            available = set(frame.columns.get_level_values(0))
+            per_symbol = {s: frame[s] for s in yahoo_symbols if s in available}
+        elif len(yahoo_symbols) == 1:
+            per_symbol = {yahoo_symbols[0]: frame}
+        else:
+            return {}
+
+        result = {}
+        for yahoo_symbol, history_df in per_symbol.items():
+            if "Close" not in history_df:
+                continue
+            history_df = history_df.dropna(subset=["Close"])
+            if not history_df.empty:
+                result[yahoo_symbol] = history_df
+        return result
 
     def determine_start_date(
-        self, last_update_date: Optional[date], backfill: bool = False
+        self,
+        last_update_date: Optional[date],
+        backfill: bool = False,
+        today: Optional[date] = None,
     ) -> date:
         """
         Determine the appropriate start date for data fetching.
@@ -163,17 +609,20 @@ class DataFetcher:
         Args:
             last_update_date: Date of the last update in the database
             backfill: Whether to perform historical backfill
+            today: Current market date (default: today)
 
         Returns:
             Start date for data fetching
         """
-        today = date.today()
+        today = today or market_time().date()
 
         if backfill:
-            return date(2020, 1, 1)
+            return BACKFILL_START_DATE
 
         if last_update_date:
-            # Start from day of last update
+            # The last stored row may be a partial bar written during its
+            # session, and the run that would have corrected it after the
+            # close may have failed, so it is always fetched again
             return last_update_date
 
         # Default to 30 days ago
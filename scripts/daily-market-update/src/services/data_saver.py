@@ -2,10 +2,12 @@
 Data saver module for storing data in the database.
 """
 
-from datetime import date
-from typing import List, Set, Optional
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Set, Optional, Union
 
+from src.core.instrumentation import incr, span, timed
 from src.core.logging_config import setup_logging
+from src.services.change_tracker import IGNORED_COLUMNS, ChangeTracker
 from src.models.db_models import (
     DBHistoricalPrice,
     DBTickerInfo,
@@ -15,23 +17,49 @@ from src.models.db_models import (
     DBSectorWeighting,
     DBAssetClass,
 )
+from src.models.price_block import RECORD_COLUMNS, PriceBlock
+from src.models.records import (
+    AssetClassRecord,
+    FundHoldingRecord,
+    SectorWeightingRecord,
+    as_row,
+    row_width,
+)
 
 logger = setup_logging(name="data_saver")
 
+# Tables whose rows the change tracker fingerprints, with their key column
+TRACKED_TABLES = {"tickers": "id", "yh_finance_daily": "ticker_id"}
+
 
 class DataSaver:
     """
     Saves financial data to the database.
     """
 
-    def __init__(self, supabase_client):
+    def __init__(
+        self, supabase_client, change_tracker: Optional[ChangeTracker] = None
+    ):
         """
         Initialize the data saver.
 
         Args:
             supabase_client: Supabase client for database operations
+            change_tracker: Fingerprints of persisted rows, used to skip
+                unchanged ``tickers`` and ``yh_finance_daily`` writes
+                (default: always write in full)
         """
         self.supabase = supabase_client
+        self.change_tracker = change_tracker
+
+    @staticmethod
+    def _execute_write(table_name: str, query, rows: List[Dict[str, Any]]) -> Any:
+        """Execute a write, timing it and counting its rows and payload bytes."""
+        with span(f"save.{table_name}"):
+            response = query.execute()
+        incr(f"rows.{table_name}", len(rows))
+        incr(f"bytes.{table_name}", len(rows) * row_width(rows))
+        return response
 
     def get_last_update_date(self, ticker_id: str, table_name: str) -> Optional[date]:
         """
@@ -69,6 +97,253 @@ class DataSaver:
             )
             return None
 
+    @timed("db.last_update_dates")
+    def get_last_update_dates(
+        self,
+        ticker_ids: List[str],
+        table_name: str,
+        chunk_size: int = 500,
+    ) -> Dict[str, Optional[date]]:
+        """
+        Get the date of the last update for many tickers in a table.
+
+        Each chunk is one call to the ``last_update_dates`` function (see
+        ``sql/last_update_dates.sql``), which returns every ticker in the
+        chunk with its latest date, or null if it has no rows. The default
+        chunk covers a whole selection page. If the call fails, the chunk's
+        tickers are looked up one at a time.
+
+        Args:
+            ticker_ids: Ticker IDs to query
+            table_name: Table name to query
+            chunk_size: Ticker IDs per call
+
+        Returns:
+            Dict mapping ticker ID to date of last update (None if never)
+        """
+        last_dates: Dict[str, Optional[date]] = {}
+
+        for i in range(0, len(ticker_ids), chunk_size):
+            chunk = ticker_ids[i : i + chunk_size]
+            try:
+                response = self.supabase.rpc(
+                    "last_update_dates",
+                    {"p_table": table_name, "p_ticker_ids": chunk},
+                ).execute()
+
+                for row in response.data or []:
+                    last_date = row.get("last_date")
+                    last_dates[row["ticker_id"]] = (
+                        date.fromisoformat(last_date[:10]) if last_date else None
+                    )
+
+            except Exception as e:
+                logger.error(
+                    f"Failed to get last update dates in {table_name}, "
+                    f"looking up {len(chunk)} tickers individually: {e}"
+                )
+                for ticker_id in chunk:
+                    last_dates[ticker_id] = self.get_last_update_date(
+                        ticker_id, table_name
+                    )
+
+        return last_dates
+
+    @timed("db.updated_ticker_ids")
+    def get_updated_ticker_ids(
+        self,
+        ticker_ids: List[str],
+        table_name: str,
+        since: datetime,
+        chunk_size: int = 50,
+    ) -> Set[str]:
+        """
+        Find tickers that have rows written to a table since a point in time.
+
+        Args:
+            ticker_ids: Ticker IDs to check
+            table_name: Table name to query (must have ``updated_at``)
+            since: Write time to compare ``updated_at`` against
+            chunk_size: Ticker IDs per query
+
+        Returns:
+            Set of ticker IDs updated since ``since``. Tickers whose query
+            failed are left out, so callers treat them as stale.
+        """
+        # updated_at is written as naive UTC by the models
+        since_utc = since.astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+        updated: Set[str] = set()
+
+        for i in range(0, len(ticker_ids), chunk_size):
+            chunk = ticker_ids[i : i + chunk_size]
+            try:
+                response = (
+                    self.supabase.table(table_name)
+                    .select("ticker_id")
+                    .in_("ticker_id", chunk)
+                    .gte("updated_at", since_utc)
+                    .execute()
+                )
+                updated.update(row["ticker_id"] for row in response.data or [])
+            except Exception as e:
+                logger.error(f"Failed to check freshness of {table_name}: {e}")
+
+        return updated
+
+    @timed("db.stored_dates")
+    def get_stored_dates(
+        self,
+        ticker_id: str,
+        table_name: str,
+        since: date,
+        page_size: int = 1000,
+    ) -> Optional[Set[date]]:
+        """
+        Get every date a ticker has rows for in a table since a given day.
+
+        Reads in pages of ``page_size`` so long histories are not cut off by
+        PostgREST's row limit.
+
+        Args:
+            ticker_id: Ticker ID to query
+            table_name: Table name to query
+            since: First date to include
+            page_size: Rows per request
+
+        Returns:
+            Set of stored dates, or None if the lookup failed
+        """
+        stored: Set[date] = set()
+        offset = 0
+
+        try:
+            while True:
+                response = (
+                    self.supabase.table(table_name)
+                    .select("date")
+                    .eq("ticker_id", ticker_id)
+                    .gte("date", since.isoformat())
+                    .order("date")
+                    .range(offset, offset + page_size - 1)
+                    .execute()
+                )
+                rows = response.data or []
+                stored.update(
+                    date.fromisoformat(row["date"][:10]) for row in rows if row.get("date")
+                )
+                if len(rows) < page_size:
+                    return stored
+                offset += page_size
+
+        except Exception as e:
+            logger.error(f"Failed to get stored dates for {ticker_id} in {table_name}: {e}")
+            return None
+
+    @timed("db.price_windows")
+    def get_price_windows(
+        self,
+        ticker_ids: List[str],
+        since: date,
+        chunk_size: int = 20,
+        page_size: int = 1000,
+    ) -> Dict[str, PriceBlock]:
+        """
+        Read the stored prices of many tickers since a given day.
+
+        Each chunk of tickers is read in pages of ``page_size`` rows, ordered
+        by ticker and date, so a year of history per ticker is not cut off by
+        PostgREST's row limit.
+
+        Args:
+            ticker_ids: Ticker IDs to query
+            since: First date to include
+            chunk_size: Ticker IDs per query
+            page_size: Rows per request
+
+        Returns:
+            Dict mapping ticker ID to its prices in date order. Tickers without
+            rows, or whose chunk failed to load, are left out.
+        """
+        columns = ", ".join(["ticker_id", "date", *RECORD_COLUMNS])
+        rows_by_ticker: Dict[str, List[Dict[str, Any]]] = {}
+
+        for i in range(0, len(ticker_ids), chunk_size):
+            chunk = ticker_ids[i : i + chunk_size]
+            chunk_rows: Dict[str, List[Dict[str, Any]]] = {}
+            offset = 0
+            try:
+                while True:
+                    response = (
+                        self.supabase.table("historical_prices")
+                        .select(columns)
+                        .in_("ticker_id", chunk)
+                        .gte("date", since.isoformat())
+                        .order("ticker_id")
+                        .order("date")
+                        .range(offset, offset + page_size - 1)
+                        .execute()
+                    )
+                    rows = response.data or []
+                    for row in rows:
+                        chunk_rows.setdefault(row["ticker_id"], []).append(row)
+                    if len(rows) < page_size:
+                        break
+                    offset += page_size
+
+            except Exception as e:
+                logger.error(f"Failed to read stored prices since {since}: {e}")
+                continue
+
+            incr("rows.price_windows", sum(len(r) for r in chunk_rows.values()))
+            rows_by_ticker.update(chunk_rows)
+
+        return {
+            ticker_id: PriceBlock.from_rows(rows)
+            for ticker_id, rows in rows_by_ticker.items()
+        }
+
+    @timed("db.price_history")
+    def get_price_history(
+        self, ticker_id: str, page_size: int = 1000
+    ) -> Optional[PriceBlock]:
+        """
+        Read every stored price of a ticker, in pages of ``page_size`` rows.
+
+        Args:
+            ticker_id: Ticker ID to query
+            page_size: Rows per request
+
+        Returns:
+            Prices in date order (empty without rows), or None if the lookup
+            failed
+        """
+        columns = ", ".join(["date", *RECORD_COLUMNS])
+        rows: List[Dict[str, Any]] = []
+        offset = 0
+
+        try:
+            while True:
+                response = (
+                    self.supabase.table("historical_prices")
+                    .select(columns)
+                    .eq("ticker_id", ticker_id)
+                    .order("date")
+                    .range(offset, offset + page_size - 1)
+                    .execute()
+                )
+                page = response.data or []
+                rows.extend(page)
+                if len(page) < page_size:
+                    break
+                offset += page_size
+
+        except Exception as e:
+            logger.error(f"Failed to read stored prices for {ticker_id}: {e}")
+            return None
+
+        incr("rows.price_history", len(rows))
+        return PriceBlock.from_rows(rows)
+
     def should_update(
         self, last_update_date: Optional[date], threshold_days: int = 1
     ) -> bool:
@@ -89,15 +364,14 @@ class DataSaver:
         return (today - last_update_date).days >= threshold_days
 
     def save_historical_prices(
-        self, symbol: str, prices: List[DBHistoricalPrice]
+        self, symbol: str, prices: List[Union[DBHistoricalPrice, Dict[str, Any]]]
     ) -> int:
         """
         Save historical price data to the database.
 
         Args:
-            ticker_id: Ticker ID
             symbol: Ticker symbol (for logging)
-            prices: List of price models to save
+            prices: List of price models or upsert-ready records to save
 
         Returns:
             Number of records saved
@@ -107,14 +381,16 @@ class DataSaver:
             return 0
 
         try:
-            # Convert models to dictionaries for Supabase
-            price_dicts = [p.model_dump(exclude_none=True) for p in prices]
+            # Convert records and models to dictionaries for Supabase
+            price_dicts = [as_row(p) for p in prices]
 
             # Upsert to database
-            response = (
-                self.supabase.table("historical_prices")
-                .upsert(price_dicts, on_conflict="ticker_id,date")
-                .execute()
+            self._execute_write(
+                "historical_prices",
+                self.supabase.table("historical_prices").upsert(
+                    price_dicts, on_conflict="ticker_id,date"
+                ),
+                price_dicts,
             )
 
             saved_count = len(price_dicts)
@@ -125,61 +401,201 @@ class DataSaver:
             logger.error(f"Failed to save price data for {symbol}: {e}", exc_info=True)
             return 0
 
-    def update_ticker_info(self, ticker_info: DBTickerInfo) -> bool:
+    @timed("db.prime_change_tracker")
+    def prime_change_tracker(
+        self, ticker_ids: List[str], chunk_size: int = 100
+    ) -> None:
+        """
+        Seed the change tracker with the persisted ``tickers`` and
+        ``yh_finance_daily`` rows of tickers about to be processed.
+
+        Fingerprints are replaced by what is read back, and tickers without
+        a row (or whose query failed) are dropped, so their next write is
+        sent in full.
+
+        Args:
+            ticker_ids: Ticker IDs about to be processed
+            chunk_size: Ticker IDs per query
+        """
+        if not self.change_tracker:
+            return
+
+        for table, key_column in TRACKED_TABLES.items():
+            for i in range(0, len(ticker_ids), chunk_size):
+                chunk = ticker_ids[i : i + chunk_size]
+                self.change_tracker.forget_all(table, chunk)
+                try:
+                    response = (
+                        self.supabase.table(table)
+                        .select("*")
+                        .in_(key_column, chunk)
+                        .execute()
+                    )
+                    for row in response.data or []:
+                        self.change_tracker.remember(
+                            table, row[key_column], row, replace=True
+                        )
+                except Exception as e:
+                    logger.error(f"Failed to load persisted {table} rows: {e}")
+
+    @timed("db.touch_unchanged")
+    def touch_unchanged(self, chunk_size: int = 100) -> int:
+        """
+        Bump ``updated_at`` on rows whose write was skipped as unchanged.
+
+        Freshness checks (``TickerSelector.skip_fresh_tickers``) read
+        ``updated_at``, so a skipped row must still record that it was
+        confirmed current. One update per chunk of keys sets only that
+        column, to the latest ``updated_at`` of the skipped rows.
+
+        Args:
+            chunk_size: Keys per update
+
+        Returns:
+            Number of rows touched
+        """
+        if not self.change_tracker:
+            return 0
+
+        touched = 0
+        for table, unchanged in self.change_tracker.take_unchanged().items():
+            key_column = TRACKED_TABLES[table]
+            keys = list(unchanged)
+            values = {"updated_at": max(unchanged.values())}
+            for i in range(0, len(keys), chunk_size):
+                chunk = keys[i : i + chunk_size]
+                query = self.supabase.table(table).update(values).in_(key_column, chunk)
+                try:
+                    self._execute_write(table, query, [values])
+                    touched += len(chunk)
+                    self.change_tracker.count(table, "touched", len(chunk))
+                except Exception as e:
+                    logger.error(f"Failed to touch unchanged {table} rows: {e}")
+
+        return touched
+
+    def _diff_row(
+        self, table: str, key: str, row: Dict[str, Any], key_column: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Reduce a row to its changed columns plus its key and ``updated_at``.
+
+        Returns:
+            The row to write, or None if nothing changed
+        """
+        if not self.change_tracker:
+            return row
+
+        changes = self.change_tracker.changed_columns(table, key, row)
+        changes.pop(key_column, None)
+        unchanged = sum(
+            1
+            for column in row
+            if column not in IGNORED_COLUMNS
+            and column != key_column
+            and column not in changes
+        )
+        if not changes:
+            self.change_tracker.mark_unchanged(table, key, row["updated_at"])
+            self.change_tracker.count(table, "skipped")
+            self.change_tracker.count(table, "columns_unchanged", unchanged)
+            return None
+
+        self.change_tracker.count(table, "written")
+        self.change_tracker.count(table, "columns_sent", len(changes))
+        self.change_tracker.count(table, "columns_unchanged", unchanged)
+        return {key_column: key, **changes, "updated_at": row["updated_at"]}
+
+    def update_ticker_info(
+        self, ticker_info: DBTickerInfo, skip_unchanged: bool = True
+    ) -> bool:
         """
         Update ticker information in the database.
 
         Args:
             ticker_info: Ticker info model
+            skip_unchanged: Only send columns that differ from the persisted
+                row, and skip the write if none do
 
         Returns:
-            True if successful, False otherwise
+            True if the row was written, False if unchanged or failed
         """
+        ticker_id = ticker_info.id
 
         try:
             # Convert model to dictionary for Supabase
             ticker_dict = ticker_info.model_dump(exclude_none=True)
+            if skip_unchanged:
+                ticker_dict = self._diff_row("tickers", ticker_id, ticker_dict, "id")
+                if ticker_dict is None:
+                    return False
 
             # Update in database
-            self.supabase.table("tickers").update(ticker_dict).eq(
-                "id", ticker_info.id
-            ).execute()
+            self._execute_write(
+                "tickers",
+                self.supabase.table("tickers").update(ticker_dict).eq("id", ticker_id),
+                [ticker_dict],
+            )
 
+            if self.change_tracker:
+                self.change_tracker.remember("tickers", ticker_id, ticker_dict)
             return True
 
         except Exception as e:
             logger.error(f"Failed to update ticker info for {ticker_info.name}: {e}")
+            if self.change_tracker:
+                self.change_tracker.forget("tickers", ticker_id)
             return False
 
-    def save_finance_daily(self, finance_data: DBFinanceDaily) -> bool:
+    def save_finance_daily(
+        self, finance_data: DBFinanceDaily, skip_unchanged: bool = True
+    ) -> bool:
         """
         Save daily finance data to the database.
 
         Args:
             finance_data: Finance daily model
+            skip_unchanged: Only send columns that differ from the persisted
+                row, and skip the write if none do
 
         Returns:
-            True if successful, False otherwise
+            True if the row was written, False if unchanged or failed
         """
         if not finance_data:
             return False
 
+        ticker_id = finance_data.ticker_id
+
         try:
             # Convert model to dictionary for Supabase
             finance_dict = finance_data.model_dump(exclude_none=True, by_alias=True)
+            if skip_unchanged:
+                finance_dict = self._diff_row(
+                    "yh_finance_daily", ticker_id, finance_dict, "ticker_id"
+                )
+                if finance_dict is None:
+                    return False
 
             # Upsert to database
-            self.supabase.table("yh_finance_daily").upsert(
+            self._execute_write(
+                "yh_finance_daily",
+                self.supabase.table("yh_finance_daily").upsert(
+                    [finance_dict],
+                    on_conflict=["ticker_id"],
+                ),
                 [finance_dict],
-                on_conflict=["ticker_id"],
-            ).execute()
+            )
 
+            if self.change_tracker:
+                self.change_tracker.remember("yh_finance_daily", ticker_id, finance_dict)
             return True
 
         except Exception as e:
             logger.error(
                 f"Failed to save finance data for {finance_data.ticker_id}: {e}"
             )
+            if self.change_tracker:
+                self.change_tracker.forget("yh_finance_daily", ticker_id)
             return False
 
     def save_calendar_events(
@@ -230,9 +646,13 @@ class DataSaver:
                 return False
 
             # Use on_conflict="ticker_id,date,event_type" to properly handle the unique constraint
-            self.supabase.table("calendar_events").upsert(
-                event_dicts, on_conflict="ticker_id,date,event_type"
-            ).execute()
+            self._execute_write(
+                "calendar_events",
+                self.supabase.table("calendar_events").upsert(
+                    event_dicts, on_conflict="ticker_id,date,event_type"
+                ),
+                event_dicts,
+            )
 
             logger.info(f"Saved {len(valid_events)} calendar events for {symbol}")
             return True
@@ -245,9 +665,9 @@ class DataSaver:
         self,
         ticker_id: str,
         symbol: str,
-        holdings: List[DBFundHolding],
-        sectors: List[DBSectorWeighting],
-        assets: List[DBAssetClass],
+        holdings: List[Union[FundHoldingRecord, DBFundHolding]],
+        sectors: List[Union[SectorWeightingRecord, DBSectorWeighting]],
+        assets: List[Union[AssetClassRecord, DBAssetClass]],
     ) -> Set[str]:
         """
         Save fund-specific data to the database.
@@ -255,9 +675,9 @@ class DataSaver:
         Args:
             ticker_id: Ticker ID
             symbol: Ticker symbol (for logging)
-            holdings: List of fund holding models
-            sectors: List of sector weighting models
-            assets: List of asset allocation models
+            holdings: List of fund holding records or models
+            sectors: List of sector weighting records or models
+            assets: List of asset allocation records or models
 
         Returns:
             Set of updated table names
@@ -267,10 +687,14 @@ class DataSaver:
         # Save holdings
         if holdings:
             try:
-                holding_dicts = [h.model_dump(exclude_none=True) for h in holdings]
-                self.supabase.table("fund_top_holdings").upsert(
-                    holding_dicts, on_conflict="ticker_id,holding_symbol"
-                ).execute()
+                holding_dicts = [as_row(h) for h in holdings]
+                self._execute_write(
+                    "fund_top_holdings",
+                    self.supabase.table("fund_top_holdings").upsert(
+                        holding_dicts, on_conflict="ticker_id,holding_symbol"
+                    ),
+                    holding_dicts,
+                )
                 updates.add("fund_top_holdings")
                 logger.info(f"Saved {len(holdings)} fund holdings for {symbol}")
             except Exception as e:
@@ -279,10 +703,14 @@ class DataSaver:
         # Save sectors
         if sectors:
             try:
-                sector_dicts = [s.model_dump(exclude_none=True) for s in sectors]
-                self.supabase.table("fund_sector_weightings").upsert(
-                    sector_dicts, on_conflict="ticker_id,sector_name"
-                ).execute()
+                sector_dicts = [as_row(s) for s in sectors]
+                self._execute_write(
+                    "fund_sector_weightings",
+                    self.supabase.table("fund_sector_weightings").upsert(
+                        sector_dicts, on_conflict="ticker_id,sector_name"
+                    ),
+                    sector_dicts,
+                )
                 updates.add("fund_sector_weightings")
                 logger.info(f"Saved {len(sectors)} sector weightings for {symbol}")
             except Exception as e:
@@ -291,10 +719,14 @@ class DataSaver:
         # Save assets
         if assets:
             try:
-                asset_dicts = [a.model_dump(exclude_none=True) for a in assets]
-                self.supabase.table("fund_asset_classes").upsert(
-                    asset_dicts, on_conflict="ticker_id,asset_class"
-                ).execute()
+                asset_dicts = [as_row(a) for a in assets]
+                self._execute_write(
+                    "fund_asset_classes",
+                    self.supabase.table("fund_asset_classes").upsert(
+                        asset_dicts, on_conflict="ticker_id,asset_class"
+                    ),
+                    asset_dicts,
+                )
                 updates.add("fund_asset_classes")
                 logger.info(f"Saved {len(assets)} asset classes for {symbol}")
             except Exception as e:
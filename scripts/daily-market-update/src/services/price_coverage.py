@@ -0,0 +1,182 @@
+"""
+Price history coverage: which days a ticker still needs from Yahoo Finance.
+
+Incremental runs only need the last stored day (which may hold a partial
+bar) and the days after it. Backfills compare the stored dates against the
+trading calendar and request just the missing ranges, including gaps in the
+middle of the history. Days Yahoo returned nothing for (e.g. a foreign
+exchange's own holidays) are recorded for a while so later backfills do not
+ask for them again.
+"""
+
+import json
+import os
+import time
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Set
+from pydantic import BaseModel
+
+from src.core.logging_config import setup_logging
+from src.core.market_calendar import market_time, trading_days
+
+logger = setup_logging(name="price_coverage")
+
+DEFAULT_COVERAGE_DIR = "/tmp/daily-market-update/coverage"
+
+# Seconds an empty day is trusted: an empty reply can also be a transient
+# Yahoo failure, so the day is requested again after this
+EMPTY_DAY_TTL = 24 * 3600
+
+
+class DateRange(BaseModel):
+    """An inclusive range of days to fetch prices for."""
+
+    start: date
+    end: date
+
+    def day_count(self) -> int:
+        """Calendar days in the range."""
+        return (self.end - self.start).days + 1
+
+
+def expected_days(start: date, end: date, always_open: bool = False) -> List[date]:
+    """
+    Days a ticker should have prices for between two dates (inclusive).
+
+    Args:
+        start: First day
+        end: Last day
+        always_open: Whether the ticker trades every day (currencies, crypto)
+
+    Returns:
+        Trading days (or every calendar day) in the range, in order
+    """
+    if not always_open:
+        return trading_days(start, end)
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def find_missing_ranges(
+    stored: Set[date],
+    start: date,
+    end: date,
+    always_open: bool = False,
+    merge_within: int = 5,
+) -> List[DateRange]:
+    """
+    Find the ranges of expected days that have no stored prices.
+
+    Ranges separated by only a few stored days are merged, since refetching
+    a handful of rows is cheaper than another request.
+
+    Args:
+        stored: Days that already have prices (or are known to have none)
+        start: First day to cover
+        end: Last day to cover
+        always_open: Whether the ticker trades every day
+        merge_within: Merge ranges separated by at most this many expected days
+
+    Returns:
+        Missing ranges in date order
+    """
+    days = expected_days(start, end, always_open)
+    missing = [i for i, day in enumerate(days) if day not in stored]
+    if not missing:
+        return []
+
+    groups = [[missing[0], missing[0]]]
+    for i in missing[1:]:
+        if i - groups[-1][1] - 1 <= merge_within:
+            groups[-1][1] = i
+        else:
+            groups.append([i, i])
+
+    return [DateRange(start=days[first], end=days[last]) for first, last in groups]
+
+
+class CoverageStore:
+    """
+    Remembers, per ticker, the days Yahoo recently had no prices for.
+
+    Kept as JSON files in the Lambda's /tmp directory, so it only lasts for
+    the life of a warm container; a lost file just means those days are
+    requested again. Each day expires ``ttl`` seconds after it was recorded.
+    """
+
+    def __init__(self, directory: str = DEFAULT_COVERAGE_DIR, ttl: float = EMPTY_DAY_TTL):
+        self.directory = directory
+        self.ttl = ttl
+
+    def _path(self, ticker_id: str) -> str:
+        return os.path.join(self.directory, f"{ticker_id}.json")
+
+    def _load(self, ticker_id: str, now: float) -> Dict[date, float]:
+        """Unexpired empty days with the time each was recorded."""
+        try:
+            with open(self._path(ticker_id)) as f:
+                recorded = json.load(f)["empty_days"]
+            return {
+                date.fromisoformat(day): at
+                for day, at in recorded.items()
+                if now - at < self.ttl
+            }
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable coverage for {ticker_id}: {e}")
+            return {}
+
+    def load_empty_days(self, ticker_id: str, now: Optional[float] = None) -> Set[date]:
+        """Days recently requested for a ticker that returned no prices."""
+        return set(self._load(ticker_id, now or time.time()))
+
+    def record(
+        self,
+        ticker_id: str,
+        ranges: List[DateRange],
+        returned: Iterable[date],
+        always_open: bool = False,
+        today: Optional[date] = None,
+        now: Optional[float] = None,
+    ) -> Set[date]:
+        """
+        Record the days a fetch covered without getting any prices back.
+
+        Only settled days (before today in market time) are recorded, since
+        the current session's row may still be on its way.
+
+        Args:
+            ticker_id: Ticker the ranges were fetched for
+            ranges: Ranges that were requested
+            returned: Days the response had prices for
+            always_open: Whether the ticker trades every day
+            today: Current market date (default: today)
+            now: Current time in seconds since the epoch (default: now)
+
+        Returns:
+            All days currently known to have no prices for the ticker
+        """
+        today = today or market_time().date()
+        now = now or time.time()
+        returned = set(returned)
+        empty = self._load(ticker_id, now)
+        for date_range in ranges:
+            for day in expected_days(date_range.start, date_range.end, always_open):
+                if day < today and day not in returned:
+                    empty[day] = now
+        for day in returned:
+            empty.pop(day, None)
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(ticker_id)
+            with open(f"{path}.tmp", "w") as f:
+                json.dump(
+                    {"empty_days": {d.isoformat(): at for d, at in sorted(empty.items())}},
+                    f,
+                )
+            os.replace(f"{path}.tmp", path)
+        except Exception as e:
+            logger.warning(f"Failed to record coverage for {ticker_id}: {e}")
+
+        return set(empty)
@@ -0,0 +1,248 @@
+"""
+On-disk cache for Yahoo Finance responses.
+
+Responses are stored as JSON files named by a hash of (yahoo symbol,
+endpoint, request params), so a re-run of a failed event, or a second event
+right after the scheduled one, can reuse payloads that have not changed.
+Each endpoint has its own time to live, and the directory is kept under a
+size limit by evicting the least recently used entries.
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.core.logging_config import setup_logging
+from src.core.market_calendar import next_settle_time
+from src.core.rate_limiter import YahooEndpoint
+
+logger = setup_logging(name="response_cache")
+
+DEFAULT_CACHE_DIR = "/tmp/daily-market-update/yahoo-cache"
+
+# Seconds each endpoint's responses stay valid; history is valid until the
+# current or next session's data has settled after its close (None)
+DEFAULT_TTLS: Dict[YahooEndpoint, Optional[float]] = {
+    YahooEndpoint.HISTORY: None,
+    YahooEndpoint.INFO: 3600,
+    YahooEndpoint.CALENDAR: 86400,
+    YahooEndpoint.FUNDS_DATA: 86400,
+}
+
+
+CACHE_SUFFIX = ".json"
+
+
+def _encode(value: Any) -> Any:
+    """
+    JSON form of the response types json cannot write itself.
+
+    Frames use pandas' table format, which keeps dtypes, the index and its
+    time zone; dates keep their type through a tagged ISO string.
+    """
+    if isinstance(value, pd.DataFrame):
+        return {
+            "__frame__": value.to_json(
+                orient="table", date_unit="ns", double_precision=15
+            )
+        }
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot cache a {type(value).__name__}")
+
+
+def _decode(value: Dict[str, Any]) -> Any:
+    """Inverse of ``_encode``, as a ``json.loads`` object hook."""
+    if len(value) == 1:
+        if "__frame__" in value:
+            return pd.read_json(io.StringIO(value["__frame__"]), orient="table")
+        if "__datetime__" in value:
+            return datetime.fromisoformat(value["__datetime__"])
+        if "__date__" in value:
+            return date.fromisoformat(value["__date__"])
+    return value
+
+
+class ResponseCache:
+    """
+    Content-addressed, size-bounded LRU cache of Yahoo Finance responses.
+
+    Recency is tracked with file modification times, which are bumped on
+    every hit, so the cache survives across invocations on a warm container
+    (or across runs when pointed at a local directory).
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttls: Optional[Dict[YahooEndpoint, Optional[float]]] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory to keep cache files in (created if needed)
+            max_bytes: Total size of cache files to keep
+            ttls: Seconds each endpoint's entries stay valid (None: until the
+                next session's data settles)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.lock = threading.Lock()
+
+        self.hits: Dict[str, int] = defaultdict(int)
+        self.misses: Dict[str, int] = defaultdict(int)
+
+        os.makedirs(directory, exist_ok=True)
+        self.total_bytes = sum(
+            entry.stat().st_size
+            for entry in os.scandir(directory)
+            if entry.is_file() and entry.name.endswith(CACHE_SUFFIX)
+        )
+
+    @staticmethod
+    def make_key(yahoo_symbol: str, endpoint: YahooEndpoint, params: Dict) -> str:
+        """Hash of the request identity, used as the file name."""
+        identity = {"symbol": yahoo_symbol, "endpoint": endpoint.value, "params": params}
+        encoded = json.dumps(identity, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{CACHE_SUFFIX}")
+
+    def get(
+        self, yahoo_symbol: str, endpoint: YahooEndpoint, params: Optional[Dict] = None
+    ) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            yahoo_symbol: Symbol the request was for
+            endpoint: Endpoint class of the request
+            params: Request parameters that change the response
+
+        Returns:
+            The cached response, or None on a miss or expired entry
+        """
+        path = self._path(self.make_key(yahoo_symbol, endpoint, params or {}))
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f, object_hook=_decode)
+        except FileNotFoundError:
+            entry = None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            self._remove(path)
+            entry = None
+
+        if entry is None or entry["expires_at"] <= time.time():
+            with self.lock:
+                self.misses[endpoint.value] += 1
+            return None
+
+        # Mark as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        with self.lock:
+            self.hits[endpoint.value] += 1
+        return entry["value"]
+
+    def put(
+        self,
+        yahoo_symbol: str,
+        endpoint: YahooEndpoint,
+        value: Any,
+        params: Optional[Dict] = None,
+    ) -> None:
+        """
+        Store a response, evicting old entries if the cache is over size.
+
+        Args:
+            yahoo_symbol: Symbol the request was for
+            endpoint: Endpoint class of the request
+            value: Response to store: JSON values, frames and dates
+            params: Request parameters that change the response
+        """
+        ttl = self.ttls.get(endpoint)
+        if ttl is None:
+            expires_at = next_settle_time().timestamp()
+        else:
+            expires_at = time.time() + ttl
+
+        path = self._path(self.make_key(yahoo_symbol, endpoint, params or {}))
+        try:
+            data = json.dumps(
+                {"expires_at": expires_at, "value": value}, default=_encode
+            ).encode()
+            previous = os.path.getsize(path) if os.path.exists(path) else 0
+
+            # Write then rename so readers never see a partial file
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to cache {endpoint.value} for {yahoo_symbol}: {e}")
+            return
+
+        with self.lock:
+            self.total_bytes += len(data) - previous
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under size. Hold the lock."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(CACHE_SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+
+        self.total_bytes = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        evicted = 0
+        for _, size, path in entries:
+            if self.total_bytes <= target:
+                break
+            self._remove(path)
+            self.total_bytes -= size
+            evicted += 1
+
+        logger.info(f"Evicted {evicted} cache entries, {self.total_bytes} bytes left")
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit and miss counts per endpoint since the cache was created."""
+        with self.lock:
+            return {
+                endpoint: {
+                    "hits": self.hits.get(endpoint, 0),
+                    "misses": self.misses.get(endpoint, 0),
+                }
+                for endpoint in sorted(set(self.hits) | set(self.misses))
+            }
@@ -0,0 +1,346 @@
+"""
+Incremental state for the rolling price statistics of each ticker.
+
+``compute_price_analytics`` needs a year of stored prices per ticker. A
+``RollingState`` instead carries what those statistics depend on from one
+run to the next: running sums for the moving averages and return moments,
+monotonic deques for the 52-week high and low, the year of closes needed
+for trailing-return bases, and the YTD anchor. A daily run reads only the
+rows stored since the state's last day and applies them in O(new rows).
+
+The newest row a run sees is applied to a copy only: the current session's
+bar keeps changing until the close, so it is read (and applied) again by the
+next run. States live as JSON files like the price coverage; a missing,
+outdated or unreadable file is rebuilt from the stored window, and BACKFILL
+runs always rebuild since they may rewrite earlier history.
+"""
+
+import json
+import os
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass, field, fields
+from datetime import date
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+from src.core.logging_config import setup_logging
+from src.models.price_block import PriceBlock
+from src.transformers.price_analytics import (
+    MIN_VOLATILITY_RETURNS,
+    RETURN_PERIODS,
+    TRADING_DAYS,
+    PriceAnalytics,
+)
+
+logger = setup_logging(name="rolling_state")
+
+DEFAULT_ROLLING_STATE_DIR = "/tmp/daily-market-update/rolling-state"
+
+# Bumped whenever the file layout changes; older files are rebuilt
+STATE_VERSION = 1
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Sessions in the moving averages
+SHORT_AVERAGE = 50
+LONG_AVERAGE = 200
+
+# Calendar days in the 52-week window
+YEAR_DAYS = 365
+
+
+def _day(epoch_day: int) -> date:
+    return date.fromordinal(EPOCH_ORDINAL + epoch_day)
+
+
+def _change(last: float, base: Optional[float]) -> Optional[float]:
+    if not base:
+        return None
+    return (last / base - 1.0) * 100.0
+
+
+@dataclass(slots=True)
+class RollingState:
+    """
+    Rolling statistics inputs for one ticker; days are days since 1970-01-01.
+
+    Only rows with a close are applied, in date order; rows on or before
+    ``last_day`` are ignored.
+    """
+
+    last_day: Optional[int] = None
+    last_volume: Optional[int] = None
+
+    # (day, close) for the last LONG_AVERAGE sessions and at least a year
+    closes: Deque[Tuple[int, float]] = field(default_factory=deque)
+    short_sum: float = 0.0
+    long_sum: float = 0.0
+
+    # (day, value) with values decreasing (highs) / increasing (lows)
+    highs: Deque[Tuple[int, float]] = field(default_factory=deque)
+    lows: Deque[Tuple[int, float]] = field(default_factory=deque)
+
+    # Daily returns within the year, keyed by the day they start from
+    returns: Deque[Tuple[int, float]] = field(default_factory=deque)
+    return_sum: float = 0.0
+    return_squares: float = 0.0
+
+    # Last close before the first session of ``ytd_year``
+    ytd_year: Optional[int] = None
+    ytd_base: Optional[float] = None
+
+    def copy(self) -> "RollingState":
+        """Independent copy (the deques hold immutable pairs)."""
+        values = {f.name: getattr(self, f.name) for f in fields(self)}
+        return RollingState(
+            **{
+                name: deque(value) if isinstance(value, deque) else value
+                for name, value in values.items()
+            }
+        )
+
+    def next_day(self) -> Optional[date]:
+        """First day not applied yet (None for an empty state)."""
+        return _day(self.last_day + 1) if self.last_day is not None else None
+
+    def apply_row(
+        self,
+        day: int,
+        close: float,
+        high: float,
+        low: float,
+        volume: Optional[int] = None,
+    ) -> None:
+        """Apply one session (high and low fall back to the close if NaN)."""
+        if self.last_day is not None and day <= self.last_day:
+            return
+
+        year = _day(day).year
+        if year != self.ytd_year:
+            self.ytd_year = year
+            self.ytd_base = self.closes[-1][1] if self.closes else None
+
+        if self.closes:
+            start_day, previous = self.closes[-1]
+            daily = close / previous - 1.0
+            self.returns.append((start_day, daily))
+            self.return_sum += daily
+            self.return_squares += daily * daily
+
+        self.closes.append((day, close))
+        self.short_sum += close
+        self.long_sum += close
+        if len(self.closes) > SHORT_AVERAGE:
+            self.short_sum -= self.closes[-SHORT_AVERAGE - 1][1]
+        if len(self.closes) > LONG_AVERAGE:
+            self.long_sum -= self.closes[-LONG_AVERAGE - 1][1]
+
+        high = close if np.isnan(high) else high
+        while self.highs and self.highs[-1][1] <= high:
+            self.highs.pop()
+        self.highs.append((day, high))
+
+        low = close if np.isnan(low) else low
+        while self.lows and self.lows[-1][1] >= low:
+            self.lows.pop()
+        self.lows.append((day, low))
+
+        self.last_day = day
+        self.last_volume = volume
+        self._evict(day - YEAR_DAYS)
+
+    def _evict(self, cutoff: int) -> None:
+        """Drop what fell out of the year ending after ``cutoff``."""
+        while self.highs and self.highs[0][0] <= cutoff:
+            self.highs.popleft()
+        while self.lows and self.lows[0][0] <= cutoff:
+            self.lows.popleft()
+        while self.returns and self.returns[0][0] <= cutoff:
+            _, daily = self.returns.popleft()
+            self.return_sum -= daily
+            self.return_squares -= daily * daily
+
+        # Keep the last close on or before the cutoff as the 1Y return base
+        while (
+            len(self.closes) > LONG_AVERAGE + 1
+            and self.closes[1][0] <= cutoff
+        ):
+            self.closes.popleft()
+
+    def apply_block(self, block: PriceBlock) -> None:
+        """Apply every row of a block that has a close."""
+        valid = ~np.isnan(block.close)
+        missing = block.volume_missing
+        volumes = [
+            None if missing is not None and missing[i] else v
+            for i, v in enumerate(block.volume.tolist())
+        ]
+        for day, close, high, low, volume, ok in zip(
+            block.dates.astype(np.int64).tolist(),
+            block.close.tolist(),
+            block.high.tolist(),
+            block.low.tolist(),
+            volumes,
+            valid.tolist(),
+        ):
+            if ok:
+                self.apply_row(day, close, high, low, volume)
+
+    def _close_on_or_before(self, day: int) -> Optional[float]:
+        index = bisect_right(self.closes, day, key=lambda entry: entry[0]) - 1
+        return self.closes[index][1] if index >= 0 else None
+
+    def analytics(self, ticker_id: str) -> Optional[PriceAnalytics]:
+        """
+        Statistics as of the last applied session, matching
+        ``compute_price_analytics`` over the same rows.
+
+        Returns:
+            Statistics, or None before any row was applied
+        """
+        if self.last_day is None:
+            return None
+
+        last_close = self.closes[-1][1]
+        previous = self.closes[-2][1] if len(self.closes) > 1 else None
+        count = len(self.returns)
+
+        volatility = None
+        if count >= MIN_VOLATILITY_RETURNS:
+            mean = self.return_sum / count
+            variance = (self.return_squares - count * mean * mean) / (count - 1)
+            volatility = float(np.sqrt(max(variance, 0.0) * TRADING_DAYS) * 100.0)
+
+        as_of = _day(self.last_day)
+        return PriceAnalytics(
+            ticker_id=ticker_id,
+            as_of=as_of,
+            last_close=last_close,
+            volume=self.last_volume,
+            change_percent=_change(last_close, previous),
+            fifty_day_average=(
+                self.short_sum / SHORT_AVERAGE
+                if len(self.closes) >= SHORT_AVERAGE
+                else None
+            ),
+            two_hundred_day_average=(
+                self.long_sum / LONG_AVERAGE
+                if len(self.closes) >= LONG_AVERAGE
+                else None
+            ),
+            fifty_two_week_low=self.lows[0][1],
+            fifty_two_week_high=self.highs[0][1],
+            ytd_return=(
+                _change(last_close, self.ytd_base)
+                if self.ytd_year == as_of.year
+                else None
+            ),
+            **{
+                name: _change(
+                    last_close, self._close_on_or_before(self.last_day - lookback)
+                )
+                for name, lookback in RETURN_PERIODS.items()
+            },
+            volatility=volatility,
+        )
+
+    def advance(self, block: PriceBlock, ticker_id: str) -> Optional[PriceAnalytics]:
+        """
+        Apply the settled rows of a block and return the statistics
+        including its newest row, which is left out of the state.
+
+        Args:
+            block: Rows stored after ``last_day``, in date order
+            ticker_id: Ticker the state belongs to
+
+        Returns:
+            Statistics as of the newest row (None without any rows)
+        """
+        if len(block) > 1:
+            self.apply_block(block[:-1])
+        if not len(block):
+            return self.analytics(ticker_id)
+
+        current = self.copy()
+        current.apply_block(block[-1:])
+        return current.analytics(ticker_id)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": STATE_VERSION,
+            "last_day": self.last_day,
+            "last_volume": self.last_volume,
+            "closes": list(self.closes),
+            "short_sum": self.short_sum,
+            "long_sum": self.long_sum,
+            "highs": list(self.highs),
+            "lows": list(self.lows),
+            "returns": list(self.returns),
+            "return_sum": self.return_sum,
+            "return_squares": self.return_squares,
+            "ytd_year": self.ytd_year,
+            "ytd_base": self.ytd_base,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RollingState":
+        if data.get("version") != STATE_VERSION:
+            raise ValueError(f"state version {data.get('version')} is outdated")
+
+        pairs = {"closes", "highs", "lows", "returns"}
+        return cls(
+            **{
+                name: deque(tuple(p) for p in value) if name in pairs else value
+                for name, value in data.items()
+                if name != "version"
+            }
+        )
+
+
+class RollingStateStore:
+    """
+    Keeps each ticker's rolling state as a JSON file.
+
+    Defaults to the Lambda's /tmp directory, so states last for the life of
+    a warm container (point it at a mounted file system to keep them
+    longer); a lost state is rebuilt from a year of stored prices.
+    """
+
+    def __init__(self, directory: str = DEFAULT_ROLLING_STATE_DIR):
+        self.directory = directory
+
+    def _path(self, ticker_id: str) -> str:
+        return os.path.join(self.directory, f"{ticker_id}.json")
+
+    def load(self, ticker_id: str) -> Optional[RollingState]:
+        """A ticker's state, or None if it has to be rebuilt."""
+        try:
+            with open(self._path(ticker_id)) as f:
+                return RollingState.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Rebuilding unreadable rolling state for {ticker_id}: {e}")
+            return None
+
+    def save(self, ticker_id: str, state: RollingState) -> None:
+        """Write a ticker's state, replacing the previous file atomically."""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(ticker_id)
+            with open(f"{path}.tmp", "w") as f:
+                json.dump(state.to_dict(), f)
+            os.replace(f"{path}.tmp", path)
+        except Exception as e:
+            logger.warning(f"Failed to save rolling state for {ticker_id}: {e}")
+
+    def discard(self, ticker_id: str) -> None:
+        """Drop a ticker's state so the next run rebuilds it."""
+        try:
+            os.remove(self._path(ticker_id))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to discard rolling state for {ticker_id}: {e}")
@@ -2,13 +2,47 @@
 Ticker processor for handling the flow of data processing.
 """
 
-from typing import Dict, Set, Any
+from collections import defaultdict
+from dataclasses import replace
+from datetime import date, timedelta
+from typing import Dict, List, Set, Any, Optional
 
+import numpy as np
+
+from src.core.instrumentation import incr
 from src.core.logging_config import setup_logging
+from src.core.market_calendar import (
+    ALWAYS_OPEN_QUOTE_TYPES,
+    last_session_close,
+    market_time,
+)
 from src.events.event_processor import PipelineConfig
-from src.services.data_fetcher import DataFetcher
+from src.services.data_fetcher import DataFetcher, FetchPlan
 from src.services.data_saver import DataSaver
+from src.services.batch_writer import BatchedPriceWriter
+from src.services.change_tracker import ChangeTracker
+from src.services.rolling_state import RollingState, RollingStateStore
+from src.services.price_coverage import (
+    CoverageStore,
+    DateRange,
+    expected_days,
+    find_missing_ranges,
+)
+from src.models.price_block import PriceBlock
+from src.models.source_models import YFTickerData
+from src.transformers.adjustments import (
+    action_factors,
+    adjust_fetched,
+    has_actions,
+    last_close,
+    readjust_stored,
+)
 from src.transformers.model_transformer import ModelTransformer
+from src.transformers.price_analytics import (
+    WINDOW_DAYS,
+    PriceAnalytics,
+    compute_price_analytics,
+)
 
 logger = setup_logging(name="ticker_processor")
 
@@ -18,19 +52,405 @@ class TickerProcessor:
     Processes tickers by fetching data and saving to the database.
     """
 
-    def __init__(self, supabase_client):
+    def __init__(
+        self,
+        supabase_client,
+        data_fetcher: Optional[DataFetcher] = None,
+        coverage_store: Optional[CoverageStore] = None,
+        change_tracker: Optional[ChangeTracker] = None,
+        rolling_states: Optional[RollingStateStore] = None,
+    ):
         """
         Initialize the ticker processor.
 
         Args:
             supabase_client: Supabase client for database operations
+            data_fetcher: Fetcher to use (default: a new one)
+            coverage_store: Store of days known to have no prices (default:
+                one in /tmp)
+            change_tracker: Fingerprints of persisted rows (default: a new,
+                empty tracker)
+            rolling_states: Store of per-ticker rolling statistics state
+                (default: one in /tmp)
         """
-        self.data_fetcher = DataFetcher()
-        self.data_saver = DataSaver(supabase_client)
+        self.data_fetcher = data_fetcher or DataFetcher()
+        self.change_tracker = change_tracker or ChangeTracker()
+        self.data_saver = DataSaver(supabase_client, self.change_tracker)
         self.transformer = ModelTransformer()
+        self.coverage_store = coverage_store or CoverageStore()
+        self.rolling_states = rolling_states or RollingStateStore()
 
-    def process_ticker(
+    @staticmethod
+    def _fills_gaps(ticker: Dict[str, Any], config: PipelineConfig) -> bool:
+        """Whether the ticker's price ranges come from a gap search."""
+        backfill = ticker.get("backfill", False) or config.backfill
+        return (
+            bool(config.start_date or backfill)
+            and config.fill_gaps
+            and not config.force_update
+        )
+
+    @staticmethod
+    def adjusts_prices(ticker: Dict[str, Any], config: PipelineConfig) -> bool:
+        """
+        Whether the ticker's prices are fetched unadjusted and adjusted here.
+
+        Only incremental runs do: a backfill or explicit start date fetches
+        a range Yahoo adjusts as a whole, and adjusting it here would need
+        every later stored row.
+        """
+        backfill = ticker.get("backfill", False) or config.backfill
+        return config.adjust_prices and not (config.start_date or backfill)
+
+    @staticmethod
+    def _is_always_open(ticker: Dict[str, Any]) -> bool:
+        return (ticker.get("quote_type") or "").upper() in ALWAYS_OPEN_QUOTE_TYPES
+
+    def resolve_price_ranges(
+        self, ticker: Dict[str, Any], config: PipelineConfig
+    ) -> List[DateRange]:
+        """
+        Determine which days of price history a ticker still needs.
+
+        Incremental runs fetch from the last stored price on, since that
+        row may be a partial intraday bar.
+        Backfills and explicit start dates compare the stored dates against
+        the trading calendar and fetch only the missing ranges, including
+        interior gaps; the session in progress is left to incremental runs.
+        ``force_update`` or ``fill_gaps=False`` fetch the whole window.
+
+        The result is kept on the ticker dict as ``price_ranges``.
+
+        Args:
+            ticker: Ticker dictionary with metadata
+            config: Processing configuration
+
+        Returns:
+            Ranges to fetch, in date order; empty if nothing is missing
+        """
+        if "price_ranges" in ticker:
+            return ticker["price_ranges"]
+
+        today = market_time().date()
+        backfill = ticker.get("backfill", False) or config.backfill
+        always_open = self._is_always_open(ticker)
+
+        if config.start_date or backfill:
+            start = config.start_date or self.data_fetcher.determine_start_date(
+                None, backfill=True
+            )
+            ranges = [DateRange(start=start, end=today)]
+            if self._fills_gaps(ticker, config):
+                ranges = self._find_price_gaps(ticker, start, always_open)
+        else:
+            if "last_price_date" in ticker:
+                last_price_update = ticker["last_price_date"]
+            else:
+                last_price_update = self.data_saver.get_last_update_date(
+                    ticker["id"], "historical_prices"
+                )
+            start = self.data_fetcher.determine_start_date(
+                last_price_update, today=today
+            )
+            ranges = (
+                [DateRange(start=start, end=today)]
+                if expected_days(start, today, always_open)
+                else []
+            )
+
+        ticker["price_ranges"] = ranges
+        return ranges
+
+    def _find_price_gaps(
+        self, ticker: Dict[str, Any], start: date, always_open: bool
+    ) -> List[DateRange]:
+        """Missing settled ranges since ``start``, or the whole window on error."""
+        end = (
+            market_time().date() - timedelta(days=1)
+            if always_open
+            else last_session_close().date()
+        )
+        stored = self.data_saver.get_stored_dates(
+            ticker["id"], "historical_prices", start
+        )
+        if stored is None:
+            return [DateRange(start=start, end=market_time().date())]
+
+        known = stored | self.coverage_store.load_empty_days(ticker["id"])
+        ranges = find_missing_ranges(known, start, end, always_open)
+        logger.info(
+            f"{ticker['symbol']} has {len(stored)} stored days since {start}, "
+            f"{len(ranges)} missing ranges"
+        )
+        return ranges
+
+    def resolve_start_date(
         self, ticker: Dict[str, Any], config: PipelineConfig
+    ) -> Optional[date]:
+        """
+        Determine the price history start date for a ticker.
+
+        Args:
+            ticker: Ticker dictionary with metadata
+            config: Processing configuration
+
+        Returns:
+            Start of the first missing range, or None if nothing is missing
+        """
+        ranges = self.resolve_price_ranges(ticker, config)
+        return ranges[0].start if ranges else None
+
+    def _record_coverage(
+        self,
+        ticker: Dict[str, Any],
+        config: PipelineConfig,
+        yf_data: Optional[YFTickerData],
+    ) -> None:
+        """
+        Note what the price fetch covered on the ticker dict as
+        ``price_coverage``, and remember gap days Yahoo had no prices for.
+        """
+        ranges = ticker.get("price_ranges")
+        if ranges is None:
+            return
+
+        history = yf_data.price_history if yf_data else None
+        returned = set(history.block.date_list()) if history else set()
+        ticker["price_coverage"] = {
+            "ranges": len(ranges),
+            "days": sum(r.day_count() for r in ranges),
+            "rows": len(returned),
+        }
+
+        if ranges and yf_data and self._fills_gaps(ticker, config):
+            self.coverage_store.record(
+                ticker["id"], ranges, returned, self._is_always_open(ticker)
+            )
+
+    def attach_price_watermarks(
+        self, tickers: List[Dict[str, Any]], config: PipelineConfig
+    ) -> None:
+        """
+        Look up the last stored price date for all tickers at once.
+
+        Sets ``last_price_date`` on each ticker dict so ``resolve_start_date``
+        does not need a database round trip per ticker.
+
+        Args:
+            tickers: Selected ticker dictionaries (updated in place)
+            config: Processing configuration
+        """
+        if not config.process_prices or config.start_date or config.backfill:
+            return
+
+        ticker_ids = [t["id"] for t in tickers if not t.get("backfill", False)]
+        if not ticker_ids:
+            return
+
+        last_dates = self.data_saver.get_last_update_dates(
+            ticker_ids, "historical_prices"
+        )
+        for ticker in tickers:
+            if ticker["id"] in last_dates:
+                ticker["last_price_date"] = last_dates[ticker["id"]]
+
+    def update_analytics(
+        self, ticker_ids: List[str], config: PipelineConfig
+    ) -> Set[str]:
+        """
+        Fill the price statistics in ``yh_finance_daily`` from stored prices.
+
+        Meant for tickers without a live quote from the info endpoint (runs
+        that skip info, or indexes and currencies Yahoo has no quote for);
+        the caller leaves out tickers whose quote was just written.
+
+        With ``incremental_analytics``, each ticker's rolling state is
+        advanced by the rows stored since its last run (see
+        ``RollingState``). Otherwise the last ``WINDOW_DAYS`` of stored
+        prices are read for all tickers at once and their statistics
+        computed together (see ``compute_price_analytics``). Either way no
+        quote summary is needed.
+
+        Args:
+            ticker_ids: IDs of tickers whose prices were processed
+            config: Processing configuration
+
+        Returns:
+            IDs of tickers whose row was written
+        """
+        if not ticker_ids:
+            return set()
+
+        if config.incremental_analytics:
+            analytics = self._advance_rolling_states(ticker_ids, config)
+        else:
+            since = date.today() - timedelta(days=WINDOW_DAYS)
+            blocks = self.data_saver.get_price_windows(ticker_ids, since)
+            analytics = compute_price_analytics(blocks)
+
+        written = set()
+        for ticker_id, stats in analytics.items():
+            if self.data_saver.save_finance_daily(
+                stats.finance_daily(), skip_unchanged=not config.force_update
+            ):
+                written.add(ticker_id)
+
+        logger.info(
+            f"Computed price analytics for {len(analytics)} of {len(ticker_ids)} "
+            f"tickers, wrote {len(written)}"
+        )
+        return written
+
+    def _advance_rolling_states(
+        self, ticker_ids: List[str], config: PipelineConfig
+    ) -> Dict[str, PriceAnalytics]:
+        """
+        Read the prices stored since each ticker's rolling state, apply them
+        and save the states.
+
+        Tickers without a usable state, and all tickers of a backfill (which
+        may have rewritten earlier history), are rebuilt from the last
+        ``WINDOW_DAYS`` of stored prices. Tickers that share a start day are
+        read together.
+
+        Returns:
+            Statistics per ticker ID (tickers without stored prices are left out)
+        """
+        window_start = date.today() - timedelta(days=WINDOW_DAYS)
+        states: Dict[str, RollingState] = {}
+        tickers_since: Dict[date, List[str]] = defaultdict(list)
+
+        for ticker_id in ticker_ids:
+            state = None if config.backfill else self.rolling_states.load(ticker_id)
+            if state is None or state.next_day() is None:
+                state = RollingState()
+            states[ticker_id] = state
+            tickers_since[state.next_day() or window_start].append(ticker_id)
+
+        analytics = {}
+        for since, since_ids in tickers_since.items():
+            blocks = self.data_saver.get_price_windows(since_ids, since)
+            for ticker_id in since_ids:
+                state = states[ticker_id]
+                block = blocks.get(ticker_id)
+                if block is not None:
+                    stats = state.advance(block, ticker_id)
+                    self.rolling_states.save(ticker_id, state)
+                else:
+                    stats = state.analytics(ticker_id)
+
+                if stats:
+                    analytics[ticker_id] = stats
+
+        return analytics
+
+    def prime_change_tracker(
+        self, tickers: List[Dict[str, Any]], config: PipelineConfig
+    ) -> None:
+        """
+        Load the tickers' persisted info rows in bulk, so this run's writes
+        skip the columns that have not changed since.
+
+        Args:
+            tickers: Selected ticker dictionaries
+            config: Processing configuration
+        """
+        if not config.process_info or config.force_update:
+            return
+
+        self.data_saver.prime_change_tracker([t["id"] for t in tickers])
+
+    def _save_price_block(
+        self,
+        symbol: str,
+        ticker_id: str,
+        block: PriceBlock,
+        config: PipelineConfig,
+        price_writer: Optional[BatchedPriceWriter],
+    ) -> int:
+        """
+        Transform a slice of a ticker's prices and queue or save the rows.
+
+        Returns:
+            Number of rows queued or saved
+        """
+        price_records = self.transformer.transform_historical_price_records(
+            block, ticker_id
+        )
+
+        if not price_records:
+            return 0
+        if price_writer:
+            return price_writer.add(symbol, price_records)
+        return self.data_saver.save_historical_prices(symbol, price_records)
+
+    def _adjust_prices(
+        self,
+        symbol: str,
+        ticker_id: str,
+        block: PriceBlock,
+        config: PipelineConfig,
+        price_writer: Optional[BatchedPriceWriter],
+    ) -> PriceBlock:
+        """
+        Adjust unadjusted fetched prices for their dividends and re-adjust
+        the stored history for any dividend or split that is new.
+
+        Actions on days already stored with one were applied by an earlier
+        run and are not applied to the history again. Re-adjusted rows are
+        saved like fetched ones and the ticker's rolling state is dropped,
+        since the prices it was built from changed.
+
+        Returns:
+            The fetched prices, adjusted
+
+        Raises:
+            RuntimeError: If the stored prices could not be read, so the
+                ticker fails instead of mixing price bases
+        """
+        actions = has_actions(block)
+        if not actions.any():
+            return replace(block, adjusted=True)
+
+        stored = self.data_saver.get_price_history(ticker_id)
+        if stored is None:
+            raise RuntimeError(f"Could not read stored prices of {symbol} to adjust")
+
+        split = int(np.searchsorted(stored.dates, block.dates[0]))
+        history, overlap = stored[:split], stored[split:]
+
+        applied = overlap.dates[has_actions(overlap)]
+        new = actions & ~np.isin(block.dates, applied)
+        splits = block.stock_splits[new & (block.stock_splits > 0)]
+
+        # Yahoo's unadjusted prices are already in the current share basis
+        previous_close = last_close(history)
+        if previous_close is not None:
+            previous_close /= float(splits.prod())
+
+        adjusted = adjust_fetched(block, previous_close)
+        if not len(history) or not new.any():
+            return adjusted
+
+        factors = action_factors(block, previous_close, splits=True).select(new)
+        readjusted = readjust_stored(history, factors)
+        for rows in readjusted.batches(config.write_batch_rows):
+            self._save_price_block(symbol, ticker_id, rows, config, price_writer)
+
+        self.rolling_states.discard(ticker_id)
+        incr("prices.readjusted_rows", len(readjusted))
+        logger.info(
+            f"Re-adjusted {len(readjusted)} stored prices of {symbol} for "
+            f"{int(new.sum())} new dividends or splits"
+        )
+        return adjusted
+
+    def process_ticker(
+        self,
+        ticker: Dict[str, Any],
+        config: PipelineConfig,
+        prefetched: Optional[YFTickerData] = None,
+        price_writer: Optional[BatchedPriceWriter] = None,
     ) -> Set[str]:
         """
         Process a single ticker.
@@ -38,6 +458,10 @@ class TickerProcessor:
         Args:
             ticker: Ticker dictionary with metadata
             config: Processing configuration
+            prefetched: Data already fetched for this ticker (e.g. by a bulk
+                price download); skips the per-ticker Yahoo Finance fetch
+            price_writer: Batch writer to queue price rows on instead of
+                upserting them per ticker; the caller owns flushing it
 
         Returns:
             Set of updated table names
@@ -51,39 +475,60 @@ class TickerProcessor:
 
         updates = set()
 
-        # Determine start date
-        last_price_update = self.data_saver.get_last_update_date(
-            ticker_id, "historical_prices"
-        )
+        # 1. Fetch data from Yahoo Finance
+        if prefetched:
+            yf_data = prefetched
+        else:
+            plan = FetchPlan.from_config(config, ticker.get("quote_type"))
+            ranges = self.resolve_price_ranges(ticker, config) if plan.history else []
+            if plan.history and not ranges:
+                logger.info(f"Price history for {symbol} is already complete")
+                plan.history = False
 
-        start_date = config.start_date or self.data_fetcher.determine_start_date(
-            last_price_update, backfill
-        )
+            if not plan.endpoints():
+                self._record_coverage(ticker, config, None)
+                return updates
 
-        # 1. Fetch data from Yahoo Finance
-        yf_data = self.data_fetcher.fetch_ticker_data(symbol, exchange, start_date)
+            yf_data = self.data_fetcher.fetch_ticker_data(
+                symbol,
+                exchange,
+                ranges[0].start if ranges else date.today(),
+                plan=plan,
+                use_cache=config.use_cache,
+                history_ranges=ranges,
+                adjusted_history=not self.adjusts_prices(ticker, config),
+            )
+
+        if config.process_prices:
+            self._record_coverage(ticker, config, yf_data)
 
         if not yf_data:
             logger.warning(f"Failed to fetch data for {symbol}")
             return updates
 
-        # 2. Transform and save price data
+        # 2. Transform and save price data, one write batch of rows at a time
         if config.process_prices and yf_data.price_history:
-            db_prices = self.transformer.transform_historical_prices(
-                yf_data.price_history, ticker_id
-            )
+            prices = yf_data.price_history.block
+            if not prices.adjusted:
+                prices = self._adjust_prices(
+                    symbol, ticker_id, prices, config, price_writer
+                )
+            for block in prices.batches(config.write_batch_rows):
+                if self._save_price_block(symbol, ticker_id, block, config, price_writer):
+                    updates.add("historical_prices")
 
-            if db_prices and self.data_saver.save_historical_prices(symbol, db_prices):
-                updates.add("historical_prices")
+        fetched = set(yf_data.fetched_endpoints)
 
         # 3. Transform and save ticker info
-        if config.process_info and yf_data.info:
+        if config.process_info and "info" in fetched:
             # Update ticker info
             db_ticker_info = self.transformer.transform_ticker_info(
                 yf_data.info, ticker_id, backfill
             )
 
-            if db_ticker_info and self.data_saver.update_ticker_info(db_ticker_info):
+            if db_ticker_info and self.data_saver.update_ticker_info(
+                db_ticker_info, skip_unchanged=not config.force_update
+            ):
                 updates.add("tickers")
 
             # Save finance daily data
@@ -91,7 +536,15 @@ class TickerProcessor:
                 yf_data.info, ticker_id
             )
 
-            if db_finance and self.data_saver.save_finance_daily(db_finance):
+            # A live quote owns the price statistics; ``update_analytics``
+            # leaves the row alone so it is written once per run
+            ticker["live_quote"] = bool(
+                db_finance and db_finance.regular_market_price is not None
+            )
+
+            if db_finance and self.data_saver.save_finance_daily(
+                db_finance, skip_unchanged=not config.force_update
+            ):
                 updates.add("yh_finance_daily")
 
         # 4. Transform and save calendar events
@@ -109,6 +562,7 @@ class TickerProcessor:
         if (
             config.process_fund_data
             and yf_data.fund_data
+            and "info" in fetched
             and yf_data.info.quote_type in ["ETF", "MUTUALFUND"]
         ):
             fund_data = self.transformer.transform_fund_holdings(
@@ -5,12 +5,34 @@ This module contains the TickerSelector class that handles selecting tickers
 from the database based on configuration parameters.
 """
 
-from typing import Dict, List, Any
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from src.core.logging_config import setup_logging
+from src.core.market_calendar import (
+    ALWAYS_OPEN_QUOTE_TYPES,
+    SETTLE_DELAY,
+    closed_reason,
+    is_market_open,
+    last_session_close,
+    market_time,
+)
 from src.events.event_processor import PipelineConfig
+from src.services.data_saver import DataSaver
 
 logger = setup_logging(name="ticker_selector")
 
+TICKER_COLUMNS = "id, symbol, exchange, backfill, quote_type"
+
+
+class TickerPageError(Exception):
+    """Raised when a page of tickers cannot be read from the database."""
+
+    def __init__(self, after_id: Optional[str], error: Exception):
+        super().__init__(f"Failed to fetch tickers after {after_id}: {error}")
+        # Last id read before the failed page (None: from the beginning)
+        self.after_id = after_id
+
 
 class TickerSelector:
     """
@@ -19,6 +41,7 @@ class TickerSelector:
 
     def __init__(self, supabase_client):
         self.supabase = supabase_client
+        self.data_saver = DataSaver(supabase_client)
 
     def select_tickers(self, config: PipelineConfig) -> List[Dict[str, Any]]:
         """
@@ -30,83 +53,223 @@ class TickerSelector:
         Returns:
             List of ticker dictionaries
         """
+        return [
+            ticker
+            for page in self.iter_ticker_pages(config, config.page_size)
+            for ticker in page
+        ]
+
+    def iter_ticker_pages(
+        self,
+        config: PipelineConfig,
+        page_size: int = 500,
+        after_id: Optional[str] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Select tickers page by page based on the pipeline configuration.
+
+        Args:
+            config: Pipeline configuration with selection criteria
+            page_size: Tickers per page
+            after_id: Only select tickers with a greater id (to resume a run)
+
+        Yields:
+            Lists of ticker dictionaries
+        """
         if config.specific_tickers:
             # Specific tickers take precedence
-            return self.fetch_specific_tickers(config.specific_tickers)
+            yield from self.iter_specific_tickers(
+                config.specific_tickers, page_size, after_id
+            )
         elif config.ticker_types:
             # Filter by ticker types
-            return self.fetch_tickers_by_type(config.ticker_types)
+            yield from self.iter_tickers_by_type(
+                config.ticker_types, page_size, after_id
+            )
         else:
             # Default to all tickers
-            return self.fetch_all_tickers()
+            yield from self.iter_all_tickers(page_size, after_id)
 
     def fetch_all_tickers(self) -> List[Dict[str, Any]]:
         """Fetch all tickers from the database."""
-        try:
-            response = (
-                self.supabase.table("tickers")
-                .select("id, symbol, exchange, backfill, quote_type")
-                .execute()
-            )
-            tickers = response.data
-            logger.info(f"Fetched {len(tickers)} tickers from database")
-            return self._validate_tickers(tickers)
-        except Exception as e:
-            logger.error(f"Failed to fetch tickers from database: {e}")
-            return []
+        return [t for page in self.iter_all_tickers() for t in page]
 
     def fetch_specific_tickers(self, symbols: List[str]) -> List[Dict[str, Any]]:
         """Fetch specific tickers by symbol."""
-        if not symbols:
-            logger.warning("No symbols provided for specific ticker fetch")
-            return []
+        return [t for page in self.iter_specific_tickers(symbols) for t in page]
 
-        try:
-            # Convert symbols to uppercase for consistent matching
-            upper_symbols = [s.upper() for s in symbols]
+    def fetch_tickers_by_type(self, ticker_types: List[str]) -> List[Dict[str, Any]]:
+        """Fetch tickers by quote type."""
+        return [t for page in self.iter_tickers_by_type(ticker_types) for t in page]
 
-            response = (
-                self.supabase.table("tickers")
-                .select("id, symbol, exchange, backfill, quote_type")
-                .in_("symbol", upper_symbols)
-                .execute()
-            )
+    def iter_all_tickers(
+        self, page_size: int = 500, after_id: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Fetch all tickers from the database, page by page."""
+        count = 0
+        for page in self._iter_pages(page_size=page_size, after_id=after_id):
+            count += len(page)
+            yield page
+        logger.info(f"Fetched {count} tickers from database")
 
-            tickers = response.data
-            logger.info(f"Fetched {len(tickers)} specific tickers from database")
+    def iter_specific_tickers(
+        self, symbols: List[str], page_size: int = 500, after_id: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Fetch specific tickers by symbol, page by page."""
+        if not symbols:
+            logger.warning("No symbols provided for specific ticker fetch")
+            return
 
-            # Check for missing symbols
-            found_symbols = [t["symbol"].upper() for t in tickers]
-            missing = [s for s in upper_symbols if s not in found_symbols]
-            if missing:
-                logger.warning(f"Some requested tickers were not found: {missing}")
+        # Convert symbols to uppercase for consistent matching
+        upper_symbols = [s.upper() for s in symbols]
 
-            return self._validate_tickers(tickers)
-        except Exception as e:
-            logger.error(f"Failed to fetch specific tickers: {e}")
-            return []
+        found_symbols = set()
+        for page in self._iter_pages("symbol", upper_symbols, page_size, after_id):
+            found_symbols.update(t["symbol"] for t in page)
+            yield page
+        logger.info(f"Fetched {len(found_symbols)} specific tickers from database")
 
-    def fetch_tickers_by_type(self, ticker_types: List[str]) -> List[Dict[str, Any]]:
-        """Fetch tickers by quote type."""
+        # Check for missing symbols (ones before a resume point were done)
+        missing = [s for s in upper_symbols if s not in found_symbols]
+        if missing and after_id is None:
+            logger.warning(f"Some requested tickers were not found: {missing}")
+
+    def iter_tickers_by_type(
+        self,
+        ticker_types: List[str],
+        page_size: int = 500,
+        after_id: Optional[str] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Fetch tickers by quote type, page by page."""
         if not ticker_types:
             logger.warning("No ticker types provided for type-based fetch")
-            return []
-
-        try:
-            response = (
-                self.supabase.table("tickers")
-                .select("id, symbol, exchange, backfill, quote_type")
-                .in_("quote_type", ticker_types)
-                .execute()
+            return
+
+        count = 0
+        for page in self._iter_pages("quote_type", ticker_types, page_size, after_id):
+            count += len(page)
+            yield page
+        logger.info(f"Fetched {count} tickers of types {ticker_types}")
+
+    def _iter_pages(
+        self,
+        column: Optional[str] = None,
+        values: Optional[List[str]] = None,
+        page_size: int = 500,
+        after_id: Optional[str] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Keyset-paginate the tickers table by id.
+
+        Each page asks for the rows after the last id seen, so pages stay
+        cheap however deep the scan goes and no page exceeds PostgREST's row
+        cap.
+
+        Args:
+            column: Column to filter on with ``in_`` (optional)
+            values: Values for the filter column
+            page_size: Rows per page
+            after_id: Id to start after (default: from the beginning)
+
+        Yields:
+            Validated ticker dictionaries, one list per page
+
+        Raises:
+            TickerPageError: A page query failed; carries the last id read so
+                the scan can be resumed from there
+        """
+        last_id = after_id
+        while True:
+            try:
+                query = (
+                    self.supabase.table("tickers")
+                    .select(TICKER_COLUMNS)
+                    .order("id")
+                    .limit(page_size)
+                )
+                if column:
+                    query = query.in_(column, values)
+                if last_id is not None:
+                    query = query.gt("id", last_id)
+                rows = query.execute().data or []
+            except Exception as e:
+                raise TickerPageError(last_id, e) from e
+
+            tickers = self._validate_tickers(rows)
+            if tickers:
+                yield tickers
+
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1]["id"]
+
+    def skip_fresh_tickers(
+        self,
+        tickers: List[Dict[str, Any]],
+        config: PipelineConfig,
+        now: Optional[datetime] = None,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+        """
+        Drop tickers whose data cannot have changed since their last update.
+
+        A ticker is fresh when every table the run would write to
+        (``historical_prices`` for prices, ``yh_finance_daily`` for info) was
+        written after the close of the last completed NYSE session. While a
+        session is in progress nothing is fresh, and tickers that trade
+        around the clock are never skipped. ``force_update`` disables this.
+
+        Args:
+            tickers: Selected ticker dictionaries
+            config: Pipeline configuration
+            now: Current time (default: now)
+
+        Returns:
+            Tuple of (tickers to process, skipped symbol -> reason)
+        """
+        tables = []
+        if config.process_prices:
+            tables.append("historical_prices")
+        if config.process_info:
+            tables.append("yh_finance_daily")
+
+        if config.force_update or not tables or is_market_open(now):
+            return tickers, {}
+
+        candidates = [
+            t for t in tickers if t.get("quote_type") not in ALWAYS_OPEN_QUOTE_TYPES
+        ]
+        if not candidates:
+            return tickers, {}
+
+        close = last_session_close(now)
+        fresh_ids = {t["id"] for t in candidates}
+        for table in tables:
+            fresh_ids &= self.data_saver.get_updated_ticker_ids(
+                list(fresh_ids), table, close + SETTLE_DELAY
             )
+            if not fresh_ids:
+                return tickers, {}
 
-            tickers = response.data
-            logger.info(f"Fetched {len(tickers)} tickers of types {ticker_types}")
+        # Explain the skip in terms of today's calendar
+        closed = closed_reason(market_time(now).date())
+        if closed:
+            reason = f"market closed ({closed}), up to date since {close.date()} close"
+        else:
+            reason = f"already updated since {close.date()} close"
+
+        remaining = []
+        skipped = {}
+        for ticker in tickers:
+            if ticker["id"] in fresh_ids:
+                skipped[ticker["symbol"]] = reason
+            else:
+                remaining.append(ticker)
 
-            return self._validate_tickers(tickers)
-        except Exception as e:
-            logger.error(f"Failed to fetch tickers by type: {e}")
-            return []
+        logger.info(
+            f"Skipping {len(skipped)} of {len(tickers)} fresh tickers",
+            extra={"skip_reasons": dict(Counter(skipped.values()))},
+        )
+        return remaining, skipped
 
     def _validate_tickers(self, tickers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Validate and normalize ticker data."""
@@ -0,0 +1,154 @@
+"""
+Split and dividend adjustment of daily prices.
+
+Prices are adjusted the way Yahoo's ``auto_adjust`` adjusts them: a dividend
+``d`` going ex on a session multiplies every earlier price by
+``1 - d / previous_close``, and a split of ratio ``s`` divides earlier prices
+and dividends by ``s`` and multiplies earlier volumes by it. A row's factor is
+the product over all later actions, computed for a whole series with one
+reversed cumulative product.
+
+Yahoo's unadjusted history is already split-adjusted, so a fetched block only
+needs its dividend factors; split factors apply to stored rows that were
+written before the split.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Optional, Union
+
+import numpy as np
+
+from src.models.price_block import PriceBlock
+
+
+@dataclass(slots=True)
+class ActionFactors:
+    """
+    Per-row factors of each row's own actions, which apply to every earlier
+    row (1.0 where a row has no action).
+    """
+
+    price: np.ndarray
+    volume: np.ndarray
+
+    def select(self, rows: np.ndarray) -> "ActionFactors":
+        """Factors of the selected rows only."""
+        return ActionFactors(self.price[rows], self.volume[rows])
+
+
+def has_actions(block: PriceBlock) -> np.ndarray:
+    """Mask of rows with a dividend or a split."""
+    return (block.dividends > 0) | (block.stock_splits > 0)
+
+
+def last_close(block: PriceBlock) -> Optional[float]:
+    """Last close of a block that is not missing."""
+    closes = block.close[~np.isnan(block.close)]
+    return float(closes[-1]) if len(closes) else None
+
+
+def action_factors(
+    block: PriceBlock, previous_close: Optional[float] = None, splits: bool = True
+) -> ActionFactors:
+    """
+    Factors of the dividends and (optionally) splits in a block.
+
+    A dividend is measured against the last close before its session; one
+    without such a close (first row and no ``previous_close``) is left out.
+
+    Args:
+        block: Unadjusted prices, split-adjusted to the current share basis
+        previous_close: Close of the session before the block's first row,
+            in the same share basis
+        splits: Whether to include split factors (False for Yahoo's
+            unadjusted history, which already includes them)
+
+    Returns:
+        Per-row price and volume factors
+    """
+    rows = len(block)
+
+    # Close of the session before each row, carried forward over missing ones
+    closes = np.empty(rows)
+    if rows:
+        closes[0] = np.nan if previous_close is None else previous_close
+        closes[1:] = block.close[:-1]
+    known = np.maximum.accumulate(np.where(np.isnan(closes), -1, np.arange(rows)))
+    closes = np.where(known >= 0, closes[np.maximum(known, 0)], np.nan)
+
+    price = np.ones(rows)
+    dividend = block.dividends > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        price[dividend] = 1.0 - block.dividends[dividend] / closes[dividend]
+    price[~np.isfinite(price) | (price <= 0)] = 1.0
+
+    volume = np.ones(rows)
+    if splits:
+        split = block.stock_splits > 0
+        price[split] /= block.stock_splits[split]
+        volume[split] = block.stock_splits[split]
+
+    return ActionFactors(price, volume)
+
+
+def cumulative_factors(factors: np.ndarray) -> np.ndarray:
+    """Per row, the product of the factors of all later rows."""
+    result = np.ones(len(factors))
+    if len(factors) > 1:
+        result[:-1] = np.cumprod(factors[::-1])[::-1][1:]
+    return result
+
+
+def scale(
+    block: PriceBlock,
+    price: Union[float, np.ndarray],
+    volume: Union[float, np.ndarray] = 1.0,
+    dividends: Union[float, np.ndarray] = 1.0,
+) -> PriceBlock:
+    """
+    New block with prices, volumes and dividends multiplied by the given
+    factors (scalars or one per row).
+    """
+    return replace(
+        block,
+        open=block.open * price,
+        high=block.high * price,
+        low=block.low * price,
+        close=block.close * price,
+        volume=np.round(block.volume * volume).astype(np.int64),
+        dividends=block.dividends * dividends,
+        adjusted=True,
+    )
+
+
+def adjust_fetched(
+    block: PriceBlock, previous_close: Optional[float] = None
+) -> PriceBlock:
+    """
+    Adjust Yahoo's unadjusted history for the dividends within it, as
+    ``auto_adjust`` would for the same range.
+
+    Args:
+        block: Unadjusted (split-adjusted) prices
+        previous_close: Close of the session before the first row
+
+    Returns:
+        Adjusted block
+    """
+    factors = action_factors(block, previous_close, splits=False)
+    return scale(block, cumulative_factors(factors.price))
+
+
+def readjust_stored(stored: PriceBlock, actions: ActionFactors) -> PriceBlock:
+    """
+    Re-adjust stored history for actions that happened after it.
+
+    Args:
+        stored: Stored rows, all earlier than the actions
+        actions: Factors of the new actions
+
+    Returns:
+        Block with prices, volumes and dividends in the new basis
+    """
+    price, volume = float(actions.price.prod()), float(actions.volume.prod())
+    return scale(stored, price, volume, dividends=1.0 / volume)
@@ -2,68 +2,65 @@
 Transformers for converting between source and database models.
 """
 
-from typing import List, Dict, Set, Optional
-from datetime import date
+from typing import Any, List, Dict, Set, Optional, Union
+from datetime import date, datetime
 
 from src.models.source_models import YFTickerInfo, YFPriceHistory
 from src.models.source_models import YFCalendar, YFFundData
-from src.models.db_models import DBHistoricalPrice, DBFinanceDaily, DBTickerInfo
-from src.models.db_models import (
-    DBCalendarEvent,
-    DBFundHolding,
-    DBSectorWeighting,
-    DBAssetClass,
+from src.models.db_models import DBFinanceDaily, DBTickerInfo, DBCalendarEvent
+from src.models.price_block import PriceBlock
+from src.models.records import (
+    AssetClassRecord,
+    FundHoldingRecord,
+    SectorWeightingRecord,
 )
 
+from src.core.instrumentation import timed
 from src.core.logging_config import setup_logging
 
 logger = setup_logging(name="model_transformers")
 
 
+def price_block(
+    source: Optional[Union[YFPriceHistory, PriceBlock]]
+) -> Optional[PriceBlock]:
+    """The price block behind a price history (or the block itself)."""
+    if isinstance(source, YFPriceHistory):
+        return source.block
+    return source
+
+
 class ModelTransformer:
     """
     Transforms data between source models and database models.
     """
 
     @staticmethod
-    def transform_historical_prices(
-        source: YFPriceHistory, ticker_id: str
-    ) -> List[DBHistoricalPrice]:
+    @timed("transform.price_records")
+    def transform_historical_price_records(
+        source: Union[YFPriceHistory, PriceBlock], ticker_id: str
+    ) -> List[Dict[str, Any]]:
         """
-        Transform price history to database model.
+        Transform price history straight into upsert-ready records.
+
+        Records are built per column of the price block, without a model per
+        row, and match ``DBHistoricalPrice.model_dump(exclude_none=True)``.
 
         Args:
-            source: Source price history data
+            source: Source price history data, or a block (slice) of it
             ticker_id: Database ticker ID
 
         Returns:
-            List of database historical price models
+            List of historical price records
         """
-        if not source or not source.data:
+        block = price_block(source)
+        if block is None:
             return []
 
-        result = []
-
-        for date_obj, price_data in source.data.items():
-            date_str = date_obj.strftime("%Y-%m-%d")
-
-            db_price = DBHistoricalPrice(
-                ticker_id=ticker_id,
-                date=date_str,
-                open_price=price_data.open,
-                high_price=price_data.high,
-                low_price=price_data.low,
-                close_price=price_data.close,
-                volume=price_data.volume,
-                dividends=price_data.dividends,
-                stock_splits=price_data.stock_splits,
-            )
-
-            result.append(db_price)
-
-        return result
+        return block.records(ticker_id, datetime.now().isoformat())
 
     @staticmethod
+    @timed("transform.ticker_info")
     def transform_ticker_info(
         source: YFTickerInfo, ticker_id: str, backfill: bool = False
     ) -> DBTickerInfo:
@@ -92,6 +89,7 @@ class ModelTransformer:
         )
 
     @staticmethod
+    @timed("transform.finance_daily")
     def transform_finance_daily(source: YFTickerInfo, ticker_id: str) -> DBFinanceDaily:
         """
         Transform ticker info to finance daily data.
@@ -145,6 +143,7 @@ class ModelTransformer:
         )
 
     @staticmethod
+    @timed("transform.calendar_events")
     def transform_calendar_events(
         source: YFCalendar, ticker_id: str
     ) -> List[DBCalendarEvent]:
@@ -200,18 +199,19 @@ class ModelTransformer:
         return result
 
     @staticmethod
+    @timed("transform.fund_holdings")
     def transform_fund_holdings(
         source: Optional[YFFundData], ticker_id: str
     ) -> Dict[str, List]:
         """
-        Transform fund data to database models.
+        Transform fund data to database records.
 
         Args:
             source: Source fund data
             ticker_id: Database ticker ID
 
         Returns:
-            Dictionary with lists of database models for each fund data type
+            Dictionary with lists of database records for each fund data type
         """
         result = {"holdings": [], "sectors": [], "assets": []}
 
@@ -219,40 +219,46 @@ class ModelTransformer:
             return result
 
         today_str = date.today().strftime("%Y-%m-%d")
+        updated_at = datetime.now().isoformat()
 
         # Process top holdings
         if source.top_holdings and source.top_holdings.holdings:
-            for symbol, holding in source.top_holdings.holdings.items():
-                db_holding = DBFundHolding(
+            result["holdings"] = [
+                FundHoldingRecord(
                     ticker_id=ticker_id,
                     holding_symbol=symbol,
                     holding_name=holding.name,
                     weight=holding.holding_percent * 100,  # Convert to percentage
                     date=today_str,
+                    updated_at=updated_at,
                 )
-                result["holdings"].append(db_holding)
+                for symbol, holding in source.top_holdings.holdings.items()
+            ]
 
         # Process sector weightings
         if source.sector_weightings and source.sector_weightings.sectors:
-            for sector, weight in source.sector_weightings.sectors.items():
-                db_sector = DBSectorWeighting(
+            result["sectors"] = [
+                SectorWeightingRecord(
                     ticker_id=ticker_id,
                     sector_name=sector,
                     weight=weight * 100,  # Convert to percentage
                     date=today_str,
+                    updated_at=updated_at,
                 )
-                result["sectors"].append(db_sector)
+                for sector, weight in source.sector_weightings.sectors.items()
+            ]
 
         # Process asset allocation
         if source.asset_allocation and source.asset_allocation.assets:
-            for asset_class, weight in source.asset_allocation.assets.items():
-                db_asset = DBAssetClass(
+            result["assets"] = [
+                AssetClassRecord(
                     ticker_id=ticker_id,
                     asset_class=asset_class,
                     weight=weight * 100,  # Convert to percentage
                     date=today_str,
+                    updated_at=updated_at,
                 )
-                result["assets"].append(db_asset)
+                for asset_class, weight in source.asset_allocation.assets.items()
+            ]
 
         return result
-
@@ -0,0 +1,212 @@
+"""
+Rolling price statistics computed from stored price history.
+
+Fills the ``yh_finance_daily`` columns that were otherwise copied from
+Yahoo's quote summary (moving averages, 52-week range, YTD and 3-month
+returns, last price), so prices-only runs and tickers Yahoo has no summary
+for (indices, currencies) get them too.
+
+All tickers are computed together: their histories are right-aligned into
+one ``tickers x sessions`` matrix (NaN-padded on the left), and every
+statistic is a single NumPy reduction over its rows.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.core.instrumentation import timed
+from src.models.db_models import DBFinanceDaily
+from src.models.price_block import PriceBlock
+
+# Calendar days of stored history needed: a year back for 1Y returns and the
+# 52-week range, plus room for the last close before a holiday-heavy start
+WINDOW_DAYS = 380
+
+# Sessions per year, to annualize volatility
+TRADING_DAYS = 252
+
+# Calendar-day lookbacks of the trailing returns
+RETURN_PERIODS = {"return_1m": 30, "return_3m": 91, "return_1y": 365}
+
+# Fewest daily returns a volatility is reported for
+MIN_VOLATILITY_RETURNS = 20
+
+
+@dataclass(slots=True)
+class PriceAnalytics:
+    """
+    Statistics for one ticker as of its last stored session.
+
+    Returns and the day's change are percentages, like the Yahoo values
+    they replace. 1M and 1Y returns and volatility (annualized standard
+    deviation of daily returns over the last year) have no
+    ``yh_finance_daily`` column and are not written.
+    """
+
+    ticker_id: str
+    as_of: date
+    last_close: Optional[float] = None
+    volume: Optional[int] = None
+    change_percent: Optional[float] = None
+    fifty_day_average: Optional[float] = None
+    two_hundred_day_average: Optional[float] = None
+    fifty_two_week_low: Optional[float] = None
+    fifty_two_week_high: Optional[float] = None
+    ytd_return: Optional[float] = None
+    return_1m: Optional[float] = None
+    return_3m: Optional[float] = None
+    return_1y: Optional[float] = None
+    volatility: Optional[float] = None
+
+    def finance_daily(self) -> DBFinanceDaily:
+        """The ``yh_finance_daily`` columns these statistics fill."""
+        return DBFinanceDaily(
+            ticker_id=self.ticker_id,
+            regular_market_price=self.last_close,
+            regular_market_change_percent=self.change_percent,
+            regular_market_volume=self.volume,
+            fifty_two_week_low=self.fifty_two_week_low,
+            fifty_two_week_high=self.fifty_two_week_high,
+            fifty_day_average=self.fifty_day_average,
+            two_hundred_day_average=self.two_hundred_day_average,
+            ytd_return=self.ytd_return,
+            trailing_three_month_returns=self.return_3m,
+        )
+
+
+def _optional(values: np.ndarray) -> List[Optional[float]]:
+    """Floats with NaN (and infinities) as None."""
+    return [v if np.isfinite(v) else None for v in values.tolist()]
+
+
+def _moving_average(close: np.ndarray, sessions: int) -> np.ndarray:
+    """Mean of the last ``sessions`` closes; NaN without that many."""
+    if close.shape[1] < sessions:
+        return np.full(close.shape[0], np.nan)
+    return close[:, -sessions:].mean(axis=1)
+
+
+def _close_on_or_before(
+    close: np.ndarray, days: np.ndarray, target: np.ndarray
+) -> np.ndarray:
+    """Per row, the last close on or before ``target`` (NaN if none stored)."""
+    columns = np.arange(close.shape[1])
+    index = np.where(days <= target[:, None], columns, -1).max(axis=1)
+    found = index >= 0
+    base = np.full(close.shape[0], np.nan)
+    base[found] = close[found, index[found]]
+    return base
+
+
+def _percent_change(last: np.ndarray, base: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (last / base - 1.0) * 100.0
+
+
+@timed("transform.analytics")
+def compute_price_analytics(
+    blocks: Dict[str, PriceBlock]
+) -> Dict[str, PriceAnalytics]:
+    """
+    Compute rolling statistics for many tickers at once.
+
+    Each ticker's statistics are as of its own last session with a close,
+    so a ticker that stopped trading is not compared against today.
+
+    Args:
+        blocks: Stored prices per ticker ID, in date order, covering at
+            least the last ``WINDOW_DAYS`` days for complete statistics
+
+    Returns:
+        Statistics per ticker ID (tickers without a close are left out)
+    """
+    valid = {
+        ticker_id: ~np.isnan(block.close) for ticker_id, block in blocks.items()
+    }
+    ticker_ids = [t for t, mask in valid.items() if mask.any()]
+    if not ticker_ids:
+        return {}
+
+    rows = len(ticker_ids)
+    width = max(int(valid[t].sum()) for t in ticker_ids)
+
+    # Right-aligned matrices: the last column is every ticker's last session
+    close = np.full((rows, width), np.nan)
+    high = np.full((rows, width), np.nan)
+    low = np.full((rows, width), np.nan)
+    volume = np.full(rows, np.nan)
+    days = np.full((rows, width), np.iinfo(np.int64).min, dtype=np.int64)
+
+    for row, ticker_id in enumerate(ticker_ids):
+        block, mask = blocks[ticker_id], valid[ticker_id]
+        count = int(mask.sum())
+        close[row, -count:] = block.close[mask]
+        high[row, -count:] = block.high[mask]
+        low[row, -count:] = block.low[mask]
+        days[row, -count:] = block.dates[mask].astype(np.int64)
+
+        last = np.flatnonzero(mask)[-1]
+        if block.volume_missing is None or not block.volume_missing[last]:
+            volume[row] = block.volume[last]
+
+    last_close = close[:, -1]
+    last_day = days[:, -1]
+    previous = close[:, -2] if width > 1 else np.full(rows, np.nan)
+
+    # 52-week range over highs and lows, falling back to closes where missing
+    in_year = days > (last_day - 365)[:, None]
+    high = np.where(np.isnan(high), close, high)
+    low = np.where(np.isnan(low), close, low)
+    week52_high = np.where(in_year & ~np.isnan(high), high, -np.inf).max(axis=1)
+    week52_low = np.where(in_year & ~np.isnan(low), low, np.inf).min(axis=1)
+
+    # YTD from the last close of the previous year
+    year_start = (
+        last_day.astype("datetime64[D]").astype("datetime64[Y]").astype("datetime64[D]")
+    )
+    ytd_base = _close_on_or_before(close, days, year_start.astype(np.int64) - 1)
+
+    returns = {
+        name: _percent_change(
+            last_close, _close_on_or_before(close, days, last_day - lookback)
+        )
+        for name, lookback in RETURN_PERIODS.items()
+    }
+
+    # Annualized volatility of daily returns within the last year
+    with np.errstate(divide="ignore", invalid="ignore"):
+        daily = close[:, 1:] / close[:, :-1] - 1.0
+    daily[~in_year[:, :-1]] = np.nan
+    counts = (~np.isnan(daily)).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.nansum(daily, axis=1) / counts
+        variance = np.nansum((daily - mean[:, None]) ** 2, axis=1) / (counts - 1)
+    volatility = np.sqrt(variance * TRADING_DAYS) * 100.0
+    volatility[counts < MIN_VOLATILITY_RETURNS] = np.nan
+
+    columns = {
+        "last_close": _optional(last_close),
+        "change_percent": _optional(_percent_change(last_close, previous)),
+        "fifty_day_average": _optional(_moving_average(close, 50)),
+        "two_hundred_day_average": _optional(_moving_average(close, 200)),
+        "fifty_two_week_low": _optional(week52_low),
+        "fifty_two_week_high": _optional(week52_high),
+        "ytd_return": _optional(_percent_change(last_close, ytd_base)),
+        **{name: _optional(values) for name, values in returns.items()},
+        "volatility": _optional(volatility),
+    }
+    as_of = last_day.astype("datetime64[D]").tolist()
+    volumes = [None if np.isnan(v) else int(v) for v in volume.tolist()]
+
+    return {
+        ticker_id: PriceAnalytics(
+            ticker_id=ticker_id,
+            as_of=as_of[row],
+            volume=volumes[row],
+            **{name: values[row] for name, values in columns.items()},
+        )
+        for row, ticker_id in enumerate(ticker_ids)
+    }
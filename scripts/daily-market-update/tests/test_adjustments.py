@@ -0,0 +1,154 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.events.event_processor import PipelineConfig
+from src.models.price_block import PriceBlock
+from src.models.source_models import YFPriceHistory, YFTickerData, YFTickerInfo
+from src.services.rolling_state import RollingState, RollingStateStore
+from src.services.ticker_processor import TickerProcessor
+from src.transformers.adjustments import (
+    action_factors,
+    adjust_fetched,
+    readjust_stored,
+)
+
+SESSIONS = 60
+DIVIDEND_DAY, DIVIDEND = 40, 1.5
+SPLIT_DAY, SPLIT = 50, 2.0
+
+
+def traded():
+    """Closes as traded: a 2:1 split halves the price on SPLIT_DAY."""
+    rng = np.random.default_rng(3)
+    close = 100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, SESSIONS))
+    close[SPLIT_DAY:] /= SPLIT
+    return close
+
+
+def yahoo(day, adjusted):
+    """
+    Yahoo's history as seen after session ``day``: split-adjusted to that
+    day's share basis and, with ``adjusted``, dividend-adjusted too.
+    """
+    close = traded()[: day + 1]
+    volume = np.full(len(close), 1_000.0)
+    dividends = np.zeros(len(close))
+    splits = np.zeros(len(close))
+    if day >= DIVIDEND_DAY:
+        dividends[DIVIDEND_DAY] = DIVIDEND
+    if day >= SPLIT_DAY:
+        splits[SPLIT_DAY] = SPLIT
+        close[:SPLIT_DAY] /= SPLIT
+        volume[:SPLIT_DAY] *= SPLIT
+        dividends[:SPLIT_DAY] /= SPLIT
+
+    if adjusted and day >= DIVIDEND_DAY:
+        factor = 1.0 - dividends[DIVIDEND_DAY] / close[DIVIDEND_DAY - 1]
+        close[:DIVIDEND_DAY] *= factor
+
+    frame = pd.DataFrame(
+        {
+            "Open": close,
+            "High": close,
+            "Low": close,
+            "Close": close,
+            "Volume": volume,
+            "Dividends": dividends,
+            "Stock Splits": splits,
+        },
+        index=pd.bdate_range("2025-01-01", periods=len(close)),
+    )
+    return PriceBlock.from_frame(frame, adjusted=adjusted)
+
+
+def test_fetched_range_matches_yahoo_adjustment():
+    raw = yahoo(SESSIONS - 1, adjusted=False)
+
+    adjusted = adjust_fetched(raw)
+
+    assert adjusted.adjusted
+    np.testing.assert_allclose(adjusted.close, yahoo(SESSIONS - 1, adjusted=True).close)
+
+
+def test_stored_history_is_readjusted_for_new_actions():
+    stored = yahoo(30, adjusted=True)
+    raw = yahoo(SESSIONS - 1, adjusted=False)[31:]
+    previous_close = stored.close[-1] / SPLIT
+
+    history = readjust_stored(stored, action_factors(raw, previous_close))
+    series = PriceBlock.concat([history, adjust_fetched(raw, previous_close)])
+
+    expected = yahoo(SESSIONS - 1, adjusted=True)
+    np.testing.assert_allclose(series.close, expected.close)
+    assert series.volume.tolist() == expected.volume.tolist()
+
+
+def make_processor(tmp_path, stored):
+    processor = TickerProcessor(
+        MagicMock(),
+        data_fetcher=MagicMock(),
+        coverage_store=MagicMock(),
+        rolling_states=RollingStateStore(str(tmp_path)),
+    )
+    processor.data_saver = MagicMock()
+    processor.data_saver.get_price_history.return_value = stored
+    processor.data_saver.save_historical_prices.side_effect = lambda symbol, rows: len(rows)
+    return processor
+
+
+def run(processor, block):
+    ticker = {"id": "t", "symbol": "T", "exchange": "NYSE"}
+    data = YFTickerData(
+        ticker_symbol="T",
+        info=YFTickerInfo(symbol="T"),
+        price_history=YFPriceHistory(block=block),
+        fetched_endpoints=["history"],
+    )
+    config = PipelineConfig(batch_writes=False, process_info=False, analytics=False)
+    processor.process_ticker(ticker, config, prefetched=data)
+
+    saved = {}
+    for call in processor.data_saver.save_historical_prices.call_args_list:
+        for row in call.args[1]:
+            saved[row["date"]] = row["close_price"]
+    return saved
+
+
+def test_processor_readjusts_history_once(tmp_path):
+    stored = yahoo(45, adjusted=True)
+    raw = yahoo(SESSIONS - 1, adjusted=False)
+    processor = make_processor(tmp_path, stored)
+    processor.rolling_states.save("t", RollingState(last_day=1))
+
+    saved = run(processor, raw[46:])
+
+    expected = yahoo(SESSIONS - 1, adjusted=True)
+    assert list(saved.values()) == pytest.approx(expected.close.tolist())
+    assert processor.rolling_states.load("t") is None
+
+    # A rerun over the stored split leaves the history alone
+    rerun = make_processor(tmp_path, expected)
+
+    saved = run(rerun, raw[SPLIT_DAY:])
+
+    assert list(saved) == expected.column_lists()["date"][SPLIT_DAY:]
+    assert list(saved.values()) == pytest.approx(expected.close[SPLIT_DAY:].tolist())
+
+
+def test_processor_skips_reads_without_actions(tmp_path):
+    raw = yahoo(30, adjusted=False)
+    processor = make_processor(tmp_path, None)
+
+    saved = run(processor, raw[25:])
+
+    processor.data_saver.get_price_history.assert_not_called()
+    assert list(saved.values()) == pytest.approx(raw.close[25:].tolist())
+
+
+def test_processor_fails_ticker_when_history_is_unreadable(tmp_path):
+    processor = make_processor(tmp_path, None)
+
+    with pytest.raises(RuntimeError):
+        run(processor, yahoo(SESSIONS - 1, adjusted=False)[46:])
@@ -0,0 +1,199 @@
+import time
+import httpx
+from datetime import date, datetime
+from src.core.rate_limiter import RateLimiter, YahooEndpoint
+from src.services.async_data_fetcher import AsyncDataFetcher, FetchRequest
+from src.services.price_coverage import DateRange
+
+# 2025-03-13 and 2025-03-14, 13:30 UTC (market open)
+TIMESTAMPS = [1741872600, 1741959000]
+
+CHART = {
+    "chart": {
+        "result": [
+            {
+                "meta": {"exchangeTimezoneName": "America/New_York"},
+                "timestamp": TIMESTAMPS,
+                "indicators": {
+                    "quote": [
+                        {
+                            "open": [100.0, 102.0],
+                            "high": [101.0, 104.0],
+                            "low": [99.0, 101.0],
+                            "close": [100.0, 103.0],
+                            "volume": [1000, 2000],
+                        }
+                    ],
+                    "adjclose": [{"adjclose": [99.0, 103.0]}],
+                },
+                "events": {"dividends": {"1741959000": {"amount": 1.0, "date": 1741959000}}},
+            }
+        ]
+    }
+}
+
+SUMMARY = {
+    "quoteSummary": {
+        "result": [
+            {
+                "quoteType": {"quoteType": "ETF", "longName": "SPDR S&P 500 ETF Trust"},
+                "summaryDetail": {"fiftyDayAverage": 580.5, "yield": 0.012, "navPrice": None},
+                "calendarEvents": {"exDividendDate": 1741910400},
+                "topHoldings": {
+                    "holdings": [{"symbol": "AAPL", "holdingName": "Apple Inc", "holdingPercent": 0.07}],
+                    "sectorWeightings": [{"technology": 0.31}, {"energy": 0.03}],
+                    "stockPosition": 0.99,
+                    "cashPosition": 0.01,
+                },
+            }
+        ]
+    }
+}
+
+
+def make_fetcher(throttle_first=False):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if request.url.host == "fc.yahoo.com":
+            return httpx.Response(404)
+        if request.url.path == "/v1/test/getcrumb":
+            return httpx.Response(200, text="crumb123")
+        if request.url.path.startswith("/v8/finance/chart/"):
+            if throttle_first and calls.count(request.url.path) == 1:
+                return httpx.Response(429, text="Too Many Requests")
+            return httpx.Response(200, json=CHART)
+        if request.url.path.startswith("/v10/finance/quoteSummary/"):
+            assert request.url.params["crumb"] == "crumb123"
+            return httpx.Response(200, json=SUMMARY)
+        return httpx.Response(404)
+
+    limits = {endpoint: {"rate": 1e6, "capacity": 1e6, "cooldown": 0} for endpoint in YahooEndpoint}
+    fetcher = AsyncDataFetcher(
+        rate_limiter=RateLimiter(limits), transport=httpx.MockTransport(handler)
+    )
+    return fetcher, calls
+
+
+def test_fetch_all_builds_ticker_models():
+    fetcher, calls = make_fetcher()
+
+    results = fetcher.fetch_all(
+        [FetchRequest(symbol="SPY", exchange="NYSE", start_date=date(2025, 3, 13), quote_type="ETF")]
+    )
+
+    spy = results["SPY"]
+    assert spy.info.quote_type == "ETF"
+    assert spy.info.fifty_day_average == 580.5
+    assert spy.info.yield_value == 0.012
+
+    rows = list(spy.price_history.data.values())
+    assert [row.close for row in rows] == [99.0, 103.0]
+    assert rows[0].open == 99.0  # auto-adjusted by adjclose / close
+    assert rows[1].dividends == 1.0
+    assert rows[1].volume == 2000
+
+    assert spy.calendar.ex_dividend_date is not None
+    assert spy.fund_data.top_holdings.holdings["AAPL"].holding_percent == 0.07
+    assert spy.fund_data.sector_weightings.sectors == {"technology": 0.31, "energy": 0.03}
+    assert spy.fund_data.asset_allocation.assets == {"stock": 0.99, "cash": 0.01}
+
+    # One chart and one quoteSummary request per ticker
+    assert calls.count("/v8/finance/chart/SPY") == 1
+    assert calls.count("/v10/finance/quoteSummary/SPY") == 1
+
+
+def test_prices_only_request_skips_quote_summary():
+    fetcher, calls = make_fetcher(throttle_first=True)
+
+    results = fetcher.fetch_all(
+        [
+            FetchRequest(
+                symbol="AAPL",
+                exchange="NASDAQ",
+                start_date=date(2025, 3, 13),
+                info=False,
+                calendar=False,
+                fund_data=False,
+            )
+        ]
+    )
+
+    assert len(results["AAPL"].price_history.data) == 2
+    assert not any("quoteSummary" in path or "getcrumb" in path for path in calls)
+    assert fetcher.rate_limiter.buckets[YahooEndpoint.HISTORY].throttle_count == 1
+
+
+def test_history_ranges_are_fetched_separately_and_combined():
+    periods = []
+
+    def handler(request):
+        start, end = int(request.url.params["period1"]), int(request.url.params["period2"])
+        periods.append((start, end))
+        index = [i for i, ts in enumerate(TIMESTAMPS) if start <= ts < end]
+        result = CHART["chart"]["result"][0]
+        quote = result["indicators"]["quote"][0]
+        chart = {
+            "meta": result["meta"],
+            "timestamp": [TIMESTAMPS[i] for i in index],
+            "indicators": {"quote": [{k: [v[i] for i in index] for k, v in quote.items()}]},
+        }
+        return httpx.Response(200, json={"chart": {"result": [chart]}})
+
+    limits = {endpoint: {"rate": 1e6, "capacity": 1e6, "cooldown": 0} for endpoint in YahooEndpoint}
+    fetcher = AsyncDataFetcher(
+        rate_limiter=RateLimiter(limits), transport=httpx.MockTransport(handler)
+    )
+    ranges = [
+        DateRange(start=date(2025, 3, 13), end=date(2025, 3, 13)),
+        DateRange(start=date(2025, 3, 14), end=date(2025, 3, 14)),
+    ]
+
+    results = fetcher.fetch_all(
+        [
+            FetchRequest(
+                symbol="AAPL",
+                exchange="NASDAQ",
+                start_date=ranges[0].start,
+                info=False,
+                calendar=False,
+                fund_data=False,
+                history_ranges=ranges,
+            )
+        ]
+    )
+
+    assert len(periods) == 2
+    rows = list(results["AAPL"].price_history.data.values())
+    assert [row.close for row in rows] == [100.0, 103.0]
+
+
+def test_info_keeps_zero_values():
+    summary = {
+        "summaryDetail": {
+            "dividendRate": {"raw": 0.0, "fmt": "0.00"},
+            "trailingPE": {},
+            "navPrice": None,
+            "payoutRatio": 0,
+        }
+    }
+
+    info = AsyncDataFetcher._parse_info(summary, "BRK-B")
+
+    assert info == {"dividendRate": 0.0, "payoutRatio": 0, "symbol": "BRK-B"}
+
+
+def test_calendar_dates_are_utc(monkeypatch):
+    monkeypatch.setenv("TZ", "America/Los_Angeles")
+    time.tzset()
+    try:
+        # 2025-03-14 00:00 UTC, still the 13th in Los Angeles
+        calendar = AsyncDataFetcher._parse_calendar(
+            {"calendarEvents": {"exDividendDate": 1741910400}}
+        )
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+    assert calendar["Ex-Dividend Date"] == date(2025, 3, 14)
@@ -0,0 +1,58 @@
+from unittest.mock import Mock
+from src.models.db_models import DBHistoricalPrice
+from src.services.batch_writer import BatchedPriceWriter
+
+
+def make_prices(ticker_id, days):
+    return [
+        DBHistoricalPrice(ticker_id=ticker_id, date=f"2025-03-{day:02d}", close_price=100.0 + day)
+        for day in days
+    ]
+
+
+def upserted_rows(supabase):
+    return [call.args[0] for call in supabase.table.return_value.upsert.call_args_list]
+
+
+def test_rows_from_many_tickers_share_upserts():
+    supabase = Mock()
+    writer = BatchedPriceWriter(supabase, max_rows=4)
+
+    writer.add("AAPL", make_prices("aapl-id", [13, 14]))
+    writer.add("MSFT", make_prices("msft-id", [13, 14]))
+    writer.add("SPY", make_prices("spy-id", [13]))
+    outcomes = writer.flush()
+
+    assert [len(rows) for rows in upserted_rows(supabase)] == [4, 1]
+    assert outcomes == {"AAPL": None, "MSFT": None, "SPY": None}
+    assert writer.rows_written == {"AAPL": 2, "MSFT": 2, "SPY": 1}
+
+
+def test_byte_limit_triggers_flush():
+    supabase = Mock()
+    writer = BatchedPriceWriter(supabase, max_rows=1000, max_bytes=1)
+
+    writer.add("AAPL", make_prices("aapl-id", [13, 14, 17]))
+
+    assert len(upserted_rows(supabase)) == 3
+
+
+def test_failed_batch_is_retried_per_ticker():
+    supabase = Mock()
+
+    def execute_side_effect():
+        rows = supabase.table.return_value.upsert.call_args.args[0]
+        if any(row["ticker_id"] == "bad-id" for row in rows):
+            raise Exception("violates foreign key constraint")
+        return Mock()
+
+    supabase.table.return_value.upsert.return_value.execute.side_effect = execute_side_effect
+    writer = BatchedPriceWriter(supabase)
+
+    writer.add("AAPL", make_prices("aapl-id", [13]))
+    writer.add("BAD", make_prices("bad-id", [13]))
+    outcomes = writer.flush()
+
+    assert outcomes["AAPL"] is None
+    assert "foreign key" in outcomes["BAD"]
+    assert writer.rows_written == {"AAPL": 1}
@@ -0,0 +1,87 @@
+from datetime import date
+
+from benchmarks.fake_supabase import FakeSupabase
+from benchmarks.fake_yahoo import FakeYahoo
+from benchmarks.fixtures import load_fixture
+from benchmarks.run_benchmark import MODES, format_report, run_benchmark
+from src.core.rate_limiter import RateLimiter, YahooEndpoint
+from src.services.data_fetcher import DataFetcher, FetchPlan
+
+OPTIONS = {
+    "symbols": 12,
+    "history_days": 10,
+    "latency_ms": 0.0,
+    "db_latency_ms": 0.0,
+    "throttle_rate": 0.0,
+    "fund_ratio": 0.25,
+    "workers": 3,
+    "rate_limit": False,
+    "verbose": True,
+}
+
+
+def test_every_mode_processes_the_whole_universe():
+    results = run_benchmark(list(MODES), OPTIONS, isolate=False)
+
+    for result in results:
+        assert result["tickers"] == 12, result["mode"]
+        assert result["failed"] == 0, result["mode"]
+        assert result["rows_written"] >= 12 * 10
+        assert result["tickers_per_sec"] > 0
+        assert result["peak_rss_mb"] > 0
+        assert "ticker.total" in result["stages"]
+
+    assert "sequential" in format_report(results)
+
+
+def test_throttled_requests_are_retried():
+    results = run_benchmark(["sequential"], {**OPTIONS, "throttle_rate": 0.3}, isolate=False)
+
+    assert results[0]["yahoo_throttled"]
+    assert results[0]["failed"] == 0
+
+
+def test_throttled_history_reaches_the_limiter():
+    yahoo = FakeYahoo({"AAPL": load_fixture("AAPL")}, {"AAPL": "AAPL"}, throttle_rate=1.0)
+    limits = {endpoint: {"rate": 1e6, "capacity": 1e6, "cooldown": 0} for endpoint in YahooEndpoint}
+    fetcher = DataFetcher(rate_limiter=RateLimiter(limits))
+    plan = FetchPlan(info=False, calendar=False, funds_data=False)
+
+    # Like yfinance, the fake returns an empty frame unless errors are raised
+    assert yahoo.ticker("AAPL").history(start=date(2025, 3, 3), end=date(2025, 3, 18)).empty
+
+    with yahoo.patch():
+        result = fetcher.fetch_ticker_data(
+            "AAPL", "NASDAQ", date(2025, 3, 3), max_retries=2, plan=plan, use_cache=False
+        )
+
+    assert result is None
+    assert yahoo.requests["history"] == 4
+    assert fetcher.rate_limiter.buckets[YahooEndpoint.HISTORY].throttle_count == 2
+
+
+def test_fake_supabase_upserts_on_conflict_columns():
+    supabase = FakeSupabase()
+    table = supabase.table("historical_prices")
+    table.upsert([{"ticker_id": "t1", "date": "2025-03-17", "close_price": 1.0}],
+                 on_conflict="ticker_id,date").execute()
+    supabase.table("historical_prices").upsert(
+        [{"ticker_id": "t1", "date": "2025-03-17", "close_price": 2.0},
+         {"ticker_id": "t1", "date": "2025-03-18", "close_price": 3.0}],
+        on_conflict="ticker_id,date",
+    ).execute()
+
+    rows = (
+        supabase.table("historical_prices")
+        .select("date, close_price")
+        .eq("ticker_id", "t1")
+        .order("date", desc=True)
+        .limit(5)
+        .execute()
+        .data
+    )
+    assert rows == [
+        {"date": "2025-03-18", "close_price": 3.0},
+        {"date": "2025-03-17", "close_price": 2.0},
+    ]
+    assert supabase.rows_written("historical_prices") == 3
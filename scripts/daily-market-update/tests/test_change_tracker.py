@@ -0,0 +1,111 @@
+from unittest.mock import MagicMock
+from src.models.db_models import DBFinanceDaily, DBTickerInfo
+from src.services.change_tracker import ChangeTracker
+from src.services.data_saver import DataSaver
+
+
+def make_saver():
+    return DataSaver(MagicMock(), ChangeTracker())
+
+
+def sent_rows(supabase, method):
+    return [c.args[0] for c in getattr(supabase.table.return_value, method).call_args_list]
+
+
+def test_unchanged_ticker_info_is_not_rewritten():
+    saver = make_saver()
+    info = DBTickerInfo(id="t1", name="Apple Inc.", long_business_summary="x" * 4000)
+
+    assert saver.update_ticker_info(info)
+    assert not saver.update_ticker_info(info.model_copy(update={"updated_at": "later"}))
+
+    rows = sent_rows(saver.supabase, "update")
+    assert len(rows) == 1
+    assert rows[0]["long_business_summary"] == "x" * 4000
+    assert saver.change_tracker.stats()["tickers"]["skipped"] == 1
+
+
+def test_only_changed_columns_are_sent():
+    saver = make_saver()
+    saver.save_finance_daily(
+        DBFinanceDaily(ticker_id="t1", regular_market_price=211.0, trailing_pe=33.1)
+    )
+    saver.save_finance_daily(
+        DBFinanceDaily(ticker_id="t1", regular_market_price=213.5, trailing_pe=33.1)
+    )
+
+    upserted = [c.args[0][0] for c in saver.supabase.table.return_value.upsert.call_args_list]
+    assert len(upserted) == 2
+    assert set(upserted[1]) == {"ticker_id", "regular_market_price", "updated_at"}
+    assert upserted[1]["regular_market_price"] == 213.5
+
+
+def test_force_write_sends_full_row():
+    saver = make_saver()
+    info = DBTickerInfo(id="t1", name="Apple Inc.")
+    saver.update_ticker_info(info)
+
+    assert saver.update_ticker_info(info, skip_unchanged=False)
+    assert sent_rows(saver.supabase, "update")[1]["name"] == "Apple Inc."
+
+
+def test_primed_rows_compare_equal_despite_numeric_types():
+    saver = make_saver()
+    saver.supabase.table.return_value.select.return_value.in_.return_value.execute.return_value = MagicMock(
+        data=[{"ticker_id": "t1", "id": "r1", "market_cap": 3.2e12, "date": "2025-03-19",
+               "updated_at": "2025-03-19T10:00:00"}]
+    )
+    saver.prime_change_tracker(["t1"])
+
+    finance = DBFinanceDaily(ticker_id="t1", market_cap=3200000000000, date="2025-03-19")
+    assert not saver.save_finance_daily(finance)
+    saver.supabase.table.return_value.upsert.assert_not_called()
+
+
+def test_priming_replaces_fingerprints_from_earlier_runs():
+    saver = make_saver()
+    saver.save_finance_daily(DBFinanceDaily(ticker_id="t1", trailing_pe=33.1))
+    # The row was edited outside the pipeline since
+    select = saver.supabase.table.return_value.select.return_value
+    select.in_.return_value.execute.return_value = MagicMock(
+        data=[{"ticker_id": "t1", "trailing_pe": 20.0}]
+    )
+
+    saver.change_tracker.reset()
+    saver.prime_change_tracker(["t1"])
+
+    assert saver.save_finance_daily(DBFinanceDaily(ticker_id="t1", trailing_pe=33.1))
+
+
+def test_skipped_rows_are_touched_in_bulk():
+    saver = make_saver()
+    for ticker_id, updated_at in [("t1", "2025-03-19T21:01:00"), ("t2", "2025-03-19T21:02:00")]:
+        saver.update_ticker_info(DBTickerInfo(id=ticker_id, name="Fund"))
+        saver.update_ticker_info(DBTickerInfo(id=ticker_id, name="Fund", updated_at=updated_at))
+
+    assert saver.touch_unchanged() == 2
+
+    table = saver.supabase.table.return_value
+    assert table.update.call_args.args[0] == {"updated_at": "2025-03-19T21:02:00"}
+    assert table.update.return_value.in_.call_args.args == ("id", ["t1", "t2"])
+    assert saver.change_tracker.stats()["tickers"]["touched"] == 2
+    assert saver.touch_unchanged() == 0
+
+
+def test_failed_write_forgets_row():
+    saver = make_saver()
+    info = DBTickerInfo(id="t1", name="Apple Inc.")
+    saver.update_ticker_info(info)
+
+    saver.supabase.table.return_value.update.side_effect = RuntimeError("timeout")
+    assert not saver.update_ticker_info(info.model_copy(update={"name": "Apple"}))
+    assert not saver.change_tracker.is_tracked("tickers", "t1")
+
+
+def test_tracker_is_bounded():
+    tracker = ChangeTracker(max_rows=2)
+    for key in ["a", "b", "c"]:
+        tracker.remember("tickers", key, {"name": key})
+
+    assert not tracker.is_tracked("tickers", "a")
+    assert tracker.is_tracked("tickers", "b") and tracker.is_tracked("tickers", "c")
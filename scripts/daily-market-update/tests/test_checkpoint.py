@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from src.core.checkpoint import (
+    Checkpoint,
+    FileCheckpointStore,
+    TickerEventCheckpointStore,
+    make_run_key,
+)
+
+
+def test_file_checkpoint_round_trip(tmp_path):
+    store = FileCheckpointStore(str(tmp_path))
+    checkpoint = Checkpoint(run_key="abc", after_id="id-42", processed=120)
+
+    assert store.load("abc") is None
+    store.save(checkpoint)
+    assert store.load("abc") == checkpoint
+
+    store.clear("abc")
+    assert store.load("abc") is None
+
+
+def test_run_key_changes_with_payload_and_session():
+    payload = {"type": "backfill", "tickers": ["AAPL"]}
+    friday = datetime(2025, 3, 14, 22, tzinfo=timezone.utc)
+    saturday = datetime(2025, 3, 15, 12, tzinfo=timezone.utc)
+    monday = datetime(2025, 3, 17, 22, tzinfo=timezone.utc)
+
+    assert make_run_key(payload, friday) == make_run_key(payload, saturday)
+    assert make_run_key(payload, friday) != make_run_key(payload, monday)
+    assert make_run_key(payload, friday) != make_run_key({"type": "scheduled"}, friday)
+
+
+def test_ticker_event_checkpoint_keeps_other_details():
+    supabase = MagicMock()
+    builder = supabase.table.return_value
+    builder.select.return_value.eq.return_value.limit.return_value.execute.return_value = MagicMock(
+        data=[{"details": {"requested_at": "2025-03-14T10:00:00"}}]
+    )
+    store = TickerEventCheckpointStore(supabase, "event-1")
+
+    store.save(Checkpoint(run_key="abc", after_id="id-7"))
+
+    update = builder.update.call_args.args[0]
+    assert update["status"] == "pending"
+    assert update["details"]["requested_at"] == "2025-03-14T10:00:00"
+    assert update["details"]["checkpoint"]["after_id"] == "id-7"
+    builder.update.return_value.eq.assert_called_with("id", "event-1")
@@ -0,0 +1,177 @@
+import queue
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from src.core.concurrency import ConcurrencyController
+from src.core.pipeline import Pipeline
+from src.core.rate_limiter import RateLimiter, YahooEndpoint
+from src.events.event_processor import PipelineConfig
+from src.services.data_fetcher import DataFetcher
+from src.services.ticker_processor import TickerProcessor
+
+
+def fill_window(controller, latency, count=None, **outcome):
+    for _ in range(count or controller.window):
+        controller.observe(latency, **outcome)
+
+
+def test_grows_while_saturated_and_healthy():
+    controller = ConcurrencyController(min_limit=1, max_limit=4, initial=2, window=4)
+
+    for _ in range(2):
+        controller.acquire()
+    fill_window(controller, 0.1)
+
+    assert controller.limit == 3
+    assert controller.snapshot()["decisions"][-1]["reason"] == "headroom"
+
+
+def test_does_not_grow_with_idle_slots():
+    controller = ConcurrencyController(min_limit=1, max_limit=4, initial=2, window=4)
+
+    controller.acquire()
+    fill_window(controller, 0.1)
+
+    assert controller.limit == 2
+
+
+def test_throttle_halves_limit_within_bounds():
+    controller = ConcurrencyController(min_limit=3, max_limit=20, initial=16, window=4)
+
+    fill_window(controller, 0.1, count=3)
+    controller.observe(0.1, throttled=True)
+    assert controller.limit == 8
+
+    fill_window(controller, 0.1, count=3)
+    controller.observe(0.1, throttled=True)
+    fill_window(controller, 0.1, count=3)
+    controller.observe(0.1, throttled=True)
+    assert controller.limit == 3
+
+
+def test_error_rate_above_threshold_cuts_limit():
+    controller = ConcurrencyController(
+        min_limit=1, max_limit=10, initial=8, window=10, error_threshold=0.2
+    )
+
+    fill_window(controller, 0.1, count=8)
+    fill_window(controller, 0.1, count=2, error=True)
+    assert controller.limit == 8
+
+    fill_window(controller, 0.1, count=7)
+    fill_window(controller, 0.1, count=3, error=True)
+    assert controller.limit == 4
+    assert controller.snapshot()["decisions"][-1]["reason"] == "errors"
+
+
+def test_rising_latency_backs_off_one_slot():
+    controller = ConcurrencyController(min_limit=1, max_limit=10, initial=6, window=4)
+
+    fill_window(controller, 0.1)
+    fill_window(controller, 0.5)
+
+    assert controller.limit == 5
+    snapshot = controller.snapshot()
+    assert snapshot["decreases"] == 1
+    assert snapshot["decisions"][-1]["reason"] == "latency"
+
+
+def test_acquire_blocks_at_limit_until_release():
+    controller = ConcurrencyController(min_limit=1, max_limit=1, window=4)
+    controller.acquire()
+    acquired = threading.Event()
+
+    def take_slot():
+        controller.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=take_slot)
+    thread.start()
+    assert not acquired.wait(timeout=0.1)
+
+    controller.release()
+    assert acquired.wait(timeout=1)
+    thread.join()
+
+
+def test_fetcher_reports_requests_to_controller():
+    controller = ConcurrencyController(min_limit=1, max_limit=8, initial=8, window=2)
+    limits = {e: {"rate": 1000.0, "capacity": 1000.0, "cooldown": 0.0} for e in YahooEndpoint}
+    fetcher = DataFetcher(rate_limiter=RateLimiter(limits))
+    fetcher.concurrency = controller
+    responses = iter([Exception("429 Client Error: Too Many Requests"), "ok"])
+
+    def request():
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    assert fetcher._call(YahooEndpoint.INFO, "AAPL", request) == "ok"
+    assert controller.limit == 4
+
+
+def test_pipeline_reports_concurrency_and_detaches_controller():
+    config = PipelineConfig(
+        batch_mode=True, max_workers=2, min_workers=1, worker_ceiling=3, batch_writes=False
+    )
+    pipeline = Pipeline(config, Mock())
+    fetcher = pipeline.ticker_processor.data_fetcher
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def process_ticker(ticker, config, prefetched=None, price_writer=None):
+        with lock:
+            in_flight.append(ticker["symbol"])
+            peak.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(ticker["symbol"])
+        return set()
+
+    tickers = [{"id": f"id-{i}", "symbol": f"T{i}"} for i in range(12)]
+    with patch.object(pipeline.ticker_selector, "iter_ticker_pages", return_value=iter([tickers])), \
+         patch.object(TickerProcessor, "process_ticker", side_effect=process_ticker):
+        result = pipeline.execute()
+
+    assert len(result.successful) == 12
+    assert max(peak) <= 2
+    assert result.concurrency["limit"] == 2
+    assert result.concurrency["max_limit"] == 3
+    assert fetcher.concurrency is None
+
+
+def test_fetcher_does_not_count_best_effort_failures_as_errors():
+    controller = ConcurrencyController(
+        min_limit=1, max_limit=8, initial=8, window=2, error_threshold=0.1
+    )
+    limits = {e: {"rate": 1000.0, "capacity": 1000.0, "cooldown": 0.0} for e in YahooEndpoint}
+    fetcher = DataFetcher(rate_limiter=RateLimiter(limits))
+    fetcher.concurrency = controller
+
+    def request():
+        raise ValueError("No calendar for index")
+
+    for _ in range(2):
+        assert fetcher._fetch_optional(YahooEndpoint.CALENDAR, "^GSPC", request) is None
+
+    assert controller.limit == 8
+    assert controller.snapshot()["decreases"] == 0
+
+
+def test_idle_workers_do_not_hold_slots():
+    pipeline = Pipeline(PipelineConfig(batch_writes=False), Mock())
+    pipeline.concurrency = ConcurrencyController(min_limit=1, max_limit=2, window=4)
+    work_queue = queue.Queue()
+    worker = threading.Thread(target=pipeline._worker_loop, args=(work_queue,))
+    worker.start()
+
+    time.sleep(0.05)
+    assert pipeline.concurrency.in_flight == 0
+
+    work_queue.put(None)
+    worker.join(timeout=1)
+    assert not worker.is_alive()
+    assert pipeline.concurrency.in_flight == 0
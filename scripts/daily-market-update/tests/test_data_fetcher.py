@@ -0,0 +1,232 @@
+import pandas as pd
+import requests
+from datetime import date
+from unittest.mock import Mock, PropertyMock, patch
+from src.core.rate_limiter import RateLimiter, YahooEndpoint
+from src.events.event_processor import PipelineConfig
+from src.services.data_fetcher import DataFetcher, FetchPlan
+from src.services.price_coverage import DateRange
+from src.services.response_cache import ResponseCache
+
+
+def make_fetcher():
+    unlimited = {endpoint: {"rate": 1e6, "capacity": 1e6} for endpoint in YahooEndpoint}
+    return DataFetcher(rate_limiter=RateLimiter(unlimited))
+
+
+FIELDS = ["Open", "High", "Low", "Close", "Volume", "Dividends", "Stock Splits"]
+
+
+def make_download_frame():
+    index = pd.to_datetime(["2025-03-13", "2025-03-14", "2025-03-17"])
+    aapl = pd.DataFrame(
+        [
+            [210.0, 212.0, 209.0, 211.0, 1000.0, 0.0, 0.0],
+            [211.0, 214.0, 210.0, 213.0, 1200.0, 0.0, 0.0],
+            [213.0, 215.0, 212.0, 214.0, 900.0, 0.25, 0.0],
+        ],
+        index=index,
+        columns=FIELDS,
+    )
+    # SHOP.TO did not trade on the 14th
+    shop = pd.DataFrame(
+        [
+            [150.0, 152.0, 149.0, 151.0, 500.0, 0.0, 0.0],
+            [None] * 7,
+            [151.0, 153.0, 150.0, 152.0, 600.0, 0.0, 0.0],
+        ],
+        index=index,
+        columns=FIELDS,
+        dtype=float,
+    )
+    return pd.concat({"AAPL": aapl, "SHOP.TO": shop}, axis=1)
+
+
+def test_fetch_price_histories_splits_wide_frame():
+    fetcher = make_fetcher()
+
+    with patch("src.services.data_fetcher.yf.download", return_value=make_download_frame()) as download:
+        histories = fetcher.fetch_price_histories(
+            {"AAPL": "NASDAQ", "SHOP": "TSX", "MSFT": "NASDAQ"}, date(2025, 3, 13)
+        )
+
+    download.assert_called_once()
+    assert set(histories) == {"AAPL", "SHOP"}
+    assert len(histories["AAPL"].data) == 3
+    assert len(histories["SHOP"].data) == 2
+
+    last_aapl = histories["AAPL"].data[pd.Timestamp("2025-03-17").to_pydatetime()]
+    assert last_aapl.close == 214.0
+    assert last_aapl.volume == 900
+    assert last_aapl.dividends == 0.25
+
+
+def test_fetch_price_histories_chunks_symbols():
+    fetcher = make_fetcher()
+
+    with patch("src.services.data_fetcher.yf.download", return_value=pd.DataFrame()) as download:
+        histories = fetcher.fetch_price_histories(
+            {"A": "NYSE", "B": "NYSE", "C": "NYSE"}, date(2025, 3, 13), chunk_size=2
+        )
+
+    assert download.call_count == 2
+    assert histories == {}
+
+
+def test_throttled_request_is_retried_through_limiter():
+    fetcher = make_fetcher()
+    responses = iter([Exception("429 Client Error: Too Many Requests"), {"quoteType": "ETF"}])
+
+    def request():
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    bucket = fetcher.rate_limiter.buckets[YahooEndpoint.INFO]
+    bucket.cooldown = 0
+
+    assert fetcher._call(YahooEndpoint.INFO, "SPY", request) == {"quoteType": "ETF"}
+    assert bucket.throttle_count == 1
+    assert bucket.rate < bucket.max_rate
+
+
+def make_yf_ticker(history):
+    ticker = Mock(spec=["history", "info", "calendar"])
+    ticker.history.return_value = history
+    info = PropertyMock(return_value={"quoteType": "EQUITY", "longName": "Apple Inc."})
+    calendar = PropertyMock(return_value={"Dividend Date": date(2025, 5, 15)})
+    type(ticker).info = info
+    type(ticker).calendar = calendar
+    return ticker, info, calendar
+
+
+def test_prices_only_plan_never_touches_quote_summary():
+    fetcher = make_fetcher()
+    history = make_download_frame()["AAPL"]
+    ticker, info, calendar = make_yf_ticker(history)
+    config = PipelineConfig(process_info=False, process_calendar=False, process_fund_data=False)
+
+    with patch("src.services.data_fetcher.yf.Ticker", return_value=ticker):
+        result = fetcher.fetch_ticker_data(
+            "AAPL", "NASDAQ", date(2025, 3, 13), plan=FetchPlan.from_config(config, "EQUITY")
+        )
+
+    ticker.history.assert_called_once()
+    info.assert_not_called()
+    calendar.assert_not_called()
+    assert result.fetched_endpoints == ["history"]
+    assert len(result.price_history.data) == 3
+
+
+def test_full_plan_fetches_each_endpoint_once():
+    fetcher = make_fetcher()
+    ticker, info, calendar = make_yf_ticker(make_download_frame()["AAPL"])
+
+    with patch("src.services.data_fetcher.yf.Ticker", return_value=ticker):
+        result = fetcher.fetch_ticker_data(
+            "AAPL", "NASDAQ", date(2025, 3, 13), plan=FetchPlan.from_config(PipelineConfig(), "EQUITY")
+        )
+
+    ticker.history.assert_called_once()
+    info.assert_called_once()
+    calendar.assert_called_once()
+    assert result.fetched_endpoints == ["history", "info", "calendar"]
+    assert result.info.long_name == "Apple Inc."
+    assert result.calendar.dividend_date == date(2025, 5, 15)
+
+
+def test_cached_responses_skip_yahoo(tmp_path):
+    fetcher = make_fetcher()
+    fetcher.cache = ResponseCache(str(tmp_path))
+    ticker, info, calendar = make_yf_ticker(make_download_frame()["AAPL"])
+    plan = FetchPlan.from_config(PipelineConfig(), "EQUITY")
+
+    with patch("src.services.data_fetcher.yf.Ticker", return_value=ticker):
+        fetcher.fetch_ticker_data("AAPL", "NASDAQ", date(2025, 3, 13), plan=plan)
+        result = fetcher.fetch_ticker_data("AAPL", "NASDAQ", date(2025, 3, 13), plan=plan)
+
+    ticker.history.assert_called_once()
+    info.assert_called_once()
+    calendar.assert_called_once()
+    assert len(result.price_history.data) == 3
+    assert result.info.long_name == "Apple Inc."
+    assert fetcher.cache.stats()["history"] == {"hits": 1, "misses": 1}
+
+    # Bypassing the cache goes back to Yahoo
+    with patch("src.services.data_fetcher.yf.Ticker", return_value=ticker):
+        fetcher.fetch_ticker_data(
+            "AAPL", "NASDAQ", date(2025, 3, 13), plan=plan, use_cache=False
+        )
+    assert ticker.history.call_count == 2
+
+
+def test_history_ranges_are_fetched_separately_and_combined():
+    fetcher = make_fetcher()
+    history = make_download_frame()["AAPL"]
+    ticker, _, _ = make_yf_ticker(history)
+    ticker.history.side_effect = [history.iloc[:1], history.iloc[2:]]
+    plan = FetchPlan(info=False, calendar=False, funds_data=False)
+    ranges = [
+        DateRange(start=date(2025, 3, 13), end=date(2025, 3, 13)),
+        DateRange(start=date(2025, 3, 17), end=date(2025, 3, 17)),
+    ]
+
+    with patch("src.services.data_fetcher.yf.Ticker", return_value=ticker):
+        result = fetcher.fetch_ticker_data(
+            "AAPL", "NASDAQ", date(2025, 3, 13), plan=plan, history_ranges=ranges
+        )
+
+    assert [c.kwargs["start"] for c in ticker.history.call_args_list] == [
+        date(2025, 3, 13),
+        date(2025, 3, 17),
+    ]
+    assert list(result.price_history.dates().strftime("%Y-%m-%d")) == [
+        "2025-03-13",
+        "2025-03-17",
+    ]
+
+
+def test_throttled_history_raises_instead_of_returning_empty():
+    fetcher = make_fetcher()
+    fetcher.rate_limiter.buckets[YahooEndpoint.HISTORY].cooldown = 0
+    history = make_download_frame()["AAPL"]
+    ticker, _, _ = make_yf_ticker(history)
+    # yfinance 0.2.37 reads a 429's plain-text body as JSON
+    ticker.history.side_effect = [
+        requests.exceptions.JSONDecodeError("Expecting value", "Too Many Requests", 0),
+        history,
+    ]
+    plan = FetchPlan(info=False, calendar=False, funds_data=False)
+
+    with patch("src.services.data_fetcher.yf.Ticker", return_value=ticker):
+        result = fetcher.fetch_ticker_data("AAPL", "NASDAQ", date(2025, 3, 13), plan=plan)
+
+    assert all(c.kwargs["raise_errors"] for c in ticker.history.call_args_list)
+    assert fetcher.rate_limiter.buckets[YahooEndpoint.HISTORY].throttle_count == 1
+    assert len(result.price_history.data) == 3
+
+
+def test_range_without_sessions_is_empty_not_failed():
+    fetcher = make_fetcher()
+    ticker, _, _ = make_yf_ticker(None)
+    ticker.history.side_effect = Exception(
+        "AAPL: No price data found, symbol may be delisted (1d 2025-03-15 -> 2025-03-17)"
+    )
+    plan = FetchPlan(info=False, calendar=False, funds_data=False)
+
+    with patch("src.services.data_fetcher.yf.Ticker", return_value=ticker):
+        result = fetcher.fetch_ticker_data("AAPL", "NASDAQ", date(2025, 3, 15), plan=plan)
+
+    assert result.fetched_endpoints == ["history"]
+    assert result.price_history is None
+
+
+def test_start_date_refetches_last_stored_day():
+    fetcher = make_fetcher()
+    today = date(2025, 3, 19)
+
+    assert fetcher.determine_start_date(date(2025, 3, 17), today=today) == date(2025, 3, 17)
+    assert fetcher.determine_start_date(today, today=today) == today
+    assert fetcher.determine_start_date(None, today=today) == date(2025, 2, 17)
+    assert fetcher.determine_start_date(None, backfill=True) == date(2020, 1, 1)
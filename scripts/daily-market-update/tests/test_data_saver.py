@@ -0,0 +1,64 @@
+from datetime import date
+from unittest.mock import MagicMock
+from src.services.data_saver import DataSaver
+
+
+def make_supabase(pages):
+    """Supabase mock whose query builder returns each page of rows in turn."""
+    supabase = MagicMock()
+    builder = MagicMock()
+    supabase.table.return_value = builder
+    for method in ("select", "in_", "gte", "eq", "order", "limit"):
+        getattr(builder, method).return_value = builder
+    builder.execute.side_effect = [MagicMock(data=page) for page in pages]
+    return supabase, builder
+
+
+def test_last_update_dates_one_call_per_chunk():
+    supabase = MagicMock()
+    supabase.rpc.return_value.execute.side_effect = [
+        MagicMock(data=[
+            {"ticker_id": "a", "last_date": "2025-03-14"},
+            {"ticker_id": "b", "last_date": None},
+        ]),
+        MagicMock(data=[{"ticker_id": "c", "last_date": "2023-06-30"}]),
+    ]
+
+    last_dates = DataSaver(supabase).get_last_update_dates(
+        ["a", "b", "c"], "historical_prices", chunk_size=2
+    )
+
+    assert last_dates == {"a": date(2025, 3, 14), "b": None, "c": date(2023, 6, 30)}
+    assert supabase.rpc.call_args_list[1].args == (
+        "last_update_dates",
+        {"p_table": "historical_prices", "p_ticker_ids": ["c"]},
+    )
+    supabase.table.assert_not_called()
+
+
+def test_last_update_dates_fall_back_when_function_is_missing():
+    supabase, builder = make_supabase([[{"date": "2023-06-30"}], []])
+    supabase.rpc.return_value.execute.side_effect = Exception("function not found")
+
+    last_dates = DataSaver(supabase).get_last_update_dates(["a", "b"], "historical_prices")
+
+    assert last_dates == {"a": date(2023, 6, 30), "b": None}
+    assert builder.execute.call_count == 2
+
+
+def test_price_windows_page_through_rows_per_chunk():
+    rows = [
+        {"ticker_id": "a", "date": "2025-03-10", "close_price": 1.0, "volume": 10},
+        {"ticker_id": "a", "date": "2025-03-11", "close_price": 2.0, "volume": None},
+        {"ticker_id": "b", "date": "2025-03-10", "close_price": 3.0, "volume": 30},
+    ]
+    supabase, builder = make_supabase([rows[:2], rows[2:]])
+    builder.range.return_value = builder
+
+    blocks = DataSaver(supabase).get_price_windows(["a", "b"], date(2025, 1, 1), page_size=2)
+
+    assert builder.execute.call_count == 2
+    assert builder.range.call_args_list[1].args == (2, 3)
+    assert blocks["a"].close.tolist() == [1.0, 2.0]
+    assert blocks["a"].volume_missing.tolist() == [False, True]
+    assert blocks["b"].date_list() == [date(2025, 3, 10)]
@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules the handler must only load on first use
+HEAVY_MODULES = ["pydantic", "yfinance", "pandas", "supabase", "httpx", "dotenv"]
+
+# Cold import budget for the handler module, about three times the measured
+# 20-35ms (override for slow machines)
+IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", 100))
+
+
+def import_times(module):
+    """Cumulative import time in microseconds per module, from -X importtime."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_handler_import_defers_heavy_modules():
+    times = import_times("src.lambda_handler")
+
+    assert [m for m in HEAVY_MODULES if m in times] == []
+
+
+def test_handler_cold_import_within_budget():
+    times = import_times("src.lambda_handler")
+
+    assert times["src.lambda_handler"] / 1000 < IMPORT_BUDGET_MS
@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock
+from src.core.instrumentation import Instrumentation, get_instrumentation
+from src.models.db_models import DBFinanceDaily
+from src.services.data_saver import DataSaver
+
+
+def test_span_percentiles_and_counters():
+    instrumentation = Instrumentation()
+    for seconds in range(1, 101):
+        instrumentation.record("fetch.history", seconds / 100)
+    with instrumentation.span("save.tickers"):
+        pass
+    instrumentation.incr("rows.historical_prices", 30)
+    instrumentation.incr("rows.historical_prices", 12)
+
+    snapshot = instrumentation.snapshot()
+    history = snapshot["stages"]["fetch.history"]
+    assert history["count"] == 100
+    assert history["p50"] == 0.5
+    assert history["p95"] == 0.95
+    assert history["max"] == 1.0
+    assert snapshot["stages"]["save.tickers"]["count"] == 1
+    assert snapshot["counters"] == {"rows.historical_prices": 42}
+
+    instrumentation.reset()
+    assert instrumentation.snapshot() == {"stages": {}, "counters": {}}
+
+
+def test_timed_decorator_records_on_error():
+    instrumentation = Instrumentation()
+
+    @instrumentation.timed("transform.prices")
+    def transform():
+        raise ValueError("bad row")
+
+    try:
+        transform()
+    except ValueError:
+        pass
+
+    assert instrumentation.snapshot()["stages"]["transform.prices"]["count"] == 1
+
+
+def test_data_saver_writes_are_instrumented():
+    instrumentation = get_instrumentation()
+    instrumentation.reset()
+    saver = DataSaver(MagicMock())
+
+    saver.save_finance_daily(DBFinanceDaily(ticker_id="t1", trailing_pe=30.5))
+    saver.save_historical_prices(
+        "AAPL", [{"ticker_id": "t1", "date": "2025-03-17", "close_price": 214.0}] * 3
+    )
+
+    snapshot = instrumentation.snapshot()
+    assert snapshot["stages"]["save.yh_finance_daily"]["count"] == 1
+    assert snapshot["stages"]["save.historical_prices"]["count"] == 1
+    assert snapshot["counters"]["rows.historical_prices"] == 3
+    assert snapshot["counters"]["bytes.historical_prices"] > 0
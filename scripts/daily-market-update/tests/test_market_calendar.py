@@ -0,0 +1,75 @@
+from datetime import date, datetime, timezone
+from src.core.market_calendar import (
+    is_market_open,
+    is_trading_day,
+    last_session_close,
+    next_session_close,
+    next_settle_time,
+    last_trading_day,
+    nyse_holidays,
+)
+
+
+def test_nyse_holidays_2025():
+    assert nyse_holidays(2025) == {
+        date(2025, 1, 1),
+        date(2025, 1, 20),
+        date(2025, 2, 17),
+        date(2025, 4, 18),
+        date(2025, 5, 26),
+        date(2025, 6, 19),
+        date(2025, 7, 4),
+        date(2025, 9, 1),
+        date(2025, 11, 27),
+        date(2025, 12, 25),
+    }
+
+
+def test_observed_holidays():
+    # July 4th 2026 is a Saturday, observed on Friday
+    assert date(2026, 7, 3) in nyse_holidays(2026)
+    # New Year's Day 2022 fell on a Saturday and was not observed
+    assert date(2021, 12, 31) not in nyse_holidays(2021)
+    assert not any(d.year != 2022 for d in nyse_holidays(2022))
+
+
+def test_trading_days():
+    assert is_trading_day(date(2025, 3, 14))
+    assert not is_trading_day(date(2025, 3, 15))
+    assert last_trading_day(date(2025, 4, 20)) == date(2025, 4, 17)  # Easter weekend
+
+
+def test_last_session_close():
+    # Saturday: last close is Friday
+    close = last_session_close(datetime(2025, 3, 15, 12, tzinfo=timezone.utc))
+    assert close.date() == date(2025, 3, 14)
+    assert close.hour == 16
+
+    # Tuesday before the close (14:00 UTC = 10:00 EDT): Monday's close
+    assert last_session_close(datetime(2025, 3, 18, 14)).date() == date(2025, 3, 17)
+    assert is_market_open(datetime(2025, 3, 18, 14))
+
+    # Tuesday after the close (21:30 UTC = 17:30 EDT)
+    assert last_session_close(datetime(2025, 3, 18, 21, 30)).date() == date(2025, 3, 18)
+    assert not is_market_open(datetime(2025, 3, 18, 21, 30))
+
+
+def test_next_session_close():
+    # Tuesday during the session: today's close
+    assert next_session_close(datetime(2025, 3, 18, 14)).date() == date(2025, 3, 18)
+
+    # Friday after the close: Monday's close
+    assert next_session_close(datetime(2025, 3, 14, 22)).date() == date(2025, 3, 17)
+
+    # Thursday before Good Friday 2025, after the close: the next Monday
+    assert next_session_close(datetime(2025, 4, 17, 21)).date() == date(2025, 4, 21)
+
+
+def test_next_settle_time():
+    # Tuesday 16:10 New York (20:10 UTC): today's data settles at 16:30
+    settle = next_settle_time(datetime(2025, 3, 18, 20, 10))
+    assert (settle.date(), settle.hour, settle.minute) == (date(2025, 3, 18), 16, 30)
+
+    # Tuesday 16:40 New York: settled, so Wednesday's
+    assert next_settle_time(datetime(2025, 3, 18, 20, 40)).date() == date(2025, 3, 19)
+
@@ -0,0 +1,46 @@
+import pandas as pd
+from src.models.db_models import DBHistoricalPrice
+from src.models.source_models import YFPriceHistory
+from src.transformers.model_transformer import ModelTransformer
+
+
+def make_history():
+    index = pd.to_datetime(["2025-03-13", "2025-03-14", "2025-03-17"]).tz_localize(
+        "America/New_York"
+    )
+    return pd.DataFrame(
+        {
+            "Open": [210.0, 211.0, 213.0],
+            "High": [212.0, 214.0, 215.0],
+            "Low": [209.0, 210.0, 212.0],
+            "Close": [211.0, 213.0, 214.0],
+            "Volume": [1000.0, float("nan"), 900.0],
+            "Dividends": [0.0, 0.0, 0.25],
+            "Stock Splits": [0.0, 0.0, 0.0],
+        },
+        index=index,
+    )
+
+
+def test_price_records_match_model_dump():
+    history = YFPriceHistory.from_dataframe(make_history())
+
+    records = ModelTransformer.transform_historical_price_records(history, "ticker-1")
+
+    assert records == [
+        DBHistoricalPrice(**r).model_dump(exclude_none=True) for r in records
+    ]
+    assert records[0]["date"] == "2025-03-13"
+    assert records[0]["volume"] == 1000 and type(records[0]["volume"]) is int
+    assert "volume" not in records[1]
+    assert records[2]["dividends"] == 0.25
+
+
+def test_price_records_default_missing_action_columns():
+    frame = make_history().drop(columns=["Dividends", "Stock Splits"])
+    history = YFPriceHistory.from_dataframe(frame)
+
+    records = ModelTransformer.transform_historical_price_records(history, "ticker-1")
+
+    assert all(r["dividends"] == 0.0 and r["stock_splits"] == 0.0 for r in records)
+    assert history.data[frame.index[2].to_pydatetime()].close == 214.0
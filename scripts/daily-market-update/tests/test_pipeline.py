@@ -0,0 +1,140 @@
+import time
+import threading
+from datetime import date
+from unittest.mock import Mock, patch
+
+import pandas as pd
+from src.core.pipeline import Pipeline
+from src.events.event_processor import PipelineConfig
+from src.models.source_models import YFPriceHistory
+from src.services.price_coverage import DateRange
+from src.services.ticker_processor import TickerProcessor
+from src.services.ticker_selector import TickerPageError
+
+
+def make_tickers(count):
+    return [{"id": f"id-{i}", "symbol": f"T{i}", "exchange": "NYSE"} for i in range(count)]
+
+
+def test_parallel_workers_do_not_wait_for_slow_ticker():
+    config = PipelineConfig(batch_mode=True, max_workers=3, batch_size=2, batch_writes=False)
+    pipeline = Pipeline(config, Mock())
+    release_slow = threading.Event()
+    processed = []
+
+    def process_ticker(ticker, config, prefetched=None, price_writer=None):
+        if ticker["symbol"] == "T0":
+            # Holds one worker until every other ticker is done
+            assert release_slow.wait(timeout=5)
+        else:
+            processed.append(ticker["symbol"])
+            if len(processed) == 9:
+                release_slow.set()
+        if ticker["symbol"] == "T5":
+            raise ValueError("no data")
+        return {"historical_prices"}
+
+    tickers = make_tickers(10)
+    pages = iter([tickers[:4], tickers[4:8], tickers[8:]])
+
+    with patch.object(pipeline.ticker_selector, "iter_ticker_pages", return_value=pages), \
+         patch.object(TickerProcessor, "process_ticker", side_effect=process_ticker):
+        result = pipeline.execute()
+
+    assert result.ticker_count == 10
+    assert sorted(result.successful) == sorted(f"T{i}" for i in range(10) if i != 5)
+    assert result.failed == {"T5": "no data"}
+    assert result.updated_tables["T0"] == ["historical_prices"]
+    assert set(result.processing_time) == {f"T{i}" for i in range(10)} | {"total"}
+
+
+def test_pipeline_stops_at_deadline_and_reports_resume_point():
+    config = PipelineConfig(batch_writes=False, deadline_margin=10)
+    pipeline = Pipeline(config, Mock(), deadline=time.monotonic() + 3600)
+    processed = []
+
+    def process_ticker(ticker, config, prefetched=None, price_writer=None):
+        processed.append(ticker["symbol"])
+        if len(processed) == 3:
+            # Out of time: less than the margin is left
+            pipeline.deadline = time.monotonic() + 5
+        return {"historical_prices"}
+
+    with patch.object(pipeline.ticker_selector, "iter_ticker_pages", return_value=iter([make_tickers(6)])), \
+         patch.object(TickerProcessor, "process_ticker", side_effect=process_ticker):
+        result = pipeline.execute()
+
+    assert processed == ["T0", "T1", "T2"]
+    assert result.ticker_count == 3
+    assert result.stopped_early
+    assert result.resume_after_id == "id-2"
+
+
+def test_failed_selection_page_stops_run_at_last_page_read():
+    pipeline = Pipeline(PipelineConfig(batch_writes=False), Mock())
+
+    def pages(config, page_size, after_id=None):
+        yield make_tickers(2)
+        raise TickerPageError("id-1", Exception("connection reset"))
+
+    with patch.object(pipeline.ticker_selector, "iter_ticker_pages", side_effect=pages), \
+         patch.object(TickerProcessor, "process_ticker", return_value={"historical_prices"}):
+        result = pipeline.execute()
+
+    assert result.successful == ["T0", "T1"]
+    assert result.stopped_early
+    assert result.resume_after_id == "id-1"
+
+
+def test_bulk_prefetch_keeps_only_missing_ranges():
+    config = PipelineConfig(process_info=False, process_calendar=False, process_fund_data=False)
+    pipeline = Pipeline(config, Mock())
+    ticker = {"id": "id-0", "symbol": "T0", "exchange": "NYSE"}
+    ticker["price_ranges"] = [
+        DateRange(start=date(2025, 3, 4), end=date(2025, 3, 4)),
+        DateRange(start=date(2025, 3, 6), end=date(2025, 3, 7)),
+    ]
+    # The download runs from the first missing day through today
+    index = pd.bdate_range("2025-03-04", periods=4).tz_localize("America/New_York")
+    frame = pd.DataFrame({"Close": [1.0, 2.0, 3.0, 4.0], "Volume": 100.0}, index=index)
+    fetcher = pipeline.ticker_processor.data_fetcher
+
+    with patch.object(
+        fetcher,
+        "fetch_price_histories",
+        return_value={"T0": YFPriceHistory.from_dataframe(frame)},
+    ) as download:
+        prefetched = pipeline._prefetch_price_histories([ticker])
+
+    assert download.call_args.args[1] == date(2025, 3, 4)
+    block = prefetched["T0"].price_history.block
+    assert block.date_list() == [date(2025, 3, 4), date(2025, 3, 6), date(2025, 3, 7)]
+    assert block.close.tolist() == [1.0, 3.0, 4.0]
+
+
+def test_pipeline_resumes_selection_after_checkpoint():
+    pipeline = Pipeline(PipelineConfig(batch_writes=False), Mock(), resume_after_id="id-2")
+
+    with patch.object(pipeline.ticker_selector, "iter_ticker_pages", return_value=iter([])) as pages:
+        result = pipeline.execute()
+
+    assert pages.call_args.args[2] == "id-2"
+    assert not result.stopped_early
+
+
+def test_pipeline_computes_analytics_for_successful_tickers():
+    pipeline = Pipeline(PipelineConfig(batch_writes=False), Mock())
+
+    def process_ticker(ticker, config, prefetched=None, price_writer=None):
+        if ticker["symbol"] == "T1":
+            raise ValueError("no data")
+        return {"historical_prices"}
+
+    with patch.object(pipeline.ticker_selector, "iter_ticker_pages", return_value=iter([make_tickers(3)])), \
+         patch.object(TickerProcessor, "process_ticker", side_effect=process_ticker), \
+         patch.object(TickerProcessor, "update_analytics", return_value={"id-2"}) as analytics:
+        result = pipeline.execute()
+
+    assert analytics.call_args.args[0] == ["id-0", "id-2"]
+    assert result.updated_tables["T2"] == ["historical_prices", "yh_finance_daily"]
+    assert result.updated_tables["T0"] == ["historical_prices"]
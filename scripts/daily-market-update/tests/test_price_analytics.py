@@ -0,0 +1,102 @@
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.events.event_processor import PipelineConfig
+from src.models.price_block import PriceBlock
+from src.services.ticker_processor import TickerProcessor
+from src.transformers.price_analytics import compute_price_analytics
+
+
+def make_block(start, sessions, seed=0, volume=True):
+    dates = pd.bdate_range(start, periods=sessions)
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.cumprod(1.0 + rng.normal(0.0005, 0.01, sessions))
+    frame = pd.DataFrame(
+        {"Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close},
+        index=dates,
+    )
+    if volume:
+        frame["Volume"] = rng.integers(1_000, 5_000, sessions).astype(float)
+    return PriceBlock.from_frame(frame)
+
+
+def reference(block):
+    """Plain pandas computation of the same statistics for one ticker."""
+    close = pd.Series(block.close, index=pd.DatetimeIndex(block.dates))
+    last_day = close.index[-1]
+    year = close[close.index > last_day - pd.Timedelta(days=365)]
+    high = pd.Series(block.high, index=close.index)[year.index]
+    low = pd.Series(block.low, index=close.index)[year.index]
+
+    def change_since(day):
+        base = close[close.index <= day]
+        return (close.iloc[-1] / base.iloc[-1] - 1) * 100 if len(base) else None
+
+    return {
+        "last_close": close.iloc[-1],
+        "change_percent": (close.iloc[-1] / close.iloc[-2] - 1) * 100,
+        "fifty_day_average": close.iloc[-50:].mean() if len(close) >= 50 else None,
+        "two_hundred_day_average": close.iloc[-200:].mean() if len(close) >= 200 else None,
+        "fifty_two_week_high": high.max(),
+        "fifty_two_week_low": low.min(),
+        "ytd_return": change_since(pd.Timestamp(last_day.year - 1, 12, 31)),
+        "return_3m": change_since(last_day - pd.Timedelta(days=91)),
+        "return_1y": change_since(last_day - pd.Timedelta(days=365)),
+        "volatility": year.pct_change().iloc[1:].std() * np.sqrt(252) * 100,
+    }
+
+
+def test_matches_per_ticker_reference_for_uneven_histories():
+    blocks = {
+        "long": make_block("2023-06-01", 330, seed=1),
+        "short": make_block("2024-06-03", 120, seed=2),
+        "stale": make_block("2023-01-02", 260, seed=3),
+    }
+
+    analytics = compute_price_analytics(blocks)
+
+    for ticker_id, block in blocks.items():
+        stats = analytics[ticker_id]
+        assert stats.as_of == block.date_list()[-1]
+        for name, expected in reference(block).items():
+            if expected is None:
+                assert getattr(stats, name) is None, (ticker_id, name)
+            else:
+                assert getattr(stats, name) == pytest.approx(expected), (ticker_id, name)
+
+
+def test_index_without_volume_gets_averages():
+    analytics = compute_price_analytics({"index": make_block("2024-01-01", 60, volume=False)})
+
+    stats = analytics["index"]
+    assert stats.volume is None
+    assert stats.fifty_day_average is not None
+    row = stats.finance_daily().model_dump(exclude_none=True)
+    assert "regular_market_volume" not in row
+    assert row["fifty_day_average"] == stats.fifty_day_average
+    assert "two_hundred_day_average" not in row
+
+
+def test_tickers_without_closes_are_left_out():
+    assert compute_price_analytics({"empty": PriceBlock.from_rows([])}) == {}
+
+
+def test_update_analytics_writes_rows_from_stored_prices():
+    data_saver = MagicMock()
+    data_saver.get_price_windows.return_value = {"id-1": make_block("2024-01-01", 80)}
+    data_saver.save_finance_daily.return_value = True
+    processor = TickerProcessor(MagicMock(), data_fetcher=MagicMock())
+    processor.data_saver = data_saver
+
+    written = processor.update_analytics(
+        ["id-1", "id-2"], PipelineConfig(incremental_analytics=False)
+    )
+
+    assert written == {"id-1"}
+    since = data_saver.get_price_windows.call_args.args[1]
+    assert since <= date.today() - timedelta(days=365)
+    row = data_saver.save_finance_daily.call_args.args[0]
+    assert row.ticker_id == "id-1" and row.fifty_day_average is not None
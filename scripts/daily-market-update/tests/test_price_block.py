@@ -0,0 +1,121 @@
+import math
+import pickle
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.models.price_block import PriceBlock
+from src.models.source_models import YFPriceHistory
+
+
+def make_frame(rows=5):
+    index = pd.bdate_range("2025-03-03", periods=rows).tz_localize("America/New_York")
+    close = np.linspace(10.0, 12.0, rows)
+    frame = pd.DataFrame(
+        {
+            "Open": close - 0.1,
+            "High": close + 0.2,
+            "Low": close - 0.2,
+            "Close": close,
+            "Volume": np.arange(rows) * 100.0 + 0.6,
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        },
+        index=index,
+    )
+    frame.iloc[1, frame.columns.get_loc("Open")] = math.nan
+    frame.iloc[3, frame.columns.get_loc("Volume")] = math.nan
+    return frame
+
+
+def test_from_frame_keeps_wall_clock_dates_and_missing_values():
+    block = PriceBlock.from_frame(make_frame())
+
+    assert block.dates.dtype == np.dtype("datetime64[D]")
+    assert block.date_list()[0] == date(2025, 3, 3)
+    assert block.tz == "America/New_York"
+    assert np.isnan(block.open[1])
+    assert block.volume.dtype == np.int64 and block.volume[0] == 1
+    assert block.volume_missing.tolist() == [False, False, False, True, False]
+
+
+def test_slices_are_views():
+    block = PriceBlock.from_frame(make_frame())
+
+    part = block[1:3]
+
+    assert len(part) == 2
+    for field in ("dates", "open", "close", "volume", "volume_missing"):
+        assert np.shares_memory(getattr(part, field), getattr(block, field))
+
+
+def test_rows_can_only_be_sliced():
+    with pytest.raises(TypeError):
+        PriceBlock.from_frame(make_frame())[0]
+
+
+def test_between_selects_inclusive_date_range():
+    block = PriceBlock.from_frame(make_frame())
+
+    middle = block.between(date(2025, 3, 4), date(2025, 3, 6))
+
+    assert middle.date_list() == [date(2025, 3, 4), date(2025, 3, 5), date(2025, 3, 6)]
+    assert np.shares_memory(middle.close, block.close)
+    assert len(block.between(date(2025, 3, 8), date(2025, 3, 9))) == 0
+
+
+def test_batches_cover_every_row_in_order():
+    block = PriceBlock.from_frame(make_frame(rows=7))
+
+    batches = list(block.batches(3))
+
+    assert [len(b) for b in batches] == [3, 3, 1]
+    assert PriceBlock.concat(batches).date_list() == block.date_list()
+
+
+def test_concat_fills_missing_volume_masks():
+    first = PriceBlock.from_frame(make_frame().iloc[:3])
+    second = PriceBlock.from_frame(make_frame().iloc[3:])
+
+    block = PriceBlock.concat([first, second])
+
+    assert first.volume_missing is None
+    assert block.volume_missing.tolist() == [False, False, False, True, False]
+
+
+def test_records_skip_missing_values():
+    records = PriceBlock.from_frame(make_frame()).records("ticker-1", "2025-03-18T10:00:00")
+
+    assert records[0] == {
+        "ticker_id": "ticker-1",
+        "updated_at": "2025-03-18T10:00:00",
+        "open_price": 9.9,
+        "high_price": 10.2,
+        "low_price": 9.8,
+        "close_price": 10.0,
+        "volume": 1,
+        "dividends": 0.0,
+        "stock_splits": 0.0,
+        "date": "2025-03-03",
+    }
+    assert "open_price" not in records[1] and "volume" not in records[3]
+
+
+def test_pickles_without_pandas_objects():
+    block = PriceBlock.from_frame(make_frame())
+
+    restored = pickle.loads(pickle.dumps(block[2:]))
+
+    assert restored.date_list() == block.date_list()[2:]
+    assert restored.volume_missing.tolist() == [False, True, False]
+
+
+def test_price_history_rebuilds_index_and_rows_from_block():
+    frame = make_frame()
+
+    history = YFPriceHistory.from_dataframe(frame)
+
+    assert history.dates().equals(frame.index)
+    assert history.row_count() == 5
+    assert history.data[frame.index[3]].volume is None
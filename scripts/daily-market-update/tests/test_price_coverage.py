@@ -0,0 +1,155 @@
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock, patch
+from src.core.market_calendar import trading_days
+from src.events.event_processor import PipelineConfig
+from src.services.price_coverage import CoverageStore, DateRange, find_missing_ranges
+from src.services.ticker_processor import TickerProcessor
+
+# Wednesday 2025-03-19, after the close
+NOW = datetime(2025, 3, 19, 21, 30, tzinfo=timezone.utc)
+
+
+def test_missing_ranges_follow_trading_calendar():
+    # Weekend of the 15th/16th is not a gap
+    stored = {date(2025, 3, 13), date(2025, 3, 14), date(2025, 3, 17)}
+    ranges = find_missing_ranges(stored, date(2025, 3, 13), date(2025, 3, 19))
+    assert ranges == [DateRange(start=date(2025, 3, 18), end=date(2025, 3, 19))]
+
+    assert find_missing_ranges(stored, date(2025, 3, 13), date(2025, 3, 17)) == []
+
+
+def test_interior_gaps_and_merging():
+    days = trading_days(date(2025, 1, 2), date(2025, 3, 31))
+    stored = set(days) - {days[5], days[40], days[42]}
+
+    ranges = find_missing_ranges(stored, days[0], days[-1], merge_within=0)
+    assert [(r.start, r.end) for r in ranges] == [
+        (days[5], days[5]),
+        (days[40], days[40]),
+        (days[42], days[42]),
+    ]
+
+    # A single stored day between two gaps is refetched rather than split
+    ranges = find_missing_ranges(stored, days[0], days[-1], merge_within=1)
+    assert [(r.start, r.end) for r in ranges] == [
+        (days[5], days[5]),
+        (days[40], days[42]),
+    ]
+
+
+def test_always_open_tickers_expect_weekends():
+    stored = {date(2025, 3, 14), date(2025, 3, 17)}
+    ranges = find_missing_ranges(
+        stored, date(2025, 3, 14), date(2025, 3, 17), always_open=True, merge_within=0
+    )
+    assert ranges == [DateRange(start=date(2025, 3, 15), end=date(2025, 3, 16))]
+
+
+def test_coverage_store_remembers_empty_settled_days(tmp_path):
+    store = CoverageStore(str(tmp_path))
+    ranges = [DateRange(start=date(2025, 3, 17), end=date(2025, 3, 19))]
+
+    empty = store.record("t1", ranges, {date(2025, 3, 18)}, today=date(2025, 3, 19))
+
+    # The 19th is still in progress, so it is not recorded as empty
+    assert empty == {date(2025, 3, 17)}
+    assert store.load_empty_days("t1") == {date(2025, 3, 17)}
+    assert store.load_empty_days("t2") == set()
+
+
+def test_empty_days_expire(tmp_path):
+    store = CoverageStore(str(tmp_path), ttl=3600)
+    ranges = [DateRange(start=date(2025, 3, 17), end=date(2025, 3, 18))]
+
+    store.record("t1", ranges, set(), today=date(2025, 3, 19), now=1000.0)
+
+    # A transient empty reply only hides the gap until the entry expires
+    assert store.load_empty_days("t1", now=1000.0 + 3599) == {date(2025, 3, 17), date(2025, 3, 18)}
+    assert store.load_empty_days("t1", now=1000.0 + 3600) == set()
+
+
+def make_processor(tmp_path, stored):
+    processor = TickerProcessor(
+        MagicMock(), data_fetcher=MagicMock(), coverage_store=CoverageStore(str(tmp_path))
+    )
+    processor.data_fetcher.determine_start_date.side_effect = (
+        lambda last, backfill=False, today=None: date(2020, 1, 1)
+    )
+    processor.data_saver = MagicMock()
+    processor.data_saver.get_stored_dates.return_value = stored
+    return processor
+
+
+def test_backfill_fetches_only_missing_ranges(tmp_path):
+    days = trading_days(date(2025, 1, 2), date(2025, 3, 19))
+    stored = set(days) - {days[10], days[11]}
+    processor = make_processor(tmp_path, stored)
+    config = PipelineConfig(backfill=True, start_date=date(2025, 1, 2))
+    ticker = {"id": "t1", "symbol": "AAPL", "quote_type": "EQUITY"}
+
+    with patch("src.services.ticker_processor.market_time", return_value=NOW), \
+         patch("src.services.ticker_processor.last_session_close",
+               return_value=datetime(2025, 3, 19, 16)):
+        ranges = processor.resolve_price_ranges(ticker, config)
+
+    assert ranges == [DateRange(start=days[10], end=days[11])]
+    assert processor.resolve_start_date(ticker, config) == days[10]
+    processor.data_saver.get_stored_dates.assert_called_once()
+
+
+def test_complete_backfill_skips_history(tmp_path):
+    days = trading_days(date(2025, 1, 2), date(2025, 3, 19))
+    processor = make_processor(tmp_path, set(days))
+    config = PipelineConfig(
+        backfill=True,
+        start_date=date(2025, 1, 2),
+        process_info=False,
+        process_calendar=False,
+        process_fund_data=False,
+    )
+    ticker = {"id": "t1", "symbol": "AAPL", "quote_type": "EQUITY"}
+
+    with patch("src.services.ticker_processor.market_time", return_value=NOW), \
+         patch("src.services.ticker_processor.last_session_close",
+               return_value=datetime(2025, 3, 19, 16)):
+        assert processor.process_ticker(ticker, config) == set()
+
+    processor.data_fetcher.fetch_ticker_data.assert_not_called()
+    assert ticker["price_coverage"] == {"ranges": 0, "days": 0, "rows": 0}
+
+
+def test_force_update_fetches_whole_window(tmp_path):
+    processor = make_processor(tmp_path, set())
+    config = PipelineConfig(backfill=True, start_date=date(2025, 1, 2), force_update=True)
+    ticker = {"id": "t1", "symbol": "AAPL"}
+
+    with patch("src.services.ticker_processor.market_time", return_value=NOW):
+        ranges = processor.resolve_price_ranges(ticker, config)
+
+    assert ranges == [DateRange(start=date(2025, 1, 2), end=date(2025, 3, 19))]
+    processor.data_saver.get_stored_dates.assert_not_called()
+
+
+def test_incremental_run_refetches_last_stored_day(tmp_path):
+    processor = TickerProcessor(MagicMock(), coverage_store=CoverageStore(str(tmp_path)))
+    config = PipelineConfig()
+
+    with patch("src.services.ticker_processor.market_time", return_value=NOW):
+        # Friday's row may be an intraday bar whose post-close run failed
+        saturday = datetime(2025, 3, 15, 18, tzinfo=timezone.utc)
+        with patch("src.services.ticker_processor.market_time", return_value=saturday):
+            ticker = {"id": "t1", "symbol": "AAPL", "last_price_date": date(2025, 3, 14)}
+            assert processor.resolve_price_ranges(ticker, config) == [
+                DateRange(start=date(2025, 3, 14), end=date(2025, 3, 15))
+            ]
+
+        ticker = {"id": "t1", "symbol": "AAPL", "last_price_date": date(2025, 3, 17)}
+        assert processor.resolve_price_ranges(ticker, config) == [
+            DateRange(start=date(2025, 3, 17), end=date(2025, 3, 19))
+        ]
+
+        # Today's row may still change, so it is fetched again
+        ticker = {"id": "t1", "symbol": "AAPL", "last_price_date": date(2025, 3, 19)}
+        assert processor.resolve_price_ranges(ticker, config) == [
+            DateRange(start=date(2025, 3, 19), end=date(2025, 3, 19))
+        ]
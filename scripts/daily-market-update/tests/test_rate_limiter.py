@@ -0,0 +1,57 @@
+import threading
+import time
+from src.core.rate_limiter import TokenBucket
+
+
+def test_burst_then_paced():
+    bucket = TokenBucket(rate=50.0, capacity=5.0)
+
+    start = time.monotonic()
+    for _ in range(10):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+
+    # 5 burst tokens, then 5 more at 50/s
+    assert 0.08 <= elapsed < 0.5
+
+
+def test_rate_is_enforced_across_threads():
+    bucket = TokenBucket(rate=100.0, capacity=1.0)
+
+    def worker():
+        for _ in range(10):
+            bucket.acquire()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.38
+
+
+def test_aimd_adapts_rate():
+    bucket = TokenBucket(rate=10.0, capacity=1.0, increase=1.0, cooldown=0)
+
+    bucket.on_throttle()
+    bucket.on_throttle()
+    assert bucket.rate == 2.5
+    assert bucket.throttle_count == 2
+
+    for _ in range(3):
+        bucket.on_success()
+    assert bucket.rate == 5.5
+
+    for _ in range(10):
+        bucket.on_success()
+    assert bucket.rate == 10.0
+
+
+def test_throttle_pauses_bucket():
+    bucket = TokenBucket(rate=1000.0, capacity=10.0, cooldown=0.1)
+
+    bucket.on_throttle()
+    assert bucket.acquire() >= 0.09
@@ -0,0 +1,217 @@
+"""
+Equivalence of the slotted records with the pydantic database models.
+
+Each reference function below is the model-based transform the records
+replaced; the records must produce exactly the same upsert payloads.
+"""
+
+import json
+import math
+
+import pandas as pd
+import pytest
+from src.models.db_models import (
+    DBAssetClass,
+    DBFundHolding,
+    DBHistoricalPrice,
+    DBSectorWeighting,
+)
+from src.models.records import (
+    AssetClassRecord,
+    FundHoldingRecord,
+    SectorWeightingRecord,
+    as_row,
+    row_width,
+)
+from src.models.source_models import (
+    YFAssetAllocation,
+    YFFundData,
+    YFHoldings,
+    YFPriceHistory,
+    YFSectorWeightings,
+)
+from src.transformers.model_transformer import ModelTransformer
+
+UPDATED_AT = "2025-03-18T10:00:00"
+
+
+def reference_prices(source, ticker_id):
+    return [
+        DBHistoricalPrice(
+            ticker_id=ticker_id,
+            date=date_obj.strftime("%Y-%m-%d"),
+            open_price=row.open,
+            high_price=row.high,
+            low_price=row.low,
+            close_price=row.close,
+            volume=row.volume,
+            dividends=row.dividends,
+            stock_splits=row.stock_splits,
+            updated_at=UPDATED_AT,
+        ).model_dump(exclude_none=True)
+        for date_obj, row in source.data.items()
+    ]
+
+
+def reference_fund_rows(source, ticker_id):
+    holdings = [
+        DBFundHolding(
+            ticker_id=ticker_id,
+            holding_symbol=symbol,
+            holding_name=holding.name,
+            weight=holding.holding_percent * 100,
+            updated_at=UPDATED_AT,
+        )
+        for symbol, holding in source.top_holdings.holdings.items()
+    ]
+    sectors = [
+        DBSectorWeighting(
+            ticker_id=ticker_id, sector_name=sector, weight=weight * 100, updated_at=UPDATED_AT
+        )
+        for sector, weight in source.sector_weightings.sectors.items()
+    ]
+    assets = [
+        DBAssetClass(
+            ticker_id=ticker_id, asset_class=asset, weight=weight * 100, updated_at=UPDATED_AT
+        )
+        for asset, weight in source.asset_allocation.assets.items()
+    ]
+    return {
+        name: [m.model_dump(exclude_none=True) for m in models]
+        for name, models in [("holdings", holdings), ("sectors", sectors), ("assets", assets)]
+    }
+
+
+def stamped(rows):
+    return [{**row, "updated_at": UPDATED_AT} for row in rows]
+
+
+def make_frame():
+    index = pd.to_datetime(
+        ["2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12"]
+    ).tz_localize("America/New_York")
+    return pd.DataFrame(
+        {
+            "Open": [10.0, 10.5, math.nan, 11.25],
+            "High": [10.8, 11.0, 11.2, 11.5],
+            "Low": [9.9, 10.1, 10.7, 11.0],
+            "Close": [10.6, 10.9, 11.1, 11.4],
+            "Volume": [1_000.0, 2_500.6, math.nan, 3_000.0],
+            "Dividends": [0.0, 0.0, 0.22, 0.0],
+            "Stock Splits": [0.0, 2.0, 0.0, 0.0],
+        },
+        index=index,
+    )
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        make_frame(),
+        make_frame().drop(columns=["Dividends", "Stock Splits"]),
+        make_frame().tz_localize(None),
+        make_frame().iloc[:0],
+    ],
+    ids=["full", "no-actions", "naive-index", "empty"],
+)
+def test_price_records_match_models(frame):
+    history = YFPriceHistory.from_dataframe(frame)
+
+    records = ModelTransformer.transform_historical_price_records(history, "ticker-1")
+
+    assert stamped(records) == reference_prices(history, "ticker-1")
+
+
+def test_fund_records_match_models():
+    holdings = pd.DataFrame(
+        {"Name": ["Apple Inc", "Microsoft Corp"], "% Assets": [7.1, 6.4]},
+        index=pd.Index(["AAPL", "MSFT"], name="Symbol"),
+    )
+    source = YFFundData(
+        top_holdings=YFHoldings.from_dataframe(holdings),
+        sector_weightings=YFSectorWeightings.from_dict({"technology": 0.31, "energy": 0.04}),
+        asset_allocation=YFAssetAllocation.from_dict({"stockPosition": 0.99, "cashPosition": 0.01}),
+    )
+
+    result = ModelTransformer.transform_fund_holdings(source, "fund-1")
+
+    expected = reference_fund_rows(source, "fund-1")
+    assert isinstance(result["holdings"][0], FundHoldingRecord)
+    assert isinstance(result["sectors"][0], SectorWeightingRecord)
+    assert isinstance(result["assets"][0], AssetClassRecord)
+    for name in ("holdings", "sectors", "assets"):
+        assert stamped(as_row(r) for r in result[name]) == expected[name]
+
+
+@pytest.mark.parametrize(
+    "record_type, model_type, values",
+    [
+        (
+            FundHoldingRecord,
+            DBFundHolding,
+            {"ticker_id": "t", "holding_symbol": "AAPL", "holding_name": "Apple", "weight": 7.0},
+        ),
+        (
+            FundHoldingRecord,
+            DBFundHolding,
+            {
+                "ticker_id": "t",
+                "holding_symbol": "AAPL",
+                "holding_name": "Apple",
+                "weight": 7.0,
+                "created_at": "2025-03-10T00:00:00",
+            },
+        ),
+        (
+            SectorWeightingRecord,
+            DBSectorWeighting,
+            {"id": "row-1", "ticker_id": "t", "sector_name": "technology", "weight": 31.0},
+        ),
+        (
+            AssetClassRecord,
+            DBAssetClass,
+            {"ticker_id": "t", "asset_class": "stockPosition", "weight": 99.0, "date": "2025-03-10"},
+        ),
+    ],
+)
+def test_rows_match_model_dump_including_defaults(record_type, model_type, values):
+    values = {**values, "updated_at": UPDATED_AT}
+
+    assert record_type(**values).to_row() == model_type(**values).model_dump(exclude_none=True)
+
+
+def test_default_timestamps_are_per_record():
+    first = FundHoldingRecord(ticker_id="t", holding_symbol="A", holding_name="A", weight=1.0)
+    model = DBFundHolding(ticker_id="t", holding_symbol="A", holding_name="A", weight=1.0)
+
+    assert first.date == model.date
+    assert set(first.to_row()) == set(model.model_dump(exclude_none=True))
+
+
+def test_records_are_slotted():
+    record = SectorWeightingRecord(ticker_id="t", sector_name="energy", weight=4.0)
+
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.unknown = 1
+
+
+def test_as_row_accepts_records_models_and_dicts():
+    row = {
+        "ticker_id": "t",
+        "sector_name": "energy",
+        "weight": 4.0,
+        "date": "2025-03-10",
+        "updated_at": UPDATED_AT,
+    }
+
+    assert as_row(row) is row
+    assert as_row(SectorWeightingRecord(**row)) == row
+    assert as_row(DBSectorWeighting(**row)) == row
+
+
+def test_row_width_sizes_payload_from_first_row():
+    rows = [{"ticker_id": "t", "close_price": 1.5}, {"ticker_id": "t", "close_price": 2.5}]
+
+    assert row_width(rows) * len(rows) == len(json.dumps(rows))
+    assert row_width([]) == 0
@@ -0,0 +1,71 @@
+from itertools import count
+from src.core.registry import ComponentRegistry
+
+
+def make_registry():
+    ids = count()
+    healthy = {"client": True}
+    registry = ComponentRegistry()
+    registry.register(
+        "client",
+        lambda r: {"id": next(ids)},
+        health_check=lambda client: healthy["client"],
+    )
+    registry.register(
+        "service",
+        lambda r: {"client": r.get("client")},
+        depends_on=["client"],
+    )
+    return registry, healthy
+
+
+def test_components_are_built_once_and_reused():
+    registry, _ = make_registry()
+
+    service = registry.get("service")
+
+    assert registry.get("service") is service
+    assert service["client"] is registry.get("client")
+    assert registry.build_count == {"client": 1, "service": 1}
+
+
+def test_unhealthy_component_is_rebuilt_with_dependents():
+    registry, healthy = make_registry()
+    service = registry.get("service")
+
+    healthy["client"] = False
+    client = registry.get("client")
+    healthy["client"] = True
+
+    assert client["id"] == 1
+    assert registry.get("service") is not service
+    assert registry.get("service")["client"] is client
+
+
+def test_invalidate_all_drops_everything():
+    registry, _ = make_registry()
+    registry.get("service")
+
+    registry.invalidate_all()
+
+    assert registry.built() == []
+
+
+def test_dropped_components_are_disposed_dependents_first():
+    disposed = []
+    registry = ComponentRegistry()
+    registry.register("session", lambda r: "session", dispose=disposed.append)
+    registry.register(
+        "client",
+        lambda r: f"client({r.get('session')})",
+        depends_on=["session"],
+        dispose=disposed.append,
+    )
+    registry.register("plain", lambda r: "plain")
+    registry.get("client")
+    registry.get("plain")
+
+    registry.invalidate_all()
+
+    assert disposed == ["client(session)", "session"]
+    assert registry.built() == []
@@ -0,0 +1,98 @@
+import os
+import time
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+import pandas as pd
+from src.core.rate_limiter import YahooEndpoint
+from src.services.response_cache import ResponseCache
+
+
+def test_round_trip_keyed_by_params(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    params = {"start": "2025-03-13", "auto_adjust": True}
+
+    assert cache.get("AAPL", YahooEndpoint.HISTORY, params) is None
+    cache.put("AAPL", YahooEndpoint.HISTORY, {"rows": 3}, params)
+
+    assert cache.get("AAPL", YahooEndpoint.HISTORY, params) == {"rows": 3}
+    assert cache.get("AAPL", YahooEndpoint.HISTORY, {"start": "2025-03-14"}) is None
+    assert cache.get("MSFT", YahooEndpoint.HISTORY, params) is None
+    assert cache.stats() == {"history": {"hits": 1, "misses": 3}}
+
+
+def test_entries_expire_after_endpoint_ttl(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttls={YahooEndpoint.INFO: 60})
+    cache.put("AAPL", YahooEndpoint.INFO, {"longName": "Apple Inc."})
+    assert cache.get("AAPL", YahooEndpoint.INFO) == {"longName": "Apple Inc."}
+
+    with patch("src.services.response_cache.time.time", return_value=time.time() + 61):
+        assert cache.get("AAPL", YahooEndpoint.INFO) is None
+
+
+def test_frames_and_dates_round_trip(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    index = pd.DatetimeIndex(["2025-03-13", "2025-03-14"], name="Date")
+    history = pd.DataFrame(
+        {"Close": [211.123456789012, 213.0], "Volume": [1000, 1200]},
+        index=index.tz_localize("America/New_York"),
+    )
+    calendar = {
+        "Dividend Date": date(2025, 5, 15),
+        "Earnings Date": [datetime(2025, 5, 1, 20, 30, tzinfo=timezone.utc)],
+        "Earnings High": None,
+    }
+
+    cache.put("AAPL", YahooEndpoint.HISTORY, history)
+    cache.put("AAPL", YahooEndpoint.CALENDAR, calendar)
+
+    pd.testing.assert_frame_equal(cache.get("AAPL", YahooEndpoint.HISTORY), history)
+    assert cache.get("AAPL", YahooEndpoint.CALENDAR) == calendar
+
+
+def test_history_expires_when_the_session_settles(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    # Tuesday 16:10 New York, after the close but before the data settles
+    now = datetime(2025, 3, 18, 20, 10, tzinfo=timezone.utc)
+
+    with patch("src.services.response_cache.next_settle_time") as settle:
+        settle.return_value = now.replace(minute=30)
+        cache.put("AAPL", YahooEndpoint.HISTORY, {"rows": 3})
+
+    with patch("src.services.response_cache.time.time", return_value=now.replace(minute=31).timestamp()):
+        assert cache.get("AAPL", YahooEndpoint.HISTORY) is None
+
+
+def test_cache_survives_new_instance(tmp_path):
+    ResponseCache(str(tmp_path)).put("AAPL", YahooEndpoint.CALENDAR, {"a": 1})
+    assert ResponseCache(str(tmp_path)).get("AAPL", YahooEndpoint.CALENDAR) == {"a": 1}
+
+
+def test_evicts_least_recently_used(tmp_path):
+    payload = "x" * 1000
+    cache = ResponseCache(str(tmp_path), max_bytes=3500)
+
+    for i, symbol in enumerate(["A", "B", "C"]):
+        cache.put(symbol, YahooEndpoint.INFO, payload)
+        path = cache._path(cache.make_key(symbol, YahooEndpoint.INFO, {}))
+        os.utime(path, (1000 + i, 1000 + i))
+
+    # Reading A makes B the least recently used
+    assert cache.get("A", YahooEndpoint.INFO) == payload
+    cache.put("D", YahooEndpoint.INFO, payload)
+
+    assert cache.get("B", YahooEndpoint.INFO) is None
+    assert cache.get("A", YahooEndpoint.INFO) == payload
+    assert cache.get("D", YahooEndpoint.INFO) == payload
+    assert cache.total_bytes <= 3500
+
+
+def test_unreadable_entry_is_a_miss(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.put("AAPL", YahooEndpoint.INFO, {"a": 1})
+    path = cache._path(cache.make_key("AAPL", YahooEndpoint.INFO, {}))
+    with open(path, "wb") as f:
+        f.write(b"not json")
+
+    assert cache.get("AAPL", YahooEndpoint.INFO) is None
+    assert not os.path.exists(path)
@@ -0,0 +1,149 @@
+import json
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.events.event_processor import PipelineConfig
+from src.models.price_block import PriceBlock
+from src.services.rolling_state import RollingState, RollingStateStore
+from src.services.ticker_processor import TickerProcessor
+from src.transformers.price_analytics import compute_price_analytics
+
+FIELDS = [
+    "as_of",
+    "last_close",
+    "volume",
+    "change_percent",
+    "fifty_day_average",
+    "two_hundred_day_average",
+    "fifty_two_week_low",
+    "fifty_two_week_high",
+    "ytd_return",
+    "return_1m",
+    "return_3m",
+    "return_1y",
+    "volatility",
+]
+
+
+def make_block(start, sessions, seed=0):
+    dates = pd.bdate_range(start, periods=sessions)
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.cumprod(1.0 + rng.normal(0.0005, 0.01, sessions))
+    frame = pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(1_000, 5_000, sessions).astype(float),
+        },
+        index=dates,
+    )
+    return PriceBlock.from_frame(frame)
+
+
+def assert_same_stats(actual, expected):
+    for name in FIELDS:
+        value, reference = getattr(actual, name), getattr(expected, name)
+        if isinstance(reference, float):
+            assert value == pytest.approx(reference, rel=1e-9), name
+        else:
+            assert value == reference, name
+
+
+def test_incremental_runs_match_full_recomputation(tmp_path):
+    block = make_block("2023-03-01", 560, seed=7)
+    block.high[100] = np.nan
+    store = RollingStateStore(str(tmp_path))
+
+    # Daily-style runs: each reads from the day after the saved state, which
+    # includes the previous run's provisional row
+    end = 300
+    while end <= len(block):
+        state = store.load("t") or RollingState()
+        start = 0
+        if state.next_day() is not None:
+            start = int(np.searchsorted(block.dates, np.datetime64(state.next_day())))
+
+        stats = state.advance(block[start:end], "t")
+        store.save("t", state)
+
+        expected = compute_price_analytics({"t": block[:end]})["t"]
+        assert_same_stats(stats, expected)
+        end += 37 if end < 500 else 1
+
+
+def test_provisional_row_is_replaced_by_the_next_run():
+    block = make_block("2024-01-01", 80)
+    state = RollingState()
+
+    first = state.advance(block, "t")
+    revised = block[79:]
+    revised.close[0] = first.last_close + 1.0  # the bar moved after the first run
+
+    stats = state.advance(revised, "t")
+
+    assert stats.last_close == first.last_close + 1.0
+    assert state.last_day == block.dates[78].astype(np.int64)
+
+
+def test_state_window_stays_bounded():
+    state = RollingState()
+
+    state.apply_block(make_block("2015-01-01", 2500))
+
+    assert len(state.closes) <= 262
+    assert len(state.returns) <= 262
+
+
+def test_outdated_or_corrupt_states_are_rebuilt(tmp_path):
+    store = RollingStateStore(str(tmp_path))
+    state = RollingState()
+    state.apply_block(make_block("2024-01-01", 5))
+    store.save("a", state)
+
+    assert store.load("a").closes == state.closes
+    assert store.load("missing") is None
+
+    (tmp_path / "b.json").write_text(json.dumps({"version": 0}))
+    (tmp_path / "c.json").write_text("{")
+    assert store.load("b") is None and store.load("c") is None
+
+
+def make_processor(tmp_path, blocks):
+    processor = TickerProcessor(
+        MagicMock(),
+        data_fetcher=MagicMock(),
+        rolling_states=RollingStateStore(str(tmp_path)),
+    )
+    processor.data_saver = MagicMock()
+    processor.data_saver.get_price_windows.side_effect = lambda ids, since: {
+        ticker_id: blocks[ticker_id] for ticker_id in ids if ticker_id in blocks
+    }
+    processor.data_saver.save_finance_daily.return_value = True
+    return processor
+
+
+def test_daily_runs_read_only_new_rows(tmp_path):
+    block = make_block("2024-01-01", 300)
+    processor = make_processor(tmp_path, {"a": block})
+
+    processor.update_analytics(["a"], PipelineConfig())
+    processor.update_analytics(["a"], PipelineConfig())
+
+    first, second = processor.data_saver.get_price_windows.call_args_list
+    assert first.args[1] <= date.today() - timedelta(days=365)
+    assert second.args[1] == block.date_list()[-1]
+
+
+def test_backfill_rebuilds_state_from_stored_window(tmp_path):
+    processor = make_processor(tmp_path, {"a": make_block("2024-01-01", 300)})
+    processor.update_analytics(["a"], PipelineConfig())
+
+    processor.update_analytics(["a"], PipelineConfig(backfill=True))
+
+    since = processor.data_saver.get_price_windows.call_args.args[1]
+    assert since <= date.today() - timedelta(days=365)
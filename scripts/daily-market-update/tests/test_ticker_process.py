@@ -1,129 +1,101 @@
+from unittest.mock import patch
+
 import pytest
-import pickle
-from unittest.mock import Mock, patch
-from src.services.ticker_processor import TickerProcessor
+from benchmarks.fake_supabase import FakeSupabase
+from benchmarks.fake_yahoo import FakeYahoo
+from benchmarks.fixtures import load_fixture
+from src.core.pipeline import Pipeline
+from src.core.rate_limiter import RateLimiter, YahooEndpoint
+from src.events.event_processor import PipelineConfig
 from src.services.data_fetcher import DataFetcher
-from src.services.data_saver import DataSaver
-from datetime import date
+from src.services.price_coverage import CoverageStore
+from src.services.rolling_state import RollingStateStore
+from src.services.ticker_processor import TickerProcessor
+
 
 @pytest.fixture
-def mock_supabase():
-    return Mock()
+def supabase():
+    return FakeSupabase()
+
 
 @pytest.fixture
-def ticker_processor(mock_supabase):
-    return TickerProcessor(mock_supabase)
-
-def load_yfinance_data(filename):
-    with open(f"tests/{filename}", "rb") as f:
-        cached_data = pickle.load(f)
-    return (
-        cached_data["history"],
-        cached_data["info"],
-        cached_data["calendar"],
-        cached_data.get("funds_data")
+def ticker_processor(supabase, tmp_path):
+    unlimited = {endpoint: {"rate": 1e6, "capacity": 1e6} for endpoint in YahooEndpoint}
+    return TickerProcessor(
+        supabase,
+        data_fetcher=DataFetcher(rate_limiter=RateLimiter(unlimited)),
+        coverage_store=CoverageStore(str(tmp_path / "coverage")),
+        rolling_states=RollingStateStore(str(tmp_path / "rolling-state")),
     )
 
-def test_process_ticker_aapl(ticker_processor):
-    ticker = {"id": "aapl-id", "symbol": "AAPL", "exchange": "NASDAQ", "backfill": False}
-    real_data, real_info, real_calendar, _ = load_yfinance_data("aapl_yfinance_data.pkl")
-
-    mock_ticker = Mock()
-    mock_ticker.history = Mock(return_value=real_data)
-    mock_ticker.info = real_info
-    mock_ticker.calendar = real_calendar
-
-    with patch.object(DataFetcher, "fetch_stock_data", return_value=(real_data, real_info, mock_ticker)), \
-         patch.object(DataSaver, "get_last_update_date", return_value=date(2025, 3, 16)), \
-         patch.object(DataSaver, "save_price_data", return_value=1), \
-         patch.object(DataSaver, "should_update", return_value=True), \
-         patch.object(DataSaver, "update_ticker_info", return_value=True), \
-         patch.object(DataSaver, "save_finance_data", return_value=True), \
-         patch.object(DataSaver, "save_calendar_events", return_value=True):
-
-        updates = ticker_processor.process_ticker(ticker)
-
-        assert "historical_prices" in updates, "Price data should be updated"
-        assert "tickers" in updates, "Ticker info should be updated"
-        assert "yh_finance_daily" in updates, "Finance data should be updated"
-        assert "calendar_events" in updates, "Calendar events should be updated"
-        assert len(updates) == 4, "Expected exactly 4 updates"
-
-        ticker_processor.data_saver.save_price_data.assert_called_once()
-        ticker_processor.data_saver.update_ticker_info.assert_called_once()
-        ticker_processor.data_saver.save_finance_data.assert_called_once()
-        ticker_processor.data_saver.save_calendar_events.assert_called_once_with(
-            "aapl-id", "AAPL", mock_ticker
-        )
 
-def test_process_ticker_spy(ticker_processor):
-    ticker = {"id": "spy-id", "symbol": "SPY", "exchange": "NYSE", "backfill": False}
-    real_data, real_info, real_calendar, real_funds_data = load_yfinance_data("spy_yfinance_data.pkl")
-
-    mock_ticker = Mock()
-    mock_ticker.history = Mock(return_value=real_data)
-    mock_ticker.info = real_info
-    mock_ticker.calendar = real_calendar
-    mock_ticker.funds_data = Mock()
-    if real_funds_data:
-        mock_ticker.funds_data.description = real_funds_data["description"]
-        mock_ticker.funds_data.fund_overview = real_funds_data["fund_overview"]
-        mock_ticker.funds_data.fund_operations = real_funds_data["fund_operations"]
-        mock_ticker.funds_data.asset_classes = real_funds_data["asset_classes"]
-        mock_ticker.funds_data.top_holdings = real_funds_data["top_holdings"]
-        mock_ticker.funds_data.equity_holdings = real_funds_data["equity_holdings"]
-        mock_ticker.funds_data.bond_holdings = real_funds_data["bond_holdings"]
-        mock_ticker.funds_data.bond_ratings = real_funds_data["bond_ratings"]
-        mock_ticker.funds_data.sector_weightings = real_funds_data["sector_weightings"]
-
-    with patch.object(DataFetcher, "fetch_stock_data", return_value=(real_data, real_info, mock_ticker)), \
-         patch.object(DataSaver, "get_last_update_date", return_value=date(2025, 3, 16)), \
-         patch.object(DataSaver, "save_price_data", return_value=1), \
-         patch.object(DataSaver, "should_update", return_value=True), \
-         patch.object(DataSaver, "update_ticker_info", return_value=True), \
-         patch.object(DataSaver, "save_finance_data", return_value=True), \
-         patch.object(DataSaver, "save_calendar_events", return_value=True), \
-         patch.object(DataSaver, "save_fund_top_holdings", return_value=bool(real_funds_data and real_funds_data["top_holdings"] is not None)), \
-         patch.object(DataSaver, "save_fund_sector_weightings", return_value=bool(real_funds_data and real_funds_data["sector_weightings"] is not None)), \
-         patch.object(DataSaver, "save_fund_asset_classes", return_value=bool(real_funds_data and real_funds_data["asset_classes"] is not None)):
-
-        updates = ticker_processor.process_ticker(ticker)
-
-        assert "historical_prices" in updates, "Price data should be updated"
-        assert "tickers" in updates, "Ticker info should be updated"
-        assert "yh_finance_daily" in updates, "Finance data should be updated"
-        assert "calendar_events" in updates, "Calendar events should be updated"
-
-        expected_updates = 4
-        if real_funds_data and real_funds_data["top_holdings"] is not None:
-            assert "fund_top_holdings" in updates, "Fund top holdings should be updated"
-            expected_updates += 1
-        if real_funds_data and real_funds_data["sector_weightings"] is not None:
-            assert "fund_sector_weightings" in updates, "Fund sector weightings should be updated"
-            expected_updates += 1
-        if real_funds_data and real_funds_data["asset_classes"] is not None:
-            assert "fund_asset_classes" in updates, "Fund asset classes should be updated"
-            expected_updates += 1
-
-        assert len(updates) == expected_updates, f"Expected {expected_updates} updates"
-
-        ticker_processor.data_saver.save_price_data.assert_called_once()
-        ticker_processor.data_saver.update_ticker_info.assert_called_once()
-        ticker_processor.data_saver.save_finance_data.assert_called_once()
-        ticker_processor.data_saver.save_calendar_events.assert_called_once_with(
-            "spy-id", "SPY", mock_ticker
+def process(ticker_processor, supabase, ticker):
+    """Process a ticker against the recorded (or synthesized) fixture."""
+    supabase.seed("tickers", [dict(ticker)])
+    fixture = load_fixture(ticker["symbol"])
+    yahoo = FakeYahoo({fixture.symbol: fixture}, templates={fixture.symbol: fixture.symbol})
+
+    with yahoo.patch():
+        updates = ticker_processor.process_ticker(
+            ticker, PipelineConfig(batch_writes=False, use_cache=False)
         )
-        if real_funds_data and real_funds_data["top_holdings"] is not None:
-            ticker_processor.data_saver.save_fund_top_holdings.assert_called_once_with(
-                "spy-id", "SPY", mock_ticker
-            )
-        if real_funds_data and real_funds_data["sector_weightings"] is not None:
-            ticker_processor.data_saver.save_fund_sector_weightings.assert_called_once_with(
-                "spy-id", "SPY", mock_ticker
-            )
-        if real_funds_data and real_funds_data["asset_classes"] is not None:
-            ticker_processor.data_saver.save_fund_asset_classes.assert_called_once_with(
-                "spy-id", "SPY", mock_ticker
-            )
-
-        assert real_info.get("quoteType") == "ETF", "SPY should be an ETF"
\ No newline at end of file
+    return fixture, yahoo, updates
+
+
+def test_process_ticker_aapl(ticker_processor, supabase):
+    ticker = {"id": "aapl-id", "symbol": "AAPL", "exchange": "NASDAQ", "backfill": False,
+              "quote_type": "EQUITY"}
+    fixture, yahoo, updates = process(ticker_processor, supabase, ticker)
+
+    assert {"historical_prices", "tickers", "yh_finance_daily"} <= updates
+    assert ("calendar_events" in updates) == bool(fixture.calendar)
+    assert not any(table.startswith("fund_") for table in updates)
+
+    # Each endpoint is requested once; fund data is never requested for equities
+    assert yahoo.requests == {"history": 1, "info": 1, "calendar": 1}
+
+    prices = supabase.tables["historical_prices"]
+    assert prices and all(row["ticker_id"] == "aapl-id" for row in prices)
+    assert supabase.tables["tickers"][0]["name"] == fixture.info["longName"]
+    assert supabase.tables["yh_finance_daily"][0]["ticker_id"] == "aapl-id"
+
+
+def test_process_ticker_spy(ticker_processor, supabase):
+    ticker = {"id": "spy-id", "symbol": "SPY", "exchange": "NYSE", "backfill": False,
+              "quote_type": "ETF"}
+    fixture, yahoo, updates = process(ticker_processor, supabase, ticker)
+
+    assert fixture.info.get("quoteType") == "ETF", "SPY should be an ETF"
+    assert {"historical_prices", "tickers", "yh_finance_daily"} <= updates
+    assert yahoo.requests["funds_data"] == 1
+
+    funds_data = fixture.funds_data or {}
+    expected_fund_tables = {
+        "fund_top_holdings": funds_data.get("top_holdings") is not None,
+        "fund_sector_weightings": bool(funds_data.get("sector_weightings")),
+        "fund_asset_classes": bool(funds_data.get("asset_classes")),
+    }
+    for table, expected in expected_fund_tables.items():
+        assert (table in updates) == expected, table
+        if expected:
+            assert all(row["ticker_id"] == "spy-id" for row in supabase.tables[table])
+
+
+def test_pipeline_writes_finance_daily_once_with_info_and_analytics(ticker_processor, supabase):
+    ticker = {"id": "aapl-id", "symbol": "AAPL", "exchange": "NASDAQ", "backfill": False,
+              "quote_type": "EQUITY"}
+    supabase.seed("tickers", [dict(ticker)])
+    fixture = load_fixture("AAPL")
+    yahoo = FakeYahoo({fixture.symbol: fixture}, templates={fixture.symbol: fixture.symbol})
+    config = PipelineConfig(batch_writes=False, use_cache=False, analytics=True)
+    pipeline = Pipeline(config, supabase, ticker_processor=ticker_processor)
+
+    with yahoo.patch(), \
+         patch.object(pipeline.ticker_selector, "iter_ticker_pages", return_value=iter([[ticker]])):
+        result = pipeline.execute()
+
+    assert result.successful == ["AAPL"]
+    writes = [w for w in supabase.writes if w[1] == "yh_finance_daily"]
+    assert len(writes) == 1
+    row = supabase.tables["yh_finance_daily"][0]
+    assert row["regular_market_price"] == fixture.info["regularMarketPrice"]
@@ -0,0 +1,114 @@
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+from src.events.event_processor import PipelineConfig
+from src.services.data_saver import DataSaver
+from src.services.ticker_selector import TickerPageError, TickerSelector
+
+TICKERS = [
+    {"id": "a", "symbol": "AAPL", "quote_type": "EQUITY"},
+    {"id": "s", "symbol": "SPY", "quote_type": "ETF"},
+    {"id": "e", "symbol": "EURUSD=X", "quote_type": "CURRENCY"},
+]
+
+SATURDAY = datetime(2025, 3, 15, 14, tzinfo=timezone.utc)
+
+
+def test_skip_fresh_tickers_on_weekend():
+    selector = TickerSelector(Mock())
+    updated = {"historical_prices": {"a", "s"}, "yh_finance_daily": {"a"}}
+
+    with patch.object(
+        DataSaver,
+        "get_updated_ticker_ids",
+        side_effect=lambda ids, table, since: updated[table] & set(ids),
+    ) as get_updated:
+        remaining, skipped = selector.skip_fresh_tickers(
+            TICKERS, PipelineConfig(skip_fresh=True), now=SATURDAY
+        )
+
+    assert [t["symbol"] for t in remaining] == ["SPY", "EURUSD=X"]
+    assert list(skipped) == ["AAPL"]
+    assert "weekend" in skipped["AAPL"]
+    # Watermarks are checked after Friday's close
+    since = get_updated.call_args_list[0].args[2]
+    assert since.date().isoformat() == "2025-03-14"
+
+
+def test_skip_fresh_respects_force_update_and_open_market():
+    selector = TickerSelector(Mock())
+
+    with patch.object(DataSaver, "get_updated_ticker_ids") as get_updated:
+        forced = selector.skip_fresh_tickers(
+            TICKERS, PipelineConfig(force_update=True), now=SATURDAY
+        )
+        open_market = selector.skip_fresh_tickers(
+            TICKERS, PipelineConfig(), now=datetime(2025, 3, 18, 15, tzinfo=timezone.utc)
+        )
+
+    assert forced == (TICKERS, {})
+    assert open_market == (TICKERS, {})
+    get_updated.assert_not_called()
+
+
+def make_paged_supabase(rows):
+    """Supabase mock that serves ``rows`` with keyset pagination on id."""
+    supabase = Mock()
+    calls = []
+
+    def table(name):
+        query = {"gt": None, "limit": None}
+        builder = Mock()
+        builder.select.return_value = builder
+        builder.order.return_value = builder
+        builder.in_.return_value = builder
+
+        def limit(n):
+            query["limit"] = n
+            return builder
+
+        def gt(column, value):
+            query["gt"] = value
+            return builder
+
+        def execute():
+            calls.append(dict(query))
+            page = [r for r in rows if query["gt"] is None or r["id"] > query["gt"]]
+            return Mock(data=[dict(r) for r in page[: query["limit"]]])
+
+        builder.limit.side_effect = limit
+        builder.gt.side_effect = gt
+        builder.execute.side_effect = execute
+        return builder
+
+    supabase.table.side_effect = table
+    return supabase, calls
+
+
+def test_iter_ticker_pages_uses_keyset_pagination():
+    rows = [{"id": f"{i:03d}", "symbol": f"t{i}"} for i in range(5)]
+    supabase, calls = make_paged_supabase(rows)
+
+    pages = list(TickerSelector(supabase).iter_ticker_pages(PipelineConfig(), page_size=2))
+
+    assert [[t["symbol"] for t in page] for page in pages] == [
+        ["T0", "T1"],
+        ["T2", "T3"],
+        ["T4"],
+    ]
+    assert [call["gt"] for call in calls] == [None, "001", "003"]
+
+
+def test_failed_page_raises_with_last_id_read():
+    rows = [{"id": f"{i:03d}", "symbol": f"t{i}"} for i in range(5)]
+    supabase, calls = make_paged_supabase(rows)
+    selector = TickerSelector(supabase)
+    pages = selector.iter_ticker_pages(PipelineConfig(), page_size=2)
+
+    assert [t["symbol"] for t in next(pages)] == ["T0", "T1"]
+    supabase.table.side_effect = Exception("connection reset")
+
+    with pytest.raises(TickerPageError) as error:
+        next(pages)
+    assert error.value.after_id == "001"